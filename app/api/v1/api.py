@@ -5,16 +5,18 @@ API 路由配置
 """
 
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 from app.api.v1.endpoints.upload_record import router as file_router
 from app.api.v1.endpoints.lead import router as lead_router
 from app.api.v1.endpoints.advisor_call_duration_stats import router as advisor_stats_router
 from app.api.v1.endpoints.ai_advisor_stats import router as ai_advisor_stats_router
 from app.api.v1.endpoints.scheduled_tasks import router as scheduled_tasks_router
 
-api_router = APIRouter()
+# 所有子路由默认使用 orjson 序列化响应
+api_router = APIRouter(default_response_class=ORJSONResponse)
 
 api_router.include_router(file_router, tags=["UploadRecord"])
-api_router.include_router(lead_router, tags=["Lead"])
+api_router.include_router(lead_router, prefix="/lead", tags=["Lead"])
 api_router.include_router(advisor_stats_router, tags=["AdvisorCallDurationStats"])
 api_router.include_router(ai_advisor_stats_router, tags=["AiAdvisorStats"])
 api_router.include_router(scheduled_tasks_router, tags=["ScheduledTasks"])
@@ -6,7 +6,9 @@
 
 from typing import List, Optional
 from datetime import date
-from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from functools import lru_cache
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Path
+from pydantic import TypeAdapter
 
 from app.services.aibox_service import Aiboxservice
 from app.schemas.advisor_call_duration_stats import (
@@ -15,14 +17,50 @@ from app.schemas.advisor_call_duration_stats import (
     AdvisorDeviceConfigResponse,
 )
 from app.models.events import EventType
-from app.schemas.base import ResponseData, ResponseBuilder, ResponseCode
+from app.schemas.base import ResponseData, ResponseBuilder
+from app.core.cache import TTLCache
 from app.core.dependencies import get_aibox_service
 from app.core.logger import get_logger
+from app.middleware.timing import timing_span
 
 logger = get_logger(__name__)
 
 router = APIRouter()
 
+# 列表校验器，整批交给 pydantic-core 一次完成
+_STATS_LIST_ADAPTER = TypeAdapter(List[AdvisorCallDurationStatsResponse])
+
+# 预先绑定单条记录校验方法，避免每次请求重复属性查找
+_validate_stats = AdvisorCallDurationStatsResponse.model_validate
+_validate_device_config = AdvisorDeviceConfigResponse.model_validate
+
+# 统计查询结果缓存，写入时整体失效
+_stats_cache = TTLCache(ttl=10, maxsize=1024)
+_stats_by_date_cache = TTLCache(ttl=60, maxsize=64)
+
+
+def _has_duration(stats_data: AdvisorCallDurationStatsUpdateRequestWithDeviceIdAndStatsDate) -> bool:
+    """是否有有效通话时长"""
+    return bool(stats_data.total_duration and stats_data.total_duration > 0)
+
+
+async def _positive_duration_stats(
+    stats_data: AdvisorCallDurationStatsUpdateRequestWithDeviceIdAndStatsDate,
+) -> Optional[AdvisorCallDurationStatsUpdateRequestWithDeviceIdAndStatsDate]:
+    """过滤通话时长小于等于0的上报，无效时返回 None，不进入服务层"""
+    if not _has_duration(stats_data):
+        logger.info("通话时长为0或负数，跳过数据库更新: device_id=%s, total_duration=%s",
+                    stats_data.device_id, stats_data.total_duration)
+        return None
+    return stats_data
+
+
+async def _positive_duration_stats_list(
+    stats_list: List[AdvisorCallDurationStatsUpdateRequestWithDeviceIdAndStatsDate],
+) -> List[AdvisorCallDurationStatsUpdateRequestWithDeviceIdAndStatsDate]:
+    """批量上报中仅保留通话时长大于0的记录"""
+    return [stats for stats in stats_list if _has_duration(stats)]
+
 
 @router.post(
     "/advisor-call-duration-stats",
@@ -30,7 +68,7 @@ router = APIRouter()
     summary="更新或插入顾问通话时长统计",
 )
 async def upsert_advisor_call_duration_stats(
-    stats_data: AdvisorCallDurationStatsUpdateRequestWithDeviceIdAndStatsDate,
+    stats_data: Optional[AdvisorCallDurationStatsUpdateRequestWithDeviceIdAndStatsDate] = Depends(_positive_duration_stats),
     aibox_service: Aiboxservice = Depends(get_aibox_service),
 ):
     """
@@ -39,50 +77,38 @@ async def upsert_advisor_call_duration_stats(
     如果 UNIQUE KEY (advisor_id, stats_date) 存在则更新，否则插入新记录
     如果total_duration小于等于0，直接返回成功，不进行数据库更新
     """
-    try:
-        # 检查total_duration是否小于等于0
-        if not stats_data.total_duration or stats_data.total_duration <= 0:
-            logger.info("通话时长为0或负数，跳过数据库更新: device_id=%s, total_duration=%d", 
-                       stats_data.device_id, stats_data.total_duration)
-            return ResponseBuilder.success(None, "无通话时长，跳过更新")
-        
-        stats = await aibox_service.upsert_advisor_call_duration_stats(stats_data)
-        response_data = AdvisorCallDurationStatsResponse.model_validate(stats)
-        return ResponseBuilder.success(response_data, "更新或插入顾问通话时长统计成功")
+    if stats_data is None:
+        return ResponseBuilder.success(None, "无通话时长，跳过更新")
 
-    except Exception as e:  # pylint: disable=broad-except
-        logger.error("更新或插入顾问通话时长统计失败: %s", e)
-        raise HTTPException(status_code=ResponseCode.INTERNAL_ERROR, detail=f"更新或插入顾问通话时长统计失败: {str(e)}") from e
+    stats = await aibox_service.upsert_advisor_call_duration_stats(stats_data)
+    _stats_cache.clear()
+    _stats_by_date_cache.clear()
+    response_data = _validate_stats(stats)
+    return ResponseBuilder.success(response_data, "更新或插入顾问通话时长统计成功")
 
 
-@router.get(
-    "/advisor-call-duration-stats/{advisor_id}/{stats_date}",
-    response_model=ResponseData[AdvisorCallDurationStatsResponse],
-    summary="获取顾问通话时长统计",
+@router.post(
+    "/advisor-call-duration-stats/batch",
+    response_model=ResponseData[List[AdvisorCallDurationStatsResponse]],
+    summary="批量更新或插入顾问通话时长统计",
 )
-async def get_advisor_call_duration_stats(
-    advisor_id: int = Path(..., description="顾问ID"),
-    stats_date: date = Path(..., description="统计日期"),
+async def batch_upsert_advisor_call_duration_stats(
+    valid_stats: List[AdvisorCallDurationStatsUpdateRequestWithDeviceIdAndStatsDate] = Depends(_positive_duration_stats_list),
     aibox_service: Aiboxservice = Depends(get_aibox_service),
 ):
     """
-    根据顾问ID和统计日期获取通话时长统计
-    """
-    try:
-        stats = await aibox_service.get_advisor_call_duration_stats(
-            advisor_id, stats_date
-        )
-        if not stats:
-            return ResponseBuilder.not_found("未找到指定的顾问通话时长统计记录")
+    批量更新或插入顾问通话时长统计
 
-        response_data = AdvisorCallDurationStatsResponse.model_validate(stats)
-        return ResponseBuilder.success(response_data, "获取顾问通话时长统计成功")
+    单条语句完成多条记录的 UPSERT，total_duration小于等于0的记录直接跳过
+    """
+    if not valid_stats:
+        return ResponseBuilder.success([], "无通话时长，跳过更新")
 
-    except Exception as e:  # pylint: disable=broad-except
-        logger.error("获取顾问通话时长统计失败: %s", e)
-        return ResponseBuilder.error(
-            f"获取顾问通话时长统计失败: {str(e)}", ResponseCode.INTERNAL_ERROR
-        )
+    upserted = await aibox_service.batch_upsert_advisor_call_duration_stats(valid_stats)
+    _stats_cache.clear()
+    _stats_by_date_cache.clear()
+    response_data = _STATS_LIST_ADAPTER.validate_python(upserted, from_attributes=True)
+    return ResponseBuilder.success(response_data, "批量更新或插入顾问通话时长统计成功")
 
 
 @router.get(
@@ -99,21 +125,40 @@ async def get_advisor_call_duration_stats_range(
     """
     根据顾问ID和日期范围获取通话时长统计列表
     """
-    try:
+    with timing_span("db"):
         stats_list = await aibox_service.get_advisor_stats_by_date_range(
             advisor_id, start_date, end_date
         )
-        response_data = [
-            AdvisorCallDurationStatsResponse.model_validate(stats)
-            for stats in stats_list
-        ]
-        return ResponseBuilder.success(response_data, "获取顾问通话时长统计范围成功")
-
-    except Exception as e:  # pylint: disable=broad-except
-        logger.error("获取顾问通话时长统计范围失败: %s", e)
-        return ResponseBuilder.error(
-            f"获取顾问通话时长统计范围失败: {str(e)}", ResponseCode.INTERNAL_ERROR
+    with timing_span("validate"):
+        response_data = _STATS_LIST_ADAPTER.validate_python(stats_list, from_attributes=True)
+    return ResponseBuilder.success(response_data, "获取顾问通话时长统计范围成功")
+
+
+@router.get(
+    "/advisor-call-duration-stats/{advisor_id}/{stats_date}",
+    response_model=ResponseData[AdvisorCallDurationStatsResponse],
+    summary="获取顾问通话时长统计",
+)
+async def get_advisor_call_duration_stats(
+    advisor_id: int = Path(..., description="顾问ID"),
+    stats_date: date = Path(..., description="统计日期"),
+    aibox_service: Aiboxservice = Depends(get_aibox_service),
+):
+    """
+    根据顾问ID和统计日期获取通话时长统计
+    """
+    cache_key = (advisor_id, stats_date)
+    response_data = _stats_cache.get(cache_key)
+    if response_data is None:
+        stats = await aibox_service.get_advisor_call_duration_stats(
+            advisor_id, stats_date
         )
+        if not stats:
+            return ResponseBuilder.not_found("未找到指定的顾问通话时长统计记录")
+
+        response_data = _validate_stats(stats)
+        _stats_cache.set(cache_key, response_data)
+    return ResponseBuilder.success(response_data, "获取顾问通话时长统计成功")
 
 
 @router.get(
@@ -130,82 +175,108 @@ async def get_all_advisor_call_duration_stats_by_date(
     """
     获取指定日期的所有顾问通话时长统计
     """
-    try:
-        stats_list = await aibox_service.get_all_advisor_stats_by_date(stats_date)
-        response_data = [
-            AdvisorCallDurationStatsResponse.model_validate(stats)
-            for stats in stats_list
-        ]
-        return ResponseBuilder.success(
-            response_data, "获取指定日期所有顾问通话时长统计成功"
-        )
+    response_data = _stats_by_date_cache.get(stats_date)
+    if response_data is None:
+        with timing_span("db"):
+            stats_list = await aibox_service.get_all_advisor_stats_by_date(stats_date)
+        with timing_span("validate"):
+            response_data = _STATS_LIST_ADAPTER.validate_python(stats_list, from_attributes=True)
+        _stats_by_date_cache.set(stats_date, response_data)
+    return ResponseBuilder.success(
+        response_data, "获取指定日期所有顾问通话时长统计成功"
+    )
 
-    except Exception as e:  # pylint: disable=broad-except
-        logger.error("获取指定日期所有顾问通话时长统计失败: %s", e)
-        return ResponseBuilder.error(
-            f"获取指定日期所有顾问通话时长统计失败: {str(e)}",
-            ResponseCode.INTERNAL_ERROR,
-        )
+
+@router.get(
+    "/advisor-call-duration-stats/by-dates",
+    response_model=ResponseData[List[AdvisorCallDurationStatsResponse]],
+    summary="批量获取多个日期所有顾问通话时长统计",
+)
+async def get_all_advisor_call_duration_stats_by_dates(
+    dates: List[date] = Query(..., description="统计日期列表，可重复传参"),
+    aibox_service: Aiboxservice = Depends(get_aibox_service),
+):
+    """
+    批量获取多个日期的所有顾问通话时长统计（单次查询）
+    """
+    with timing_span("db"):
+        stats_list = await aibox_service.get_all_advisor_stats_by_dates(dates)
+    with timing_span("validate"):
+        response_data = _STATS_LIST_ADAPTER.validate_python(stats_list, from_attributes=True)
+    return ResponseBuilder.success(
+        response_data, "批量获取多个日期所有顾问通话时长统计成功"
+    )
 
 
 @router.get(
     "/advisor-call-duration-stats/trigger-wechat-report",
     response_model=ResponseData[dict],
+    status_code=202,
     summary="手动触发顾问时长统计微信播报任务",
 )
 async def trigger_advisor_stats_wechat_report(
+    background_tasks: BackgroundTasks,
     aibox_service: Aiboxservice = Depends(get_aibox_service),
 ):
     """
     手动触发顾问时长统计微信播报任务
 
-    不需要任何输入参数，直接调用即可触发微信播报任务
+    不需要任何输入参数，直接调用即可触发微信播报任务；任务在响应返回后异步执行
     """
-    #返回str
-    message = await aibox_service.emit_event(
-            EventType.SEND_ADVISOR_STATS_WECHAT_REPORT_TASK,
-            data=None,
-            wait_for_result=True,
-            max_retries=0,
-        )
-    return ResponseBuilder.success(None, message)
+    background_tasks.add_task(
+        aibox_service.emit_event,
+        EventType.SEND_ADVISOR_STATS_WECHAT_REPORT_TASK,
+        data=None,
+        wait_for_result=False,
+        max_retries=0,
+    )
+    return ResponseBuilder.success({"triggered": True}, "顾问时长统计微信播报任务已提交")
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso_date(value: str) -> date:
+    """解析 YYYY-MM-DD 日期字符串（结果缓存，重复日期不再解析）"""
+    return date.fromisoformat(value)
 
 
 @router.post(
     "/generate-advisor-analysis-report",
     response_model=ResponseData[dict],
+    status_code=202,
     summary="手动触发顾问分析报告生成任务",
 )
 async def trigger_generate_advisor_analysis_report(
+    background_tasks: BackgroundTasks,
     target_date: Optional[str] = None,
     aibox_service: Aiboxservice = Depends(get_aibox_service),
 ):
     """
     手动触发顾问分析报告生成任务
 
+    任务在响应返回后异步执行，不占用请求连接
+
     Args:
         target_date: 目标日期，格式为 YYYY-MM-DD，默认为今天
     """
-    try:
-        # 准备事件数据
-        event_data = {}
-        if target_date:
-            event_data["target_date"] = target_date
-        
-        # 触发事件
-        message = await aibox_service.emit_event(
-            EventType.GENERATE_ADVISOR_ANALYSIS_REPORT_TASK,
-            data=event_data if event_data else None,
-            wait_for_result=True,
-            max_retries=0,
-            timeout=1800.0,  # 30分钟超时
-        )
-        
-        return ResponseBuilder.success({"message": message}, "顾问分析报告生成任务已触发")
-        
-    except Exception as e:
-        logger.error("触发顾问分析报告生成任务失败: %s", e)
-        return ResponseBuilder.error(f"触发任务失败: {str(e)}", ResponseCode.INTERNAL_ERROR)
+    # 准备事件数据
+    event_data = {}
+    if target_date:
+        try:
+            event_data["target_date"] = _parse_iso_date(target_date)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"日期格式错误，应为 YYYY-MM-DD: {target_date}") from e
+
+    # 响应返回后再投递事件
+    background_tasks.add_task(
+        aibox_service.emit_event,
+        EventType.GENERATE_ADVISOR_ANALYSIS_REPORT_TASK,
+        data=event_data if event_data else None,
+        wait_for_result=False,
+        max_retries=0,
+        timeout=1800.0,  # 30分钟超时
+    )
+
+    return ResponseBuilder.success({"triggered": True, "target_date": target_date}, "顾问分析报告生成任务已提交")
 
 
 @router.get(
@@ -225,13 +296,6 @@ async def get_or_create_advisor_device_config(
     2. 如果存在，验证devid是否一致，不一致则同步
     3. 如果不存在，则创建新的advisor记录
     """
-    try:
-        device_config = await aibox_service.get_or_create_advisor_device_config(device_id, devid)
-        response_data = AdvisorDeviceConfigResponse.model_validate(device_config)
-        return ResponseBuilder.success(response_data, "获取或创建顾问设备配置成功")
-
-    except Exception as e:  # pylint: disable=broad-except
-        logger.error("获取或创建顾问设备配置失败: device_id=%s, devid=%s, 错误: %s", device_id, devid, str(e))
-        return ResponseBuilder.error(
-            f"获取或创建顾问设备配置失败: {str(e)}", ResponseCode.INTERNAL_ERROR
-        )
+    device_config = await aibox_service.get_or_create_advisor_device_config(device_id, devid)
+    response_data = _validate_device_config(device_config)
+    return ResponseBuilder.success(response_data, "获取或创建顾问设备配置成功")
@@ -3,12 +3,14 @@ AI顾问统计 API 端点
 
 提供AI顾问统计相关的 REST API 接口
 """
+import asyncio
 from typing import Dict, Any
 from datetime import date
 from fastapi import APIRouter, Depends, Query
 from app.services.ai_tele_status_service import AiTeleStatusService
 from app.models.events import EventType
-from app.schemas.base import ResponseData, ResponseBuilder, ResponseCode
+from app.schemas.base import ResponseData, ResponseBuilder
+from app.core.cache import TTLCache
 from app.core.dependencies import get_ai_tele_status_service
 from app.core.logger import get_logger
 
@@ -16,6 +18,28 @@ logger = get_logger(__name__)
 
 router = APIRouter()
 
+# 当日统计预计算间隔（秒）
+TODAY_STATS_REFRESH_INTERVAL = 60
+
+# 当日统计缓存时间（秒）：略长于刷新间隔，避免两次刷新之间出现缓存空窗
+TODAY_STATS_CACHE_TTL = TODAY_STATS_REFRESH_INTERVAL * 2
+
+# AI顾问合并统计缓存（看板轮询），当日数据由后台任务定时预热
+_merged_stats_cache = TTLCache(ttl=60, maxsize=64)
+
+
+async def refresh_today_merged_stats() -> None:
+    """后台任务：定时预计算当日AI顾问合并统计并写入缓存"""
+    while True:
+        try:
+            today = date.today()
+            ai_tele_status_service = await get_ai_tele_status_service()
+            merged_stats = await ai_tele_status_service.get_merged_ai_advisor_stats_by_date(today)
+            _merged_stats_cache.set(today, merged_stats, ttl=TODAY_STATS_CACHE_TTL)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error("预计算当日AI顾问合并统计失败: %s", e)
+        await asyncio.sleep(TODAY_STATS_REFRESH_INTERVAL)
+
 
 @router.get(
     "/ai-advisor-merged-stats",
@@ -24,16 +48,16 @@ router = APIRouter()
     description="获取指定日期的所有AI顾问（group_id=2）合并统计数据"
 )
 async def get_ai_advisor_merged_stats(
-    stats_date: date = Query(default=date.today(), description="统计日期"),
-    ai_tele_status_service: AiTeleStatusService = Depends(get_ai_tele_status_service)
+    stats_date: date = Query(default_factory=date.today, description="统计日期（默认今天）"),
+    ai_tele_status_service: AiTeleStatusService = Depends(get_ai_tele_status_service),
 ):
     """获取AI顾问合并统计数据"""
-    try:
+    merged_stats = _merged_stats_cache.get(stats_date)
+    if merged_stats is None:
         merged_stats = await ai_tele_status_service.get_merged_ai_advisor_stats_by_date(stats_date)
-        return ResponseBuilder.success(merged_stats, "获取AI顾问合并统计数据成功")
-    except Exception as e:
-        logger.error("获取AI顾问合并统计数据失败: %s", e)
-        return ResponseBuilder.error(f"获取AI顾问合并统计数据失败: {str(e)}", ResponseCode.INTERNAL_ERROR)
+        ttl = TODAY_STATS_CACHE_TTL if stats_date == date.today() else None
+        _merged_stats_cache.set(stats_date, merged_stats, ttl=ttl)
+    return ResponseBuilder.success(merged_stats, "获取AI顾问合并统计数据成功")
 
 
 @router.post(
@@ -43,16 +67,12 @@ async def get_ai_advisor_merged_stats(
     description="发送AI顾问统计数据的微信播报"
 )
 async def send_ai_advisor_wechat_report(
-    ai_tele_status_service: AiTeleStatusService = Depends(get_ai_tele_status_service)
+    ai_tele_status_service: AiTeleStatusService = Depends(get_ai_tele_status_service),
 ):
     """发送AI顾问统计微信播报"""
-    try:
-        # 通过事件发送AI顾问统计微信播报
-        await ai_tele_status_service.emit_event(
-            EventType.SEND_AI_ADVISOR_STATS_WECHAT_REPORT_TASK,
-            wait_for_result=False
-        )
-        return ResponseBuilder.success("AI顾问统计微信播报事件已发送", "发送成功")
-    except Exception as e:
-        logger.error("发送AI顾问统计微信播报失败: %s", e)
-        return ResponseBuilder.error(f"发送AI顾问统计微信播报失败: {str(e)}", ResponseCode.INTERNAL_ERROR)
+    # 通过事件发送AI顾问统计微信播报
+    await ai_tele_status_service.emit_event(
+        EventType.SEND_AI_ADVISOR_STATS_WECHAT_REPORT_TASK,
+        wait_for_result=False
+    )
+    return ResponseBuilder.success("AI顾问统计微信播报事件已发送", "发送成功")
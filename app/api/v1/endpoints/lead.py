@@ -4,10 +4,15 @@
 提供线索相关的 REST API 接口
 """
 
-from typing import List
+from typing import List, NamedTuple, Optional
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from fastapi.responses import ORJSONResponse, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel, TypeAdapter
 
 from app.services.lead_service import LeadService
+from app.services.redis_service import RedisService
 from app.schemas.lead import (
     LeadCreate,
     LeadUpdate,
@@ -16,19 +21,69 @@ from app.schemas.lead import (
     LeadQueryParams,
     StatusMappingResponse,
 )
-from app.core.dependencies import get_lead_service
+from app.core.cache import TTLCache
+from app.core.dependencies import get_db_session, get_lead_service, get_redis_service
 from app.core.logger import get_logger
-from app.schemas.base import ResponseCode, ResponseBuilder, ResponseData
+from app.middleware.timing import timing_span
+from app.schemas.base import ResponseBuilder, ResponseData
 
 logger = get_logger(__name__)
 
 router = APIRouter()
 
+# 列表校验器，整批交给 pydantic-core 一次完成
+_LEAD_LIST_ADAPTER = TypeAdapter(List[LeadResponse])
 
-@router.post("/lead/search", response_model=ResponseData[LeadListResponse], summary="搜索线索列表")
+
+class LeadRef(NamedTuple):
+    """写操作前记录的线索归属，用于失效对应的列表缓存"""
+
+    advisor_id: Optional[int]
+    category_id: Optional[int]
+
+
+# 线索列表查询结果在 Redis 中的缓存时间（秒），看板轮询场景下允许短暂延迟
+LEAD_LIST_CACHE_TTL = 10
+
+
+async def _invalidate_lead_list_cache(redis_service: RedisService, *leads) -> None:
+    """删除受影响顾问、分类的线索列表缓存（键中带 limit，按前缀通配删除）"""
+    for advisor_id, category_id in {(lead.advisor_id, lead.category_id) for lead in leads}:
+        if advisor_id is not None:
+            await redis_service.delete_cache_pattern(f"leads:by_advisor:{advisor_id}:*")
+        if category_id is not None:
+            await redis_service.delete_cache_pattern(f"leads:by_category:{category_id}:*")
+
+
+def _dump_lead_list(leads) -> bytes:
+    """校验线索列表并序列化为 JSON，跳过 response_model 的二次校验"""
+    items = _LEAD_LIST_ADAPTER.validate_python(leads, from_attributes=True)
+    return orjson.dumps(_LEAD_LIST_ADAPTER.dump_python(items, mode="json"))
+
+
+def _model_response(payload: BaseModel) -> ORJSONResponse:
+    """由 pydantic-core 序列化模型后交给 orjson 输出，跳过 response_model 校验与 jsonable_encoder"""
+    return ORJSONResponse(payload.model_dump(mode="json"))
+
+
+# LeadResponse 字段与 Lead 表列一一对应，导入时预先计算字段列表
+_LEAD_RESPONSE_FIELDS = tuple(LeadResponse.model_fields)
+
+
+def _lead_to_response(lead) -> LeadResponse:
+    """将数据库返回的 Lead 对象直接构造为响应模型（可信数据，跳过校验）"""
+    return LeadResponse.model_construct(**{field: getattr(lead, field) for field in _LEAD_RESPONSE_FIELDS})
+
+
+# 状态映射配置几乎不变，缓存一小时
+_status_mapping_cache = TTLCache(ttl=3600, maxsize=1)
+
+
+@router.post("/search", response_model=ResponseData[LeadListResponse], summary="搜索线索列表")
 async def search_leads(
     query_params: LeadQueryParams,
     lead_service: LeadService = Depends(get_lead_service),
+    db_session: AsyncSession = Depends(get_db_session),
 ):
     """
     搜索线索列表
@@ -42,20 +97,18 @@ async def search_leads(
     - 时间范围查询：创建时间、更新时间
     - 关键词搜索：客户姓名、电话、线索编号、微信昵称、微信号码
     - 动态排序：支持按任意字段排序
+    - 游标分页：传入上一页的 next_cursor 按创建时间继续翻页，可配合 with_total=false 跳过总数统计
     """
     try:
-        result = await lead_service.get_leads_with_pagination(query_params)
-        return ResponseBuilder.success(result)
-
-    except Exception as e:
-        logger.error("搜索线索列表失败: %s", e)
-        raise HTTPException(status_code=ResponseCode.INTERNAL_ERROR, detail=f"搜索线索列表失败: {str(e)}") from e
+        with timing_span("db"):
+            result = await lead_service.get_leads_with_pagination(query_params, db_session)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return _model_response(ResponseBuilder.success(result))
 
 
-@router.get("/lead/status-mapping", summary="获取状态映射配置", response_model=ResponseData[List[StatusMappingResponse]])
-async def get_status_mapping(
-    lead_service: LeadService = Depends(get_lead_service)
-):
+@router.get("/status-mapping", summary="获取状态映射配置", response_model=ResponseData[List[StatusMappingResponse]])
+async def get_status_mapping():
     """
     获取所有状态映射配置
     
@@ -67,146 +120,151 @@ async def get_status_mapping(
     - 日程状态
     - 合同状态
     """
-    try:
+    # 无请求参数，直接取容器中的单例服务，跳过依赖解析
+    lead_service = await get_lead_service()
+    result = _status_mapping_cache.get("status_mapping")
+    if result is None:
         result = await lead_service.get_status_mapping()
-        return ResponseBuilder.success(result)
-    except Exception as e:
-        logger.error("获取状态映射失败: %s", e)
-        raise HTTPException(status_code=500, detail=f"获取状态映射失败: {str(e)}") from e
+        _status_mapping_cache.set("status_mapping", result)
+    return ResponseBuilder.success(result)
 
 
-@router.get("/lead/{lead_id}", response_model= ResponseData[LeadResponse], summary="根据ID获取线索")
-async def get_lead_by_id(lead_id: int = Path(..., description="线索ID"), lead_service: LeadService = Depends(get_lead_service)):
+@router.get("/{lead_id}", response_model= ResponseData[LeadResponse], summary="根据ID获取线索")
+async def get_lead_by_id(
+    lead_id: int = Path(..., description="线索ID"),
+    lead_service: LeadService = Depends(get_lead_service),
+    db_session: AsyncSession = Depends(get_db_session),
+):
     """
     根据ID获取线索详情
     """
-    try:
-        lead = await lead_service.get_lead_by_id(lead_id)
-        if not lead:
-            raise HTTPException(status_code=404, detail="线索不存在")
-
-        return ResponseBuilder.success(LeadResponse.model_validate(lead))
+    lead = await lead_service.get_lead_by_id(lead_id, db_session)
+    if not lead:
+        raise HTTPException(status_code=404, detail="线索不存在")
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("获取线索详情失败: %s", e)
-        raise HTTPException(status_code=500, detail=f"获取线索详情失败: {str(e)}") from e
+    return _model_response(ResponseBuilder.success(_lead_to_response(lead)))
 
 
-@router.get("/lead/lead-no/{lead_no}", response_model=LeadResponse, summary="根据线索编号获取线索",)
+@router.get("/lead-no/{lead_no}", response_model=LeadResponse, summary="根据线索编号获取线索",)
 async def get_lead_by_lead_no(lead_no: str = Path(..., description="线索编号"), lead_service: LeadService = Depends(get_lead_service)):
     """
     根据线索编号获取线索详情
     """
-    try:
-        lead = await lead_service.get_lead_by_lead_no(lead_no)
-        if not lead:
-            raise HTTPException(status_code=404, detail="线索不存在")
+    lead = await lead_service.get_lead_by_lead_no(lead_no)
+    if not lead:
+        raise HTTPException(status_code=404, detail="线索不存在")
 
-        return LeadResponse.model_validate(lead)
+    return _model_response(_lead_to_response(lead))
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("根据线索编号获取线索失败: %s", e)
-        raise HTTPException(
-            status_code=500, detail=f"根据线索编号获取线索失败: {str(e)}"
-        ) from e
 
-
-@router.post("/lead", response_model=LeadResponse, summary="创建线索")
+@router.post("", response_model=LeadResponse, summary="创建线索")
 async def create_lead(
-    lead_data: LeadCreate, lead_service: LeadService = Depends(get_lead_service)
+    lead_data: LeadCreate,
+    lead_service: LeadService = Depends(get_lead_service),
+    db_session: AsyncSession = Depends(get_db_session),
+    redis_service: RedisService = Depends(get_redis_service),
 ):
     """
     创建新线索
     """
     try:
-        lead = await lead_service.create_lead(lead_data)
-        return LeadResponse.model_validate(lead)
+        lead = await lead_service.create_lead(lead_data, db_session)
+        await _invalidate_lead_list_cache(redis_service, lead)
+        return _model_response(_lead_to_response(lead))
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
-    except Exception as e:
-        logger.error("创建线索失败: %s", e)
-        raise HTTPException(status_code=500, detail=f"创建线索失败: {str(e)}") from e
 
 
-@router.put("/lead/{lead_id}", response_model=LeadResponse, summary="更新线索")
+@router.put("/{lead_id}", response_model=LeadResponse, summary="更新线索")
 async def update_lead(
     lead_data: LeadUpdate,
     lead_id: int = Path(..., description="线索ID"),
     lead_service: LeadService = Depends(get_lead_service),
+    db_session: AsyncSession = Depends(get_db_session),
+    redis_service: RedisService = Depends(get_redis_service),
 ):
     """
     更新线索信息
     """
     try:
-        lead = await lead_service.update_lead(lead_id, lead_data)
+        # 先记下修改前的顾问与分类，二者变更时新旧列表缓存都要删除
+        existing = await lead_service.get_lead_by_id(lead_id, db_session)
+        if not existing:
+            raise HTTPException(status_code=404, detail="线索不存在")
+        before = LeadRef(existing.advisor_id, existing.category_id)
+
+        lead = await lead_service.update_lead(lead_id, lead_data, db_session)
         if not lead:
             raise HTTPException(status_code=404, detail="线索不存在")
 
-        return LeadResponse.model_validate(lead)
+        await _invalidate_lead_list_cache(redis_service, before, lead)
+
+        return _model_response(_lead_to_response(lead))
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("更新线索失败: %s", e)
-        raise HTTPException(status_code=500, detail=f"更新线索失败: {str(e)}") from e
 
 
-@router.delete("lead/{lead_id}", summary="删除线索")
+@router.delete("/{lead_id}", summary="删除线索")
 async def delete_lead(
     lead_id: int = Path(..., description="线索ID"),
     lead_service: LeadService = Depends(get_lead_service),
+    db_session: AsyncSession = Depends(get_db_session),
+    redis_service: RedisService = Depends(get_redis_service),
 ):
     """
     删除线索
     """
-    try:
-        success = await lead_service.delete_lead(lead_id)
-        if not success:
-            raise HTTPException(status_code=404, detail="线索不存在")
+    lead = await lead_service.get_lead_by_id(lead_id, db_session)
+    if not lead:
+        raise HTTPException(status_code=404, detail="线索不存在")
+    before = LeadRef(lead.advisor_id, lead.category_id)
+
+    success = await lead_service.delete_lead(lead_id, db_session)
+    if not success:
+        raise HTTPException(status_code=404, detail="线索不存在")
 
-        return {"message": "线索删除成功"}
+    await _invalidate_lead_list_cache(redis_service, before)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("删除线索失败: %s", e)
-        raise HTTPException(status_code=500, detail=f"删除线索失败: {str(e)}") from e
+    return {"message": "线索删除成功"}
 
 
-@router.get("/lead/advisor/{advisor_id}", response_model=List[LeadResponse], summary="根据顾问ID获取线索",)
-async def get_leads_by_advisor(advisor_id: int = Path(..., description="顾问ID"), limit: int = Query(10, ge=1, le=100, description="返回数量限制"), lead_service: LeadService = Depends(get_lead_service)):
+@router.get("/advisor/{advisor_id}", response_model=List[LeadResponse], summary="根据顾问ID获取线索",)
+async def get_leads_by_advisor(
+    advisor_id: int = Path(..., description="顾问ID"),
+    limit: int = Query(10, ge=1, le=100, description="返回数量限制"),
+    lead_service: LeadService = Depends(get_lead_service),
+    db_session: AsyncSession = Depends(get_db_session),
+    redis_service: RedisService = Depends(get_redis_service),
+):
     """
     根据顾问ID获取线索列表
     """
-    try:
-        leads = await lead_service.get_leads_by_advisor(advisor_id, limit)
-        return [LeadResponse.model_validate(lead) for lead in leads]
+    cache_key = f"leads:by_advisor:{advisor_id}:{limit}"
+    body = await redis_service.get_cache(cache_key)
+    if body is None:
+        leads = await lead_service.get_leads_by_advisor(advisor_id, limit, db_session)
+        body = _dump_lead_list(leads)
+        await redis_service.set_cache(cache_key, body, LEAD_LIST_CACHE_TTL)
+    return Response(content=body, media_type="application/json")
 
-    except Exception as e:
-        logger.error("根据顾问ID获取线索失败: %s", e)
-        raise HTTPException(status_code=500, detail=f"根据顾问ID获取线索失败: {str(e)}") from e
 
-
-@router.get("/lead/category/{category_id}", response_model=List[LeadResponse], summary="根据分类ID获取线索",)
+@router.get("/category/{category_id}", response_model=List[LeadResponse], summary="根据分类ID获取线索",)
 async def get_leads_by_category(
     category_id: int = Path(..., description="分类ID"),
     limit: int = Query(10, ge=1, le=100, description="返回数量限制"),
     lead_service: LeadService = Depends(get_lead_service),
+    db_session: AsyncSession = Depends(get_db_session),
+    redis_service: RedisService = Depends(get_redis_service),
 ):
     """
     根据分类ID获取线索列表
     """
-    try:
-        leads = await lead_service.get_leads_by_category(category_id, limit)
-        return [LeadResponse.model_validate(lead) for lead in leads]
-
-    except Exception as e:
-        logger.error("根据分类ID获取线索失败: %s", e)
-        raise HTTPException(status_code=500, detail=f"根据分类ID获取线索失败: {str(e)}") from e
+    cache_key = f"leads:by_category:{category_id}:{limit}"
+    body = await redis_service.get_cache(cache_key)
+    if body is None:
+        leads = await lead_service.get_leads_by_category(category_id, limit, db_session)
+        body = _dump_lead_list(leads)
+        await redis_service.set_cache(cache_key, body, LEAD_LIST_CACHE_TTL)
+    return Response(content=body, media_type="application/json")
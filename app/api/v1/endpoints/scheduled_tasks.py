@@ -52,16 +52,19 @@ async def create_task_execution_log(
     """
     创建任务执行日志记录
 
+    日志与同一时间窗口内的其他日志合并批量写入，批次提交后返回；
+    多行 INSERT 不回传自增ID，响应中返回写入的日志数据
+
     Args:
         log_data: 任务执行日志数据
 
     Returns:
-        TaskExecutionLogResponse: 创建的执行日志
+        TaskExecutionLogCreate: 写入的执行日志
     """
     try:
-        log_response = await scheduled_tasks_service.create_task_execution_log(log_data)
+        await scheduled_tasks_service.create_task_execution_log(log_data)
 
-        return ResponseBuilder.success(data=log_response, message="创建任务执行日志成功")
+        return ResponseBuilder.success(data=log_data, message="创建任务执行日志成功")
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
     except Exception as e:
@@ -4,18 +4,20 @@
 提供文件上传相关的 REST API 接口
 """
 
-from typing import Annotated
-from fastapi import APIRouter, Depends, Form, File, UploadFile, Query
-from app.schemas.file_record import CallRecord, CallRecordsRequest
-from app.core.dependencies import get_file_service
+import asyncio
+import hashlib
+from typing import Annotated, BinaryIO
+from pydantic import ValidationError
+from fastapi import APIRouter, BackgroundTasks, Depends, Form, File, UploadFile, Query
+from fastapi.exceptions import RequestValidationError
+from app.schemas.file_record import CallRecord, CallRecordsRequest, FileUploadRequest, CallSystemResponse
 from app.schemas.base import ResponseData, ResponseBuilder, ResponseCode
-from app.schemas.file_record import FileUploadRequest, CallSystemResponse
 from app.services.upload_record_service import FileService
 from app.services.cloud_service import CloudService
+from app.services.call_records_service import CallRecordsService
 from app.models.events import EventType
+from app.core.dependencies import get_call_records_service, get_cloud_service, get_file_service
 from app.core.logger import get_logger
-from app.services.call_records_service import CallRecordsService
-from app.core.dependencies import get_call_records_service
 
 
 # 创建路由器
@@ -24,6 +26,28 @@ router = APIRouter()
 # 获取日志记录器
 logger = get_logger(__name__)
 
+# 计算文件哈希时每次读取的字节数
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _parse_call_record(record: str) -> CallRecord:
+    """校验通话记录 JSON，格式错误时按请求校验错误返回"""
+    try:
+        return CallRecord.model_validate_json(record)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", "record", *error["loc"])} for error in e.errors(include_url=False)]
+        ) from e
+
+
+def _file_sha256(fileobj: BinaryIO) -> str:
+    """流式计算文件 SHA-256，完成后将读取位置重置到文件开头"""
+    hasher = hashlib.sha256()
+    while chunk := fileobj.read(HASH_CHUNK_SIZE):
+        hasher.update(chunk)
+    fileobj.seek(0)
+    return hasher.hexdigest()
+
 
 @router.post("/upload", response_model=ResponseData[dict])
 async def upload_audio(
@@ -38,64 +62,67 @@ async def upload_audio(
         result = await file_service.emit_event(EventType.FILE_UPLOAD_RECORD, data=data, wait_for_result=True)
         return ResponseBuilder.success(result, "文件上传成功")
     except Exception as e:  # pylint: disable=broad-except
+        logger.error("文件上传失败: %s", e)
         return ResponseBuilder.error(f"文件上传失败: {str(e)}", ResponseCode.INTERNAL_ERROR)
 
 @router.post("/upload-af-crm", response_model=CallSystemResponse, response_model_exclude_none=True)
 async def upload_af_crm(
+    background_tasks: BackgroundTasks,
     cmd: str = Query(default="UpLoadRecord"),
     record: str = Form(default=""),
     fileName: str = Form(default=""), # pylint: disable=invalid-name
     HasFile: int = Form(default=0), # pylint: disable=invalid-name
     file: UploadFile = File(default=None),
     call_records_service: CallRecordsService = Depends(get_call_records_service),
+    cloud_service: CloudService = Depends(get_cloud_service),
 ):
     """
     CallSystem上传录音接口
     """
     logger.info("接收到参数: cmd=%s, fileName=%s, HasFile=%s", cmd, fileName, HasFile)
     logger.info("record数据长度: %d", len(record))
-    recoard : CallRecord = CallRecord.model_validate_json(record)
-    # 创建上传请求对象（用于验证数据完整性）
+    # 上传文件前完整校验记录，校验失败不上传也不推进 NextUploadId
+    call_record = _parse_call_record(record)
     upload_request = CallRecordsRequest(
-        record=recoard,
+        record=call_record,
         fileName=fileName,
         HasFile=HasFile,
         file=file
     )
+    record_id = call_record.Id
+    next_upload_id = record_id + 1
 
     # 保存文件到本地和云存储
     if file and file.filename:
         try:
-            # 读取文件内容
-            content = await file.read()
-            logger.info("📁 文件大小: %d 字节", len(content))
-
-            # # 1. 保存到本地uploads文件夹
-            # upload_dir = "uploads"
-            # os.makedirs(upload_dir, exist_ok=True)
-            # local_path = os.path.join(upload_dir, file.filename)
-            # with open(local_path, "wb") as f:
-            #     f.write(content)
-            # logger.info("✅ 本地文件保存成功: %s", local_path)
-
-            # 2. 上传到云存储
+            # 不整体读入内存，直接将上传的临时文件交给云存储分块上传
+            logger.info("📁 文件大小: %s 字节", file.size)
+            file_sha256 = await asyncio.to_thread(_file_sha256, file.file)
+
+            # 上传到云存储（COS 为录音文件的唯一存储，不再落地本地磁盘）
             try:
-                # 创建云存储服务实例并上传到COS
-                cloud_service_instance = CloudService()
-                upload_result = await cloud_service_instance.upload_file(
-                    file_content=content,
+                # 使用容器中共享的云存储服务上传到COS
+                upload_result = await cloud_service.upload_file(
+                    file_content=file.file,
                     filename=file.filename,
-                    path=f"call-records/{recoard.Id}",
-                    content_type='audio/mpeg'  # MP3文件类型
+                    path=f"call-records/{record_id}",
+                    content_type='audio/mpeg',  # MP3文件类型
+                    precomputed_sha256=file_sha256,
                 )
 
                 if upload_result.success:
                     logger.info("✅ 云存储上传成功: %s", upload_result.url)
-                    await call_records_service.emit_event(EventType.CALL_RECORDS_SAVE_AUTO_UPLOAD, data={ "upload_request": upload_request, "upload_url": upload_result.url })
+                    # 记录入库在响应返回后异步投递，不阻塞设备上传
+                    background_tasks.add_task(
+                        call_records_service.emit_event,
+                        EventType.CALL_RECORDS_SAVE_AUTO_UPLOAD,
+                        data={"upload_request": upload_request, "upload_url": upload_result.url},
+                        wait_for_result=False,
+                    )
                     return CallSystemResponse(
                         Code=0,
                         errMsg="文件上传成功",
-                        NextUploadId=recoard.Id + 1
+                        NextUploadId=next_upload_id
                     )
                 else:
                     logger.error("❌ 云存储上传失败: %s", upload_result.error)
@@ -111,7 +138,7 @@ async def upload_af_crm(
                 return CallSystemResponse(
                     Code=0,
                     errMsg="本地保存成功，云存储失败",
-                    NextUploadId=recoard.Id + 1
+                    NextUploadId=next_upload_id
                 )
 
         except Exception as e: # pylint: disable=broad-except
@@ -123,7 +150,12 @@ async def upload_af_crm(
             )
     else:
         logger.warning("✅ 没有文件需要保存")
-        await call_records_service.emit_event(EventType.CALL_RECORDS_SAVE_AUTO_UPLOAD, data={ "upload_request": upload_request, "upload_url": None })
+        background_tasks.add_task(
+            call_records_service.emit_event,
+            EventType.CALL_RECORDS_SAVE_AUTO_UPLOAD,
+            data={"upload_request": upload_request, "upload_url": None},
+            wait_for_result=False,
+        )
         return CallSystemResponse(
             Code=0,
             errMsg="没有文件需要保存",
@@ -25,6 +25,18 @@ class Settings(BaseSettings):
     ssh_remote_host: str = Field(default="localhost", description="Remote database host")
     ssh_remote_port: int = Field(default=3306, description="Remote database port")
     ssh_local_port: int = Field(default=3307, description="Local tunnel port")
+    ssh_encryption_algs: List[str] = Field(
+        default_factory=list,
+        description="Allowed SSH ciphers in preference order (replaces asyncssh defaults; empty list keeps them)",
+    )
+    ssh_mac_algs: List[str] = Field(
+        default_factory=list,
+        description="Allowed SSH MAC algorithms in preference order (replaces asyncssh defaults; empty list keeps them)",
+    )
+    ssh_compression_algs: List[str] = Field(
+        default_factory=lambda: ["none"],
+        description="SSH compression algorithms (empty list keeps asyncssh defaults)",
+    )
 
     # Database
     db_username: str | None = Field(default=None, description="Database username")
@@ -32,6 +44,12 @@ class Settings(BaseSettings):
     db_host: str | None = Field(default=None, description="Database host")
     db_port: str | None = Field(default=None, description="Database port")
     db_name: str | None = Field(default=None, description="Database name")
+    db_external_pool: bool = Field(default=False, description="Disable SQLAlchemy pooling when an external pooler (e.g. ProxySQL) fronts MySQL")
+    db_pool_size: int = Field(default=20, description="Database connection pool size")
+    db_max_overflow: int = Field(default=30, description="Extra connections allowed beyond the pool size")
+    db_pool_timeout: int = Field(default=30, description="Seconds to wait for a pooled connection")
+    db_pool_recycle: int = Field(default=1800, description="Recycle pooled connections after this many seconds")
+    db_pool_pre_ping: bool = Field(default=True, description="Ping pooled connections before use")
 
     # OpenAI Configuration
     openai_url: str | None = Field(default=None, description="OpenAI URL")
@@ -2,50 +2,140 @@
 # app/core/dependencies.py
 """
 服务容器 - 支持事件总线和生命周期管理
+
+服务模块在 _initialize_services 中延迟导入，类型注解仅在类型检查时导入
 """
+from __future__ import annotations
+
+from collections import namedtuple
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any, AsyncGenerator, Mapping, Tuple
 import asyncio
-from fastapi import HTTPException, status
-from app.core.event_bus import ProductionEventBus, create_event_bus
+import time
+from types import MappingProxyType
 from app.core.config import settings
 from app.core.logger import get_logger
-from app.services.lead_service import LeadService
-from app.services.upload_record_service import FileService
-from app.services.aibox_service import Aiboxservice
-from app.services.scheduled_tasks_service import ScheduledTasksService
-from app.services.ai_tele_status_service import AiTeleStatusService
-from app.services.wechat_bot_service import WechatBotService
-from app.core.scheduler_service import SchedulerService
-from app.db.database import Database
-from app.services.redis_service import RedisService
-from app.services.call_records_service import CallRecordsService
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from app.core.event_bus import ProductionEventBus
+    from app.services.lead_service import LeadService
+    from app.services.upload_record_service import FileService
+    from app.services.aibox_service import Aiboxservice
+    from app.services.scheduled_tasks_service import ScheduledTasksService
+    from app.services.ai_tele_status_service import AiTeleStatusService
+    from app.services.wechat_bot_service import WechatBotService
+    from app.core.scheduler_service import SchedulerService
+    from app.db.database import Database
+    from app.services.redis_service import RedisService
+    from app.services.call_records_service import CallRecordsService
+    from app.services.cloud_service import CloudService
 
 logger = get_logger(__name__)
 
 
+@dataclass(slots=True)
+class _Services:
+    """容器持有的业务服务（字段顺序即初始化顺序），依赖注入时按字段直接访问"""
+
+    db_service: Database
+    redis_service: RedisService
+    call_records_service: CallRecordsService
+    file_service: FileService
+    cloud_service: CloudService
+    lead_service: LeadService
+    aibox_service: Aiboxservice
+    ai_tele_status_service: AiTeleStatusService
+    wechat_bot_service: WechatBotService
+    scheduled_tasks_service: ScheduledTasksService
+    scheduler_service: SchedulerService
+
+
+# 服务名称（按初始化顺序），与 _Services 的字段一一对应
+_SERVICE_NAMES = tuple(field.name for field in fields(_Services))
+
+# 服务及其生命周期能力，注册时一次性探测，生命周期和健康检查中直接读取字段
+_ServiceEntry = namedtuple(
+    "_ServiceEntry", "name instance has_init has_shutdown has_health has_listeners"
+)
+
+
+def _make_entry(name: str, service: Any) -> _ServiceEntry:
+    """探测服务实现了哪些生命周期方法"""
+    return _ServiceEntry(
+        name,
+        service,
+        hasattr(service, "initialize"),
+        hasattr(service, "shutdown"),
+        hasattr(service, "health_check"),
+        hasattr(service, "register_event_listeners"),
+    )
+
+
+# 服务初始化分层：同层服务互不依赖、并发初始化，下一层等待上一层全部完成
+_INIT_TIERS = (
+    ("db_service", "redis_service"),
+    (
+        "call_records_service",
+        "file_service",
+        "cloud_service",
+        "lead_service",
+        "aibox_service",
+        "ai_tele_status_service",
+        "wechat_bot_service",
+        "scheduled_tasks_service",
+    ),
+    ("scheduler_service",),
+)
+
+# 服务是否就绪；未就绪时由 ReadinessMiddleware 在路由前直接返回 503，依赖函数不再逐个检查
+SERVICES_READY = False
+
+
 class EnhancedServiceContainer:
     """增强的服务容器 - 支持事件总线和生命周期管理"""
 
+    __slots__ = (
+        "_services",
+        "_entries",
+        "_services_view",
+        "_event_bus",
+        "services",
+        "_initialized",
+        "_lock",
+    )
+
     def __init__(self) -> None:
         self._services: Dict[str, Any] = {}
+        self._entries: Dict[str, _ServiceEntry] = {}
+        # 只读视图直接映射 _services，随其更新而更新，对外返回时无需复制
+        self._services_view = MappingProxyType(self._services)
         self._event_bus: Optional[ProductionEventBus] = None
+
+        # 业务服务，初始化后以字段直接访问，依赖注入时无需查字典
+        self.services: Optional[_Services] = None
         self._initialized = False
+        # Python 3.10+ 的 asyncio.Lock 构造时不绑定事件循环，可在导入时创建
         self._lock = asyncio.Lock()
 
     async def initialize(self) -> bool:
         """初始化所有服务"""
+        # 快速路径：已初始化时无需加锁
         if self._initialized:
             return True
 
         async with self._lock:
-            if self._initialized:  # 双重检查
+            # 慢速路径：持锁后再次检查，保证并发调用时只初始化一次
+            if self._initialized:
                 return True
 
             try:
                 logger.info("Initializing service container...")
 
                 # 1. 首先初始化事件总线
+                from app.core.event_bus import create_event_bus  # pylint: disable=import-outside-toplevel
+
                 self._event_bus = create_event_bus(settings)
                 await self._event_bus.start()
                 logger.info("✅ EventBus initialized")
@@ -59,6 +149,7 @@ class EnhancedServiceContainer:
                 logger.info("✅ Event listeners registered")
 
                 self._initialized = True
+                _set_services_ready(True)
                 logger.info("🎉 Service container initialization completed")
 
                 return True
@@ -72,35 +163,78 @@ class EnhancedServiceContainer:
 
     async def _initialize_services(self):
         """初始化业务服务"""
-        self._services["db_service"] = Database()
-        self._services["redis_service"] = RedisService(self._event_bus)
-        self._services["call_records_service"] = CallRecordsService(self._event_bus, self._services["db_service"], self._services["redis_service"])
-        self._services["file_service"] = FileService(self._event_bus)
-        self._services["lead_service"] = LeadService(self._event_bus, self._services["db_service"])
-        self._services["aibox_service"] = Aiboxservice(self._event_bus, self._services["db_service"], self._services["call_records_service"])
-        self._services["ai_tele_status_service"] = AiTeleStatusService(self._event_bus, self._services["db_service"])
-        self._services["wechat_bot_service"] = WechatBotService(self._event_bus)
-        self._services["scheduled_tasks_service"] = ScheduledTasksService(self._event_bus, self._services["db_service"])
-        self._services["scheduler_service"] = SchedulerService(self._event_bus, self._services["db_service"], self._services["scheduled_tasks_service"], self._services["aibox_service"])
-
-        for name, service in self._services.items():
-            if hasattr(service, "initialize"):
-                success = await service.initialize()
-                if success:
-                    logger.info("✅ Service %s initialized", name)
-                else:
-                    logger.error("❌ Service %s initialization failed", name)
-                    if name == "db_service":
-                        raise RuntimeError(
-                            f"Critical service {name} failed to initialize"
-                        )
+        # pylint: disable=import-outside-toplevel
+        from app.db.database import Database
+        from app.services.redis_service import RedisService
+        from app.services.call_records_service import CallRecordsService
+        from app.services.upload_record_service import FileService
+        from app.services.cloud_service import CloudService
+        from app.services.lead_service import LeadService
+        from app.services.aibox_service import Aiboxservice
+        from app.services.ai_tele_status_service import AiTeleStatusService
+        from app.services.wechat_bot_service import WechatBotService
+        from app.services.scheduled_tasks_service import ScheduledTasksService
+        from app.core.scheduler_service import SchedulerService
+
+        db_service = Database()
+        redis_service = RedisService(self._event_bus)
+        call_records_service = CallRecordsService(self._event_bus, db_service, redis_service)
+        cloud_service = CloudService()
+        aibox_service = Aiboxservice(self._event_bus, db_service, call_records_service, cloud_service)
+        scheduled_tasks_service = ScheduledTasksService(self._event_bus, db_service)
+        self.services = _Services(
+            db_service=db_service,
+            redis_service=redis_service,
+            call_records_service=call_records_service,
+            file_service=FileService(self._event_bus),
+            cloud_service=cloud_service,
+            lead_service=LeadService(self._event_bus, db_service),
+            aibox_service=aibox_service,
+            ai_tele_status_service=AiTeleStatusService(self._event_bus, db_service),
+            wechat_bot_service=WechatBotService(self._event_bus),
+            scheduled_tasks_service=scheduled_tasks_service,
+            scheduler_service=SchedulerService(self._event_bus, db_service, scheduled_tasks_service, aibox_service),
+        )
+
+        # 名称到服务的映射仅用于生命周期和健康检查的遍历
+        self._services.update((name, getattr(self.services, name)) for name in _SERVICE_NAMES)
+        self._entries.update((name, _make_entry(name, service)) for name, service in self._services.items())
+
+        for tier in _INIT_TIERS:
+            await asyncio.gather(
+                *(
+                    self._initialize_one(name, self._entries[name].instance)
+                    for name in tier
+                    if self._entries[name].has_init
+                )
+            )
+
+    async def _initialize_one(self, name: str, service: Any):
+        """初始化单个服务并记录结果"""
+        success = await service.initialize()
+        if success:
+            logger.info("✅ Service %s initialized", name)
+        else:
+            logger.error("❌ Service %s initialization failed", name)
+            if name == "db_service":
+                raise RuntimeError(
+                    f"Critical service {name} failed to initialize"
+                )
 
     async def _register_event_listeners(self):
         """注册所有服务的事件监听器"""
-        for name, service in self._services.items():
-            if hasattr(service, "register_event_listeners"):
-                await service.register_event_listeners()
-                logger.info("Event listeners registered for %s", name)
+        await asyncio.gather(
+            *(
+                self._register_one(entry.name, entry.instance)
+                for entry in self._entries.values()
+                if entry.has_listeners
+            )
+        )
+
+    async def _register_one(self, name: str, service: Any):
+        """注册单个服务的事件监听器"""
+        await service.register_event_listeners()
+        logger.info("Event listeners registered for %s", name)
 
     async def shutdown(self):
         """关闭所有服务"""
@@ -110,14 +244,16 @@ class EnhancedServiceContainer:
         logger.info("Shutting down service container...")
 
         try:
-            # 1. 关闭业务服务
-            for name, service in self._services.items():
-                if hasattr(service, "shutdown"):
-                    try:
-                        await service.shutdown()
-                        logger.info("Service %s shutdown completed", name)
-                    except Exception as e: # pylint: disable=broad-except
-                        logger.error("Error shutting down %s | error=%s", name, str(e))
+            # 1. 关闭业务服务：按初始化分层逆序，同层并发关闭，
+            #    保证依赖方（如待落库的日志）先于数据库/Redis 关闭
+            for tier in reversed(_INIT_TIERS):
+                await asyncio.gather(
+                    *(
+                        self._shutdown_one(name, self._entries[name].instance)
+                        for name in tier
+                        if name in self._entries and self._entries[name].has_shutdown
+                    )
+                )
 
             # 2. 关闭事件总线
             if self._event_bus and self._event_bus.running:
@@ -129,24 +265,36 @@ class EnhancedServiceContainer:
         finally:
             await self._cleanup()
 
+    async def _shutdown_one(self, name: str, service: Any):
+        """关闭单个服务，异常只记录不传播"""
+        try:
+            await service.shutdown()
+            logger.info("Service %s shutdown completed", name)
+        except Exception as e: # pylint: disable=broad-except
+            logger.error("Error shutting down %s | error=%s", name, str(e))
+
     async def _cleanup(self):
         """清理资源"""
         self._services.clear()
+        self._entries.clear()
+        self.services = None
         self._event_bus = None
         self._initialized = False
+        _set_services_ready(False)
 
     def get_redis_service(self) -> RedisService:
         """获取Redis服务"""
-        return self._services["redis_service"]
+        return self.services.redis_service
 
     def register_service(self, name: str, service):
         """注册服务"""
+        if self.services is not None and name in _SERVICE_NAMES:
+            setattr(self.services, name, service)
         self._services[name] = service
+        self._entries[name] = _make_entry(name, service)
 
     def get_service(self, name: str):
-        """获取服务"""
-        if not self._initialized:
-            raise RuntimeError("Service container not initialized")
+        """获取服务（就绪检查由 ReadinessMiddleware 负责）"""
         return self._services.get(name)
 
     def get_event_bus(self) -> ProductionEventBus:
@@ -155,9 +303,13 @@ class EnhancedServiceContainer:
             raise RuntimeError("EventBus not initialized")
         return self._event_bus
 
-    def get_all_services(self):
-        """获取所有服务"""
-        return self._services.copy()
+    def get_all_services(self) -> Mapping[str, Any]:
+        """获取所有服务（只读视图）"""
+        return self._services_view
+
+    def get_service_entries(self):
+        """获取所有服务及其生命周期能力"""
+        return self._entries.values()
 
     @property
     def is_initialized(self) -> bool:
@@ -170,6 +322,12 @@ class EnhancedServiceContainer:
         return bool(self._initialized and self._event_bus and self._event_bus.running)
 
 
+def _set_services_ready(ready: bool) -> None:
+    """更新模块级的服务就绪标志"""
+    global SERVICES_READY  # pylint: disable=global-statement
+    SERVICES_READY = ready
+
+
 # 全局服务容器
 service_container = EnhancedServiceContainer()
 
@@ -192,97 +350,138 @@ service_container = EnhancedServiceContainer()
 
 
 # === 批量获取服务 ===
-def get_database() -> Database:
+# 依赖函数体只做一次容器属性读取；保持 async def，FastAPI 在事件循环内直接调用。
+# 不使用 dependency_overrides 预绑定实例：覆盖项若为同步可调用对象会被派发到线程池，反而更慢。
+async def get_database() -> Database:
     """获取数据库服务"""
-    return service_container.get_service("db_service")
+    return service_container.services.db_service
 
 
-def get_file_service() -> FileService:
+async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """获取异步数据库会话（独立会话，退出时提交，异常时回滚）"""
+    async with service_container.services.db_service.get_session() as session:
+        yield session
+
+
+async def get_redis_service() -> RedisService:
+    """获取Redis服务"""
+    return service_container.services.redis_service
+
+
+async def get_file_service() -> FileService:
     """获取文件服务"""
-    return service_container.get_service("file_service")
+    return service_container.services.file_service
+
+
+async def get_cloud_service() -> CloudService:
+    """获取云存储服务"""
+    return service_container.services.cloud_service
 
 
-def get_lead_service() -> LeadService:
+async def get_lead_service() -> LeadService:
     """获取线索服务"""
-    return service_container.get_service("lead_service")
+    return service_container.services.lead_service
 
 
-def get_aibox_service() -> Aiboxservice:
+async def get_aibox_service() -> Aiboxservice:
     """获取aiBox服务"""
-    return service_container.get_service("aibox_service")
+    return service_container.services.aibox_service
 
 
-def get_scheduled_tasks_service() -> ScheduledTasksService:
+async def get_scheduled_tasks_service() -> ScheduledTasksService:
     """获取定时任务服务"""
-    return service_container.get_service("scheduled_tasks_service")
+    return service_container.services.scheduled_tasks_service
 
 
-def get_scheduler_service() -> SchedulerService:
+async def get_scheduler_service() -> SchedulerService:
     """获取调度器服务"""
-    return service_container.get_service("scheduler_service")
+    return service_container.services.scheduler_service
 
 
-def get_call_records_service() -> CallRecordsService:
+async def get_call_records_service() -> CallRecordsService:
     """获取通话记录服务"""
-    return service_container.get_service("call_records_service")
+    return service_container.services.call_records_service
 
 
-def get_ai_tele_status_service() -> AiTeleStatusService:
+async def get_ai_tele_status_service() -> AiTeleStatusService:
     """获取AI顾问统计服务"""
-    return service_container.get_service("ai_tele_status_service")
+    return service_container.services.ai_tele_status_service
 
 
-def get_wechat_bot_service() -> WechatBotService:
+async def get_wechat_bot_service() -> WechatBotService:
     """获取微信机器人服务"""
-    return service_container.get_service("wechat_bot_service")
+    return service_container.services.wechat_bot_service
 
 
-def get_all_services() -> Dict[str, Any]:
-    """获取所有服务"""
-    if not service_container.is_initialized:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Services not initialized",
-        )
-    return service_container.get_all_services()
+# === 健康检查 ===
 
 
-# === 健康检查 ===
+# 健康检查结果缓存时间（秒），探针密集调用时共享同一次检查结果
+_HEALTH_TTL = 1.0
+_health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+_health_inflight: Optional["asyncio.Future[Dict[str, Any]]"] = None
+
+
+def _store_health_result(future: "asyncio.Future[Dict[str, Any]]") -> None:
+    """健康检查完成回调：写入缓存并清除进行中的任务"""
+    global _health_cache, _health_inflight  # pylint: disable=global-statement
+    _health_inflight = None
+    if future.cancelled() or future.exception() is not None:
+        return
+    _health_cache = (time.monotonic(), future.result())
 
 
 async def check_services_health() -> Dict[str, Any]:
-    """检查所有服务健康状态"""
+    """检查所有服务健康状态（短时缓存，并发请求共享同一次检查）"""
+    global _health_inflight  # pylint: disable=global-statement
     if not service_container.is_initialized:
         return {"status": "not_initialized", "services": {}}
 
-    health_status: Dict[str, Any] = {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "services": {},
-    }
+    cached = _health_cache
+    if cached is not None and time.monotonic() - cached[0] < _HEALTH_TTL:
+        return cached[1]
+
+    if _health_inflight is None:
+        _health_inflight = asyncio.ensure_future(_collect_services_health())
+        _health_inflight.add_done_callback(_store_health_result)
+
+    # shield：单个探针请求被取消时不影响其他等待者
+    return await asyncio.shield(_health_inflight)
+
 
-    # 检查事件总线
+async def _collect_services_health() -> Dict[str, Any]:
+    """并发检查事件总线和业务服务的健康状态"""
+    degraded = False
+    # 先收集 (名称, 状态) 列表，最后一次性构造 services 字典，避免逐键插入时扩容
+    statuses = []
+    names = []
+    checks = []
     try:
-        event_bus = service_container.get_event_bus()
-        bus_health = await event_bus.get_health_status()
-        health_status["services"]["event_bus"] = bus_health
+        checks.append(service_container.get_event_bus().get_health_status())
+        names.append("event_bus")
     except Exception as e: # pylint: disable=broad-except
-        health_status["services"]["event_bus"] = {
-            "status": "unhealthy",
-            "error": str(e),
-        }
-        health_status["status"] = "degraded"
-
-    # 检查业务服务
-    for name, service in service_container.get_all_services().items():
-        try:
-            if hasattr(service, "health_check"):
-                service_health = await service.health_check()
-                health_status["services"][name] = service_health
-            else:
-                health_status["services"][name] = {"status": "unknown"}
-        except Exception as e: # pylint: disable=broad-except
-            health_status["services"][name] = {"status": "unhealthy", "error": str(e)}
-            health_status["status"] = "degraded"
-
-    return health_status
+        statuses.append(("event_bus", {"status": "unhealthy", "error": str(e)}))
+        degraded = True
+
+    for entry in service_container.get_service_entries():
+        if entry.has_health:
+            names.append(entry.name)
+            checks.append(entry.instance.health_check())
+        else:
+            statuses.append((entry.name, {"status": "unknown"}))
+
+    # 各项检查互不依赖，并发执行，总耗时取决于最慢的一项
+    results = await asyncio.gather(*checks, return_exceptions=True)
+    for name, result in zip(names, results):
+        if isinstance(result, Exception):
+            statuses.append((name, {"status": "unhealthy", "error": str(result)}))
+            degraded = True
+        else:
+            statuses.append((name, result))
+
+    # 结果按 _HEALTH_TTL 缓存，时间戳每个缓存周期只生成一次，保持 ISO 字符串格式不变
+    return {
+        "status": "degraded" if degraded else "healthy",
+        "timestamp": datetime.now().isoformat(),
+        "services": dict(statuses),
+    }
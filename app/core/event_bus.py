@@ -3,16 +3,19 @@
 """
 
 import asyncio
-import json
+import bisect
+import itertools
+import os
 import time
 from collections import defaultdict, deque
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Deque, Dict, List, Optional
-import aiofiles
+from typing import Any, Awaitable, Deque, Dict, List, Optional, Tuple
+import orjson
 
 from app.core.config import settings
 from app.core.logger import get_logger
+from app.core.ring_queue import PriorityRingQueue
 from app.models.events import (
     Event,
     EventType,
@@ -24,6 +27,51 @@ from app.models.events import (
 
 logger = get_logger(__name__)
 
+# 事件计数器下标
+_IDX_TOTAL, _IDX_COMPLETED, _IDX_FAILED, _IDX_TIMEOUT, _IDX_CANCELLED = range(5)
+
+# 每秒事件数采样环：容量为 2 的幂，下标用位与回绕；每发送 _EPS_SAMPLE_EVERY 个事件采样一次
+_EPS_RING_SIZE = 64
+_EPS_RING_MASK = _EPS_RING_SIZE - 1
+_EPS_SAMPLE_MASK = 128 - 1  # 即每 128 个事件采样一次
+_EPS_MIN_READ_INTERVAL = 1.0
+
+# 各优先级（LOW, NORMAL, HIGH, CRITICAL）被工作线程选中的权重，低优先级不为零以免饿死
+EVENT_PRIORITY_WEIGHTS = (0.05, 0.15, 0.3, 0.5)
+# 事件排队超过该秒数后不再参与权重选择，直接优先处理
+EVENT_AGING_THRESHOLD = 5.0
+
+# writev 单次调用允许的最大缓冲区个数
+_IOV_MAX = os.sysconf("SC_IOV_MAX") if hasattr(os, "sysconf") else 1024
+
+# 事件日志攒批间隔（秒）：首条日志到达后等待该时长，再一次性写入文件
+EVENT_LOG_FLUSH_INTERVAL = 0.05
+
+
+def _write_all(fd: int, buffers: List[bytes]):
+    """用 writev 写出全部缓冲区，处理单次调用的缓冲区数量上限和部分写入"""
+    if not hasattr(os, "writev"):
+        os.write(fd, b"".join(buffers))
+        return
+
+    pending = buffers
+    while pending:
+        chunk = pending[:_IOV_MAX]
+        written = os.writev(fd, chunk)
+        done = 0
+        while done < len(chunk) and written >= len(chunk[done]):
+            written -= len(chunk[done])
+            done += 1
+        if done < len(chunk) and written:
+            # 部分写入：剩余部分下次继续
+            chunk[done] = chunk[done][written:]
+        pending = chunk[done:] + pending[len(chunk):]
+
+
+def _listener_sort_key(listener: EventListener) -> int:
+    """监听器排序键：优先级取负，使高优先级排在前面"""
+    return -listener.priority.value
+
 
 class ProductionEventBus:
     """生产级事件总线"""
@@ -34,49 +82,52 @@ class ProductionEventBus:
 
         # 核心组件
         self.listeners: Dict[EventType, List[EventListener]] = defaultdict(list)
+        # 按 EventType.index 下标分发的监听器表，与 listeners 共享同一列表对象
+        self._dispatch_table: List[List[EventListener]] = [[] for _ in EventType]
         self.pending_events: Dict[str, Event] = {}
-        self.event_queues: List[asyncio.Queue] = []
-        self.dead_letter_queue: Deque[Event] = deque(
+        # 按优先级分组的环形队列：按权重选择优先级并对久等事件提权，同优先级先进先出
+        self.event_queue = PriorityRingQueue(
+            len(EventPriority),
+            self.config.max_queue_size,
+            weights=EVENT_PRIORITY_WEIGHTS,
+            aging_threshold=EVENT_AGING_THRESHOLD,
+        )
+        # 等待重新入队的重试事件定时器（event_id -> TimerHandle），停止时统一取消
+        self._retry_handles: Dict[str, asyncio.TimerHandle] = {}
+        # 死信队列保存事件进入死信（失败或超时）时的序列化快照，含最终状态和错误信息，不持有 Event 对象
+        self.dead_letter_queue: Deque[Dict[str, Any]] = deque(
             maxlen=self.config.dead_letter_queue_size
         )
 
         # 状态管理
         self.running = False
+        # 运行所在的事件循环，start() 时缓存
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self.workers: List[asyncio.Task] = []
         self.health_check_task: Optional[asyncio.Task] = None
-        self.metrics_task: Optional[asyncio.Task] = None
-
-        # 指标和监控
-        self.metrics: EventMetrics = EventMetrics(
-            total_events=0,
-            completed_events=0,
-            failed_events=0,
-            timeout_events=0,
-            cancelled_events=0,
-            average_processing_time=0.0,
-            events_per_second=0.0,
-            queue_size=0,
-            active_workers=0,
-            dead_letter_queue_size=0,
-            last_updated=datetime.now(),
-        )
+
+        # 指标和监控：计数器在事件循环内直接自增，EventMetrics 仅在读取时构造
+        self._counters: List[int] = [0] * 5
+        # (monotonic 时间, 累计事件数) 采样环，用于按需计算每秒事件数
+        self._eps_ring: List[Tuple[float, int]] = [(0.0, 0)] * _EPS_RING_SIZE
+        self._eps_idx = 0
+        self.started_at = datetime.now()
+        # 事件历史（固定容量环形缓冲区），读取时才序列化为完整的事件字典
         self.event_history: Deque[Event] = deque(maxlen=1000)
         self.processing_times: Deque[float] = deque(maxlen=100)
-        self.events_per_second_counter: Deque[int] = deque(maxlen=60)
         # 线程安全
         self.lock = asyncio.Lock()
-        self.metrics_lock = asyncio.Lock()
 
         # 持久化
         self.persistence_enabled = self.config.enable_persistence
         self.persistence_path = Path(self.config.persistence_path)
-
-        # 初始化队列（按优先级）
-        for _ in EventPriority:
-            queue: asyncio.Queue[Event] = asyncio.Queue(
-                maxsize=self.config.max_queue_size
-            )
-            self.event_queues.append(queue)
+        # 待写入的日志行，由 _log_flusher_worker 批量落盘
+        self._log_buffer: List[bytes] = []
+        self._log_flush_event = asyncio.Event()
+        self.log_flusher_task: Optional[asyncio.Task] = None
+        # 当日日志文件描述符，跨批次复用，日期变化时重新打开
+        self._log_file_date = ""
+        self._log_fd: Optional[int] = None
 
         logger.info(
             "EventBus initialized | worker_count=%s, max_queue_size=%s, persistence_enabled=%s",
@@ -93,11 +144,15 @@ class ProductionEventBus:
 
         logger.info("Starting EventBus...")
         self.running = True
+        self._loop = asyncio.get_running_loop()
+        self.started_at = datetime.now()
+        self.event_queue.open()
 
         # 创建持久化目录
         if self.persistence_enabled:
             self.persistence_path.mkdir(parents=True, exist_ok=True)
             logger.info("Persistence enabled | path=%s", str(self.persistence_path))
+            self.log_flusher_task = asyncio.create_task(self._log_flusher_worker())
 
         # 启动工作线程
         for i in range(self.config.worker_count):
@@ -107,13 +162,10 @@ class ProductionEventBus:
         # 启动健康检查
         self.health_check_task = asyncio.create_task(self._health_check_worker())
 
-        # 启动指标收集
-        self.metrics_task = asyncio.create_task(self._metrics_worker())
-
         logger.info(
-            "EventBus started successfully | workers=%s, queues=%s",
+            "EventBus started successfully | workers=%s, queue_maxsize=%s",
             len(self.workers),
-            len(self.event_queues),
+            self.event_queue.maxsize,
         )
 
     async def stop(self, timeout: float = 10.0):
@@ -125,26 +177,30 @@ class ProductionEventBus:
         logger.info("Stopping EventBus... | timeout=%s", timeout)
         self.running = False
 
-        # 停止健康检查和指标收集
+        # 停止健康检查
         if self.health_check_task:
             self.health_check_task.cancel()
-        if self.metrics_task:
-            self.metrics_task.cancel()
 
-        # 等待工作线程完成
-        try:
-            await asyncio.wait_for(
-                asyncio.gather(*self.workers, return_exceptions=True), timeout=timeout
-            )
-            logger.info("All workers stopped gracefully")
-        except asyncio.TimeoutError:
-            logger.warning("Some workers did not stop gracefully | timeout=%s", timeout)
-            # 强制取消剩余的工作线程
-            for worker in self.workers:
-                if not worker.done():
+        # 取消尚未触发的重试
+        for handle in self._retry_handles.values():
+            handle.cancel()
+        self._retry_handles.clear()
+
+        # 关闭队列，唤醒阻塞在队列上的空闲工作线程
+        self.event_queue.close()
+
+        # 等待工作线程完成，超时未退出的直接取消并等待其结束
+        if self.workers:
+            _, pending = await asyncio.wait(self.workers, timeout=timeout)
+            if pending:
+                logger.warning("Some workers did not stop gracefully | timeout=%s", timeout)
+                for worker in pending:
                     worker.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+            else:
+                logger.info("All workers stopped gracefully")
 
-        # 取消所有待处理的事件
+        # 取消所有待处理的事件（遍历期间持锁）
         async with self.lock:
             cancelled_count = 0
             for event in self.pending_events.values():
@@ -157,16 +213,37 @@ class ProductionEventBus:
             if cancelled_count > 0:
                 logger.info("Cancelled pending events | count=%s", cancelled_count)
 
+        # 停止日志落盘任务并写出剩余日志：取消后等待其结束（正在进行的线程写入会先完成），
+        # 之后才能安全地写出剩余日志并关闭文件
+        if self.log_flusher_task:
+            self.log_flusher_task.cancel()
+            try:
+                await self.log_flusher_task
+            except asyncio.CancelledError:
+                pass
+            self.log_flusher_task = None
+        await self._flush_log_buffer()
+        await self._close_log_file()
+
         logger.info("EventBus stopped successfully")
 
     def register_listener(self, listener: EventListener):
         """注册事件监听器"""
-
-        self.listeners[listener.event_type].append(listener)
-        # 按优先级排序（高优先级在前）
-        self.listeners[listener.event_type].sort(
-            key=lambda x: x.priority.value, reverse=True
+        # 处理函数注册后不变，调用方式在此确定一次，避免每次调用时检查
+        listener.is_coroutine = asyncio.iscoroutinefunction(listener.handler)
+        # 并发控制同样在注册时确定：只有显式要求的并发上限小于工作线程数时才需要信号量，
+        # 否则同时执行数本就不会超过工作线程数，信号量永远不会阻塞
+        fields_set = listener.model_fields_set
+        if "max_concurrent" in fields_set and listener.max_concurrent < self.config.worker_count:
+            listener.semaphore = asyncio.Semaphore(listener.max_concurrent)
+        elif "semaphore" not in fields_set:
+            listener.semaphore = None
+
+        # 按优先级有序插入（高优先级在前，同优先级保持注册顺序）
+        bisect.insort(
+            self.listeners[listener.event_type], listener, key=_listener_sort_key
         )
+        self._dispatch_table[listener.event_type.index] = self.listeners[listener.event_type]
 
         logger.info(
             "Listener registered | event_type=%s, "
@@ -194,56 +271,90 @@ class ProductionEventBus:
             event.wait_for_result,
         )
 
-        # 如果需要等待结果，创建Future
-        if event.wait_for_result:
-            event.result_future = asyncio.Future()
-            async with self.lock:
-                self.pending_events[event.event_id] = event
+        # 快速路径：无需等待结果的事件只入队、计数、记录，不创建 Future、不登记 pending_events
+        if not event.wait_for_result:
+            await self._enqueue(event)
+            self._count_emitted()
+            await self._log_event(event, "emitted")
+            return None
+
+        # 直接调用路径：唯一监听器、无并发限制、普通优先级时，
+        # 在发送方协程内执行监听器，跳过入队、工作线程唤醒和 Future
+        listeners = self._dispatch_table[event.type.index]
+        if (
+            len(listeners) == 1
+            and listeners[0].semaphore is None
+            and event.priority is EventPriority.NORMAL
+        ):
+            return await self._emit_direct(listeners[0], event)
+
+        return await self._emit_queued(event)
+
+    async def _emit_direct(self, listener: EventListener, event: Event) -> Any:
+        """直接执行唯一的监听器并返回结果，失败处理与 _process_event 一致"""
+        self._count_emitted()
+        await self._log_event(event, "emitted")
 
-        # 放入对应优先级的队列
+        event.status = EventStatus.PROCESSING
+        self._mark_processing_start(event)
         try:
-            queue_index = event.priority.value
-            await self.event_queues[queue_index].put(event)
+            result = await self._call_listener(listener, event)
+        except Exception as e:  # pylint: disable=broad-except
+            listener.total_failed += 1
+            logger.error(
+                "Listener execution failed | event_id=%s, listener_name=%s, error=%s",
+                event.event_id,
+                listener.name,
+                str(e),
+            )
+            # 非关键监听器的失败不影响事件完成（结果为空列表，与工作线程路径一致）
+            if listener.priority.value < 2:  # LOW or NORMAL
+                await self._complete_event(event, [])
+                return []
+            # 关键监听器失败：按常规退避调度重试，由工作线程处理后等待结果
+            return await self._await_result(event, self._handle_event_error(event, e))
+
+        listener.total_processed += 1
+        await self._complete_event(event, result)
+        return result
 
-            # 更新指标
-            await self._update_metrics(total_events=1)
+    async def _emit_queued(self, event: Event) -> Any:
+        """放入队列并等待工作线程处理的结果"""
+        return await self._await_result(event, self._enqueue_emitted(event))
 
-            # 记录事件
-            await self._log_event(event, "emitted")
+    async def _enqueue_emitted(self, event: Event):
+        """按优先级入队并记录发送"""
+        await self._enqueue(event)
+
+        # 更新指标
+        self._count_emitted()
+
+        # 记录事件
+        await self._log_event(event, "emitted")
+
+    async def _await_result(self, event: Event, submit: Awaitable[None]) -> Any:
+        """登记结果 Future，执行 submit 将事件交给工作线程，并等待处理结果"""
+        event.result_future = self._loop.create_future()
+        # 单次字典操作之间没有 await，在事件循环内天然原子，无需加锁
+        self.pending_events[event.event_id] = event
 
+        try:
+            await submit
+
+            result = await asyncio.wait_for(event.result_future, timeout=event.timeout)
+            logger.debug(
+                "Event completed | event_id=%s, processing_time=%s",
+                event.event_id,
+                self._get_processing_time(event),
+            )
+            return result
         except asyncio.TimeoutError as exc:
             await self._handle_timeout(event)
             raise TimeoutError(
                 f"Event {event.type.value} timed out after {event.timeout}s"
             ) from exc
         finally:
-            async with self.lock:
-                self.pending_events.pop(event.event_id, None)
-
-        # 如果需要等待结果
-        if event.wait_for_result:
-            try:
-                if event.result_future is None:
-                    raise RuntimeError("Event result_future uninitialized")
-                result = await asyncio.wait_for(
-                    event.result_future, timeout=event.timeout
-                )
-                logger.debug(
-                    "Event completed | event_id=%s, processing_time=%s",
-                    event.event_id,
-                    self._get_processing_time(event),
-                )
-                return result
-            except asyncio.TimeoutError as exc:
-                await self._handle_timeout(event)
-                raise TimeoutError(
-                    f"Event {event.type.value} timed out after {event.timeout}s"
-                ) from exc
-            finally:
-                async with self.lock:
-                    self.pending_events.pop(event.event_id, None)
-
-        return None
+            self.pending_events.pop(event.event_id, None)
 
     async def _event_worker(self, worker_id: str):
         """事件处理工作线程"""
@@ -252,11 +363,10 @@ class ProductionEventBus:
         while self.running:
             try:
                 event = await self._get_next_event()
-                if event:
-                    await self._process_event(event, worker_id)
-                else:
-                    # 没有事件时短暂休息
-                    await asyncio.sleep(0.1)
+                if event is None:
+                    # 停止信号
+                    break
+                await self._process_event(event, worker_id)
             except asyncio.CancelledError:
                 logger.info("Worker cancelled | worker_id=%s", worker_id)
                 break
@@ -266,27 +376,24 @@ class ProductionEventBus:
 
         logger.info("Worker stopped | worker_id=%s", worker_id)
 
+    async def _enqueue(self, event: Event):
+        """按优先级放入事件队列"""
+        await self.event_queue.put(event, event.priority.value)
+
     async def _get_next_event(self) -> Optional[Event]:
-        """获取下一个事件（按优先级）"""
-        # 按优先级从高到低检查队列
-        for queue in reversed(self.event_queues):
-            try:
-                event = await asyncio.wait_for(queue.get(), timeout=0.1)
-                return event
-            except asyncio.TimeoutError:
-                continue
-        return None
+        """获取下一个事件（优先级最高者），队列关闭后返回 None"""
+        return await self.event_queue.get()
 
     async def _process_event(self, event: Event, worker_id: str):
         """处理单个事件"""
         event.status = EventStatus.PROCESSING
-        event.processing_start_time = datetime.now()
+        self._mark_processing_start(event)
 
         try:
             await self._log_event(event, "processing", worker_id)
 
             # 获取监听器
-            listeners = self.listeners.get(event.type, [])
+            listeners = self._dispatch_table[event.type.index]
             if not listeners:
                 raise ValueError(f"No listeners for event type: {event.type.value}")
 
@@ -335,14 +442,13 @@ class ProductionEventBus:
         timeout = listener.timeout or event.timeout
 
         try:
-            if asyncio.iscoroutinefunction(listener.handler):
+            if listener.is_coroutine:
                 result = await asyncio.wait_for(
                     listener.handler(event), timeout=timeout
                 )
             else:
                 # 同步函数在线程池中执行
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(None, listener.handler, event)
+                result = await self._loop.run_in_executor(None, listener.handler, event)
             return result
         except asyncio.TimeoutError as exc:
             raise TimeoutError(f"Listener {listener.name} timeout after {timeout}s") from exc
@@ -350,7 +456,7 @@ class ProductionEventBus:
     async def _complete_event(self, event: Event, result: Any):
         """完成事件处理"""
         event.status = EventStatus.COMPLETED
-        event.processing_end_time = datetime.now()
+        self._mark_processing_end(event)
 
         # 计算处理时间
         processing_time = self._get_processing_time(event)
@@ -366,7 +472,7 @@ class ProductionEventBus:
             event.result_future.set_result(result)
 
         # 更新指标
-        await self._update_metrics(completed_events=1)
+        self._counters[_IDX_COMPLETED] += 1
         await self._log_event(event, "completed")
 
     async def _handle_event_error(self, event: Event, error: Exception):
@@ -378,18 +484,14 @@ class ProductionEventBus:
             event.retry_count += 1
             event.status = EventStatus.PENDING
 
-            # 延迟重试
+            # 延迟重试：由定时器到期后重新入队，工作线程不在退避期间空等
             retry_delay = self.config.retry_delay * (
                 2 ** (event.retry_count - 1)
             )  # 指数退避
-            await asyncio.sleep(retry_delay)
-
-            # 重新放入队列
-            queue_index = event.priority.value
-            await self.event_queues[queue_index].put(event)
+            self._schedule_retry(event, retry_delay)
 
             logger.warning(
-                "Retrying event | event_id=%s, retry_count=%s, retry_delay=%s",
+                "Retry scheduled | event_id=%s, retry_count=%s, retry_delay=%s",
                 event.event_id,
                 event.retry_count,
                 retry_delay,
@@ -398,10 +500,10 @@ class ProductionEventBus:
 
         # 重试次数用完，标记为失败
         event.status = EventStatus.FAILED
-        event.processing_end_time = datetime.now()
+        self._mark_processing_end(event)
 
         # 添加到死信队列
-        self.dead_letter_queue.append(event)
+        self.dead_letter_queue.append(event.model_dump())
 
         # 设置Future异常
         if (
@@ -412,7 +514,7 @@ class ProductionEventBus:
             event.result_future.set_exception(error)
 
         # 更新指标
-        await self._update_metrics(failed_events=1)
+        self._counters[_IDX_FAILED] += 1
         await self._log_event(event, "failed", error=str(error))
 
         logger.error(
@@ -422,53 +524,85 @@ class ProductionEventBus:
             str(error),
         )
 
+    def _count_emitted(self):
+        """累加发送计数，并按批次记录每秒事件数采样"""
+        total = self._counters[_IDX_TOTAL] + 1
+        self._counters[_IDX_TOTAL] = total
+        if not total & _EPS_SAMPLE_MASK:
+            self._record_eps_sample(time.monotonic(), total)
+
+    def _record_eps_sample(self, now: float, total: int):
+        """写入一条 (时间, 累计事件数) 采样"""
+        self._eps_ring[self._eps_idx & _EPS_RING_MASK] = (now, total)
+        self._eps_idx += 1
+
+    def _events_per_second(self) -> float:
+        """根据采样环中最早与最新的采样计算每秒事件数"""
+        now = time.monotonic()
+        total = self._counters[_IDX_TOTAL]
+        newest_time = self._eps_ring[(self._eps_idx - 1) & _EPS_RING_MASK][0] if self._eps_idx else 0.0
+        # 低流量时批量采样可能长时间不触发，读取时补一条采样
+        if not self._eps_idx or now - newest_time >= _EPS_MIN_READ_INTERVAL:
+            self._record_eps_sample(now, total)
+
+        if self._eps_idx < 2:
+            return 0.0
+        oldest_time, oldest_count = self._eps_ring[
+            self._eps_idx & _EPS_RING_MASK if self._eps_idx > _EPS_RING_SIZE else 0
+        ]
+        time_diff = now - oldest_time
+        return (total - oldest_count) / time_diff if time_diff > 0 else 0.0
+
+    def _schedule_retry(self, event: Event, delay: float):
+        """在 delay 秒后将事件重新放入队列"""
+        self._retry_handles[event.event_id] = self._loop.call_later(
+            delay, self._requeue_retry, event, delay
+        )
+
+    def _requeue_retry(self, event: Event, delay: float):
+        """重试定时器回调：重新入队，队列已满时按相同间隔再次调度"""
+        self._retry_handles.pop(event.event_id, None)
+        if not self.running:
+            return
+        try:
+            self.event_queue.put_nowait(event, event.priority.value)
+        except asyncio.QueueFull:
+            logger.warning("Queue full, postponing retry | event_id=%s", event.event_id)
+            self._schedule_retry(event, delay)
+
     async def _handle_timeout(self, event: Event):
         """处理事件超时"""
         event.status = EventStatus.TIMEOUT
-        event.processing_end_time = datetime.now()
+        self._mark_processing_end(event)
 
         # 添加到死信队列
-        self.dead_letter_queue.append(event)
+        self.dead_letter_queue.append(event.model_dump())
 
         # 更新指标
-        await self._update_metrics(timeout_events=1)
+        self._counters[_IDX_TIMEOUT] += 1
         await self._log_event(event, "timeout")
 
         logger.warning(
             "Event timed out | event_id=%s, timeout=%s", event.event_id, event.timeout
         )
 
-    def _get_processing_time(self, event: Event) -> Optional[float]:
-        """获取事件处理时间"""
-        if event.processing_start_time and event.processing_end_time:
-            return (
-                event.processing_end_time - event.processing_start_time
-            ).total_seconds()
-        return None
-
-    async def _update_metrics(self, **kwargs):
-        """更新指标"""
-        async with self.metrics_lock:
-            for key, value in kwargs.items():
-                current_value = getattr(self.metrics, key, 0)
-                setattr(self.metrics, key, current_value + value)
-
-            # 计算平均处理时间
-            if self.processing_times:
-                self.metrics.average_processing_time = sum(self.processing_times) / len(
-                    self.processing_times
-                )
-
-            # 计算队列大小
-            self.metrics.queue_size = sum(queue.qsize() for queue in self.event_queues)
-
-            # 计算活跃工作线程数
-            self.metrics.active_workers = len([w for w in self.workers if not w.done()])
+    @staticmethod
+    def _mark_processing_start(event: Event):
+        """记录处理开始：对外字段为墙钟时间，耗时另以单调时钟计算"""
+        event.processing_start_time = datetime.now()
+        event.processing_monotonic_start = time.monotonic()
+        event.processing_seconds = None
 
-            # 计算死信队列大小
-            self.metrics.dead_letter_queue_size = len(self.dead_letter_queue)
+    @staticmethod
+    def _mark_processing_end(event: Event):
+        """记录处理结束时间和耗时"""
+        event.processing_end_time = datetime.now()
+        if event.processing_monotonic_start is not None:
+            event.processing_seconds = time.monotonic() - event.processing_monotonic_start
 
-            self.metrics.last_updated = datetime.now()
+    def _get_processing_time(self, event: Event) -> Optional[float]:
+        """获取事件处理时间"""
+        return event.processing_seconds
 
     async def _log_event(
         self,
@@ -482,7 +616,7 @@ class ProductionEventBus:
             "event_id": event.event_id,
             "event_type": event.type.value,
             "action": action,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "correlation_id": event.correlation_id,
             "source": event.source,
             "worker_id": worker_id,
@@ -497,19 +631,64 @@ class ProductionEventBus:
 
         # 持久化日志
         if self.persistence_enabled:
-            await self._persist_log(log_data)
+            self._persist_log(log_data)
+
+    def _persist_log(self, log_data: dict):
+        """将日志行放入缓冲区，由后台任务批量落盘"""
+        self._log_buffer.append(orjson.dumps(log_data, option=orjson.OPT_APPEND_NEWLINE))
+        self._log_flush_event.set()
+
+    async def _log_flusher_worker(self):
+        """日志落盘工作线程：攒批后一次写入"""
+        while True:
+            await self._log_flush_event.wait()
+            await asyncio.sleep(EVENT_LOG_FLUSH_INTERVAL)
+            await self._flush_log_buffer()
+
+    async def _flush_log_buffer(self):
+        """交换缓冲区并写入当日日志文件"""
+        self._log_flush_event.clear()
+        if not self._log_buffer:
+            return
+        buffer, self._log_buffer = self._log_buffer, []
+        # 线程中的文件操作无法中途取消：调用方被取消时先等待写入（及文件描述符更新）完成再传播取消，
+        # 避免 stop() 在写入尚未结束时关闭文件
+        write = asyncio.ensure_future(self._write_log_lines(buffer))
+        try:
+            await asyncio.shield(write)
+        except asyncio.CancelledError:
+            await asyncio.wait({write})
+            raise
 
-    async def _persist_log(self, log_data: dict):
-        """持久化日志到文件"""
+    async def _write_log_lines(self, buffer: List[bytes]):
+        """将一批日志行写入当日日志文件，跨天时切换文件"""
         try:
-            log_file = (
-                self.persistence_path
-                / f"events_{datetime.now().strftime('%Y%m%d')}.log"
-            )
-            async with aiofiles.open(log_file, "a", encoding="utf-8") as f:
-                await f.write(json.dumps(log_data) + "\n")
+            today = time.strftime("%Y%m%d")
+            if today != self._log_file_date or self._log_fd is None:
+                await self._close_log_file()
+                self._log_fd = await asyncio.to_thread(
+                    os.open,
+                    self.persistence_path / f"events_{today}.log",
+                    os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                    0o644,
+                )
+                self._log_file_date = today
+            # 整批日志行作为分散缓冲区一次提交，无需先拼接
+            await asyncio.to_thread(_write_all, self._log_fd, buffer)
         except Exception as e:  # pylint: disable=broad-except
-            logger.error("Failed to persist log | error=%s", str(e))
+            logger.error("Failed to persist log | count=%s, error=%s", len(buffer), str(e))
+            # 写入失败后关闭文件，下一批重新打开
+            await self._close_log_file()
+
+    async def _close_log_file(self):
+        """关闭当前日志文件"""
+        fd, self._log_fd = self._log_fd, None
+        self._log_file_date = ""
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError as e:
+                logger.error("Failed to close event log file | error=%s", str(e))
 
     async def _health_check_worker(self):
         """健康检查工作线程"""
@@ -543,7 +722,7 @@ class ProductionEventBus:
                     self.workers[i] = new_worker
 
         # 检查队列大小
-        total_queue_size = sum(queue.qsize() for queue in self.event_queues)
+        total_queue_size = self.event_queue.qsize()
         if total_queue_size > self.config.max_queue_size * 0.8:
             logger.warning("Queue size is high | size=%s", total_queue_size)
 
@@ -561,59 +740,26 @@ class ProductionEventBus:
             len(self.dead_letter_queue),
         )
 
-    async def _metrics_worker(self):
-        """指标收集工作线程"""
-        logger.info("Metrics worker started")
-
-        while self.running:
-            try:
-                # 计算每秒事件数
-                current_time = time.time()
-                current_event_count = self.metrics.total_events
-
-                # 记录时间窗口内的事件数
-                self.events_per_second_counter.append(
-                    (current_time, current_event_count)
-                )
-
-                # 计算过去60秒的平均事件数
-                if len(self.events_per_second_counter) >= 2:
-                    oldest_time, oldest_count = self.events_per_second_counter[0]
-                    time_diff = current_time - oldest_time
-                    event_diff = current_event_count - oldest_count
-
-                    if time_diff > 0:
-                        async with self.metrics_lock:
-                            self.metrics.events_per_second = event_diff / time_diff
-
-                await asyncio.sleep(1)  # 每秒更新一次
-
-            except asyncio.CancelledError:
-                break
-            except Exception as e:  # pylint: disable=broad-except
-                logger.error("Metrics worker error | error=%s", str(e))
-                await asyncio.sleep(1)
-
-        logger.info("Metrics worker stopped")
-
     # 公共API方法
     async def get_metrics(self) -> EventMetrics:
-        """获取事件指标"""
-        async with self.metrics_lock:
-            # 创建指标副本
-            return EventMetrics(
-                total_events=self.metrics.total_events,
-                completed_events=self.metrics.completed_events,
-                failed_events=self.metrics.failed_events,
-                timeout_events=self.metrics.timeout_events,
-                cancelled_events=self.metrics.cancelled_events,
-                average_processing_time=self.metrics.average_processing_time,
-                events_per_second=self.metrics.events_per_second,
-                queue_size=self.metrics.queue_size,
-                active_workers=self.metrics.active_workers,
-                dead_letter_queue_size=self.metrics.dead_letter_queue_size,
-                last_updated=self.metrics.last_updated,
-            )
+        """获取事件指标（基于计数器即时构造快照）"""
+        counters = self._counters
+        processing_times = self.processing_times
+        return EventMetrics(
+            total_events=counters[_IDX_TOTAL],
+            completed_events=counters[_IDX_COMPLETED],
+            failed_events=counters[_IDX_FAILED],
+            timeout_events=counters[_IDX_TIMEOUT],
+            cancelled_events=counters[_IDX_CANCELLED],
+            average_processing_time=sum(processing_times) / len(processing_times)
+            if processing_times
+            else 0.0,
+            events_per_second=self._events_per_second(),
+            queue_size=self.event_queue.qsize(),
+            active_workers=len([w for w in self.workers if not w.done()]),
+            dead_letter_queue_size=len(self.dead_letter_queue),
+            last_updated=datetime.now(),
+        )
 
     async def get_health_status(self) -> Dict[str, Any]:
         """获取健康状态"""
@@ -635,7 +781,7 @@ class ProductionEventBus:
             else "stopped",
             "health_score": health_score,
             "running": self.running,
-            "uptime": (datetime.now() - self.metrics.last_updated).total_seconds()
+            "uptime": (metrics.last_updated - self.started_at).total_seconds()
             if self.running
             else 0,
             "workers": {
@@ -647,7 +793,7 @@ class ProductionEventBus:
                 "total_size": metrics.queue_size,
                 "dead_letter_size": metrics.dead_letter_queue_size,
                 "queue_utilization": metrics.queue_size
-                / (self.config.max_queue_size * len(self.event_queues))
+                / self.event_queue.maxsize
                 * 100,
             },
             "events": {
@@ -669,14 +815,14 @@ class ProductionEventBus:
         }
 
     async def get_event_history(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """获取事件历史"""
-        events = list(self.event_history)[-limit:]
-        return [event.model_dump() for event in events]
+        """获取事件历史（与此前相同，返回完整的事件字典）"""
+        start = max(len(self.event_history) - limit, 0)
+        return [event.model_dump() for event in itertools.islice(self.event_history, start, None)]
 
     async def get_dead_letter_events(self, limit: int = 100) -> List[Dict[str, Any]]:
         """获取死信队列事件"""
-        events = list(self.dead_letter_queue)[-limit:]
-        return [event.model_dump() for event in events]
+        start = max(len(self.dead_letter_queue) - limit, 0)
+        return list(itertools.islice(self.dead_letter_queue, start, None))
 
     async def get_listeners_info(self) -> Dict[str, List[Dict[str, Any]]]:
         """获取监听器信息"""
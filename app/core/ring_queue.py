@@ -0,0 +1,141 @@
+"""
+优先级环形队列
+
+为事件总线提供按优先级分组的有界队列：每个优先级一个预分配的环形缓冲区，
+容量取 2 的幂，下标用位与代替取模，入队出队不分配新对象。
+可选按权重随机选择优先级并对久等的低优先级元素提权，避免持续高负载下低优先级饿死
+"""
+
+import asyncio
+import bisect
+import itertools
+import random
+import time
+from typing import Any, List, Optional, Sequence
+
+
+class PriorityRingQueue:
+    """按优先级分组的有界环形队列（单事件循环内使用，无需加锁）"""
+
+    __slots__ = (
+        "_buffers",
+        "_heads",
+        "_tails",
+        "_mask",
+        "_capacity",
+        "_size",
+        "_not_empty",
+        "_not_full",
+        "_closed",
+        "_cum_weights",
+        "_aging_threshold",
+        "_times",
+        "maxsize",
+    )
+
+    def __init__(
+        self,
+        levels: int,
+        capacity: int,
+        weights: Optional[Sequence[float]] = None,
+        aging_threshold: Optional[float] = None,
+    ) -> None:
+        # 缓冲区长度向上取 2 的幂，每个优先级最多容纳 capacity 个元素
+        size = 1 << max(capacity - 1, 0).bit_length()
+        self._mask = size - 1
+        self._capacity = capacity
+        self._buffers: List[List[Any]] = [[None] * size for _ in range(levels)]
+        self._heads = [0] * levels
+        self._tails = [0] * levels
+        self._size = 0
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._closed = False
+        self.maxsize = capacity * levels
+        # 各优先级被选中的权重（下标即优先级），为空时严格按优先级从高到低
+        self._cum_weights = list(itertools.accumulate(weights)) if weights else None
+        # 等待超过该秒数的元素优先出队；为空时不记录入队时间
+        self._aging_threshold = aging_threshold
+        self._times: Optional[List[List[float]]] = (
+            [[0.0] * size for _ in range(levels)] if aging_threshold is not None else None
+        )
+
+    def qsize(self) -> int:
+        """当前元素总数"""
+        return self._size
+
+    def put_nowait(self, item: Any, level: int) -> None:
+        """放入指定优先级，该优先级已满时抛出 asyncio.QueueFull"""
+        tail = self._tails[level]
+        if tail - self._heads[level] >= self._capacity:
+            raise asyncio.QueueFull
+        self._buffers[level][tail & self._mask] = item
+        if self._times is not None:
+            self._times[level][tail & self._mask] = time.monotonic()
+        self._tails[level] = tail + 1
+        self._size += 1
+        self._not_empty.set()
+
+    async def put(self, item: Any, level: int) -> None:
+        """放入指定优先级，已满时等待出队腾出空间"""
+        while self._tails[level] - self._heads[level] >= self._capacity:
+            self._not_full.clear()
+            await self._not_full.wait()
+        self.put_nowait(item, level)
+
+    async def get(self) -> Optional[Any]:
+        """取出下一个元素；队列关闭后返回 None"""
+        while True:
+            if self._closed:
+                return None
+            if self._size:
+                return self._pop(self._select_level())
+            self._not_empty.clear()
+            await self._not_empty.wait()
+
+    def _select_level(self) -> int:
+        """选择出队的优先级（调用前保证队列非空）"""
+        heads = self._heads
+        tails = self._tails
+
+        # 提权：最低优先级起，队首等待超时的优先出队（最高优先级无需提权）
+        if self._times is not None:
+            deadline = time.monotonic() - self._aging_threshold
+            for level in range(len(heads) - 1):
+                head = heads[level]
+                if head != tails[level] and self._times[level][head & self._mask] <= deadline:
+                    return level
+
+        # 按权重随机选择，选中的优先级为空时回退到最高的非空优先级
+        if self._cum_weights is not None:
+            cum_weights = self._cum_weights
+            level = bisect.bisect(cum_weights, random.random() * cum_weights[-1])
+            if heads[level] != tails[level]:
+                return level
+
+        for level in range(len(heads) - 1, -1, -1):
+            if heads[level] != tails[level]:
+                return level
+        raise asyncio.QueueEmpty
+
+    def _pop(self, level: int) -> Any:
+        """从指定优先级的队首取出元素"""
+        head = self._heads[level]
+        index = head & self._mask
+        buffer = self._buffers[level]
+        item = buffer[index]
+        buffer[index] = None
+        self._heads[level] = head + 1
+        self._size -= 1
+        self._not_full.set()
+        return item
+
+    def open(self) -> None:
+        """重新开放队列"""
+        self._closed = False
+
+    def close(self) -> None:
+        """关闭队列并唤醒所有等待 get() 的协程"""
+        self._closed = True
+        self._not_empty.set()
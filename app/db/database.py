@@ -4,12 +4,17 @@
 提供数据库连接功能，包括MySQL和SSH隧道。
 """
 
+import asyncio
+import time
 from contextlib import asynccontextmanager
-from typing import Dict, Any
+from contextvars import ContextVar
+from typing import Dict, Any, Optional, Tuple
 
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool
 from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.config import settings
 from app.core.logger import get_logger
@@ -18,6 +23,23 @@ from app.db import ssh_tunnel
 
 logger = get_logger(__name__)
 
+# 健康检查结果缓存时间（秒），只缓存健康结果
+DB_HEALTH_CACHE_TTL = 5.0
+
+
+class RequestSessionScope:
+    """请求级只读会话作用域：首次取只读会话时创建，仅在创建作用域的任务内复用"""
+
+    __slots__ = ("owner", "session")
+
+    def __init__(self, owner: Optional[asyncio.Task]) -> None:
+        self.owner = owner
+        self.session: Optional[AsyncSession] = None
+
+
+# 当前请求的会话作用域，由 DBSessionMiddleware 设置并在请求结束后关闭会话
+ctx_session: ContextVar[Optional[RequestSessionScope]] = ContextVar("ctx_session", default=None)
+
 
 class Base(DeclarativeBase):
     """SQLAlchemy 声明式基类"""
@@ -33,6 +55,9 @@ class Database:
         self.async_session_factory = None
         self.ssh_tunnel = None
         self._initialized = False
+        self._health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        # 合并并发的健康检查，同一时刻只有一个探测查询
+        self._health_lock = asyncio.Lock()
 
     async def initialize(self) -> bool:
         """初始化数据库连接"""
@@ -58,17 +83,28 @@ class Database:
                     f"{settings.db_port}/{settings.db_name}?charset=utf8mb4"
                 )
 
+            # 连接池参数；前置外部连接池时由其负责复用，应用侧不再持有连接
+            if settings.db_external_pool:
+                pool_kwargs: Dict[str, Any] = {"poolclass": NullPool}
+            else:
+                pool_kwargs = {
+                    "pool_size": settings.db_pool_size,
+                    "max_overflow": settings.db_max_overflow,
+                    "pool_timeout": settings.db_pool_timeout,
+                    "pool_pre_ping": settings.db_pool_pre_ping,
+                    # LIFO 复用最近归还的连接，空闲连接可被回收
+                    "pool_use_lifo": True,
+                    "pool_recycle": settings.db_pool_recycle,
+                }
+
             # 创建异步引擎
             self.engine = create_async_engine(
                 database_url,
                 echo=False,
-                pool_size=20,
-                max_overflow=30,
-                pool_pre_ping=True,
-                pool_recycle=3600,
                 connect_args={
                     "connect_timeout": 10,
-                }
+                },
+                **pool_kwargs,
             )
 
             # 创建会话工厂
@@ -79,11 +115,19 @@ class Database:
             )
 
             # 测试连接
-            async with self.get_session() as session:
+            async with self.get_readonly_session() as session:
                 await session.execute(text("SELECT 1"))
 
             self._initialized = True
-            logger.info("Database connection initialized successfully")
+            if settings.db_external_pool:
+                logger.info("Database connection initialized successfully (external pool, NullPool)")
+            else:
+                logger.info(
+                    "Database connection initialized successfully "
+                    "(pool_size=%s, max_overflow=%s, pool_timeout=%s, pool_recycle=%s, pre_ping=%s)",
+                    settings.db_pool_size, settings.db_max_overflow, settings.db_pool_timeout,
+                    settings.db_pool_recycle, settings.db_pool_pre_ping,
+                )
             return True
 
         except (DatabaseConnectionError, ConnectionError, TimeoutError) as e:
@@ -102,15 +146,36 @@ class Database:
             self.ssh_tunnel = None
 
         self._initialized = False
+        self._health_cache = None
 
     async def shutdown(self):
         """关闭服务（符合依赖注入容器接口）"""
         await self.close()
         logger.info("Database service shutdown completed")
 
+    def _request_session(self) -> Optional[AsyncSession]:
+        """返回当前请求可复用的只读会话；不在请求作用域内或位于并发子任务中时返回 None"""
+        scope = ctx_session.get()
+        # gather 等创建的子任务会继承上下文，同一会话不能被并发使用
+        if scope is None or scope.owner is not asyncio.current_task():
+            return None
+        if scope.session is None:
+            scope.session = self.async_session_factory()
+        return scope.session
+
+    async def _end_request_read(self) -> None:
+        """结束请求级只读会话的当前事务，使其后的查询能看到刚提交的写入（可重复读隔离级别下快照在事务内固定）"""
+        scope = ctx_session.get()
+        if scope is not None and scope.session is not None and scope.session.in_transaction():
+            await scope.session.rollback()
+
     @asynccontextmanager
     async def get_session(self):
-        """获取数据库会话"""
+        """获取数据库会话（成功退出时提交事务，用于写操作）
+
+        每个写会话独立持有连接和事务，其中的 commit()/rollback() 只影响本会话，
+        不与请求级只读会话或同一请求内的其他写会话共享
+        """
         if not self.async_session_factory:
             raise RuntimeError("Database not initialized")
 
@@ -123,28 +188,67 @@ class Database:
                 raise
             finally:
                 await session.close()
+        await self._end_request_read()
+
+    @asynccontextmanager
+    async def get_readonly_session(self):
+        """获取只读数据库会话（不提交事务，仅用于查询；请求内复用同一会话）"""
+        if not self.async_session_factory:
+            raise RuntimeError("Database not initialized")
+
+        shared = self._request_session()
+        if shared is not None:
+            try:
+                yield shared
+            except Exception:
+                # 只读会话中没有写操作，回滚只结束出错的事务以便后续继续使用
+                await shared.rollback()
+                raise
+            return
+
+        async with self.async_session_factory() as session:
+            yield session
 
     async def health_check(self) -> Dict[str, Any]:
-        """数据库健康检查"""
-        try:
-            if not self._initialized:
-                return {
-                    "status": "not_initialized",
-                    "message": "Database service not initialized"
-                }
+        """数据库健康检查（健康结果短时缓存，并发检查共享同一次探测）"""
+        if not self._initialized:
+            return {
+                "status": "not_initialized",
+                "message": "Database service not initialized"
+            }
+
+        cached = self._health_cache
+        if cached is not None and time.monotonic() - cached[0] < DB_HEALTH_CACHE_TTL:
+            return cached[1]
 
-            async with self.get_session() as session:
-                result = await session.execute(text("SELECT 1"))
-                await result.fetchone()
+        async with self._health_lock:
+            # 等锁期间其他协程可能已完成探测
+            cached = self._health_cache
+            if cached is not None and time.monotonic() - cached[0] < DB_HEALTH_CACHE_TTL:
+                return cached[1]
+
+            result = await self._probe_health()
+            if result["status"] == "healthy":
+                self._health_cache = (time.monotonic(), result)
+            else:
+                self._health_cache = None
+            return result
+
+    async def _probe_health(self) -> Dict[str, Any]:
+        """执行一次数据库探测（直接借用连接 ping，不经过 ORM 会话与事务提交）"""
+        try:
+            async with self.engine.connect() as conn:
+                await conn.scalar(text("SELECT 1"))
 
             return {
                 "status": "healthy",
                 "message": "Database connection is working properly",
                 "initialized": self._initialized,
                 "engine_status": "connected" if self.engine else "disconnected",
+                "pool_status": self.engine.pool.status(),
                 "ssh_tunnel": "active" if self.ssh_tunnel else "inactive"
             }
-        except (ConnectionError, TimeoutError, RuntimeError) as e:
+        except (SQLAlchemyError, ConnectionError, TimeoutError, RuntimeError) as e:
             logger.error("Database health check failed: %s", e)
             return {
                 "status": "unhealthy",
@@ -9,6 +9,8 @@ import asyncssh
 from app.core.config import settings
 from app.core.logger import get_logger
 
+__all__ = ["SSHClient"]
+
 logger = get_logger(__name__)
 
 
@@ -45,7 +47,14 @@ class SSHClient:
                 "port": self.ssh_port,
                 "username": self.ssh_username,
                 "known_hosts": None,
+                # 数据库流量不压缩
+                "compression_algs": settings.ssh_compression_algs,
             }
+            # 算法列表会替换 asyncssh 的允许集合而非调整顺序，未配置时沿用其默认值（已优先 AEAD 加密）
+            if settings.ssh_encryption_algs:
+                connect_kwargs["encryption_algs"] = settings.ssh_encryption_algs
+            if settings.ssh_mac_algs:
+                connect_kwargs["mac_algs"] = settings.ssh_mac_algs
 
             # 记录连接详情（不包含密码）
             logger.info("Attempting SSH connection:")
@@ -65,7 +74,8 @@ class SSHClient:
             self.connection = await asyncssh.connect(**connect_kwargs)
             logger.info("SSH connection established successfully")
 
-            # 创建端口转发隧道
+            # 创建端口转发隧道（监听端接受的连接与 SSH 连接都是 asyncio TCP 传输，
+            # asyncio 已默认设置 TCP_NODELAY，无需额外调整套接字选项）
             logger.info("Creating port forward tunnel...")
             self.tunnel = await self.connection.forward_local_port(
                 "127.0.0.1",
@@ -82,21 +92,10 @@ class SSHClient:
             )
             return True
 
-        except asyncssh.PermissionDenied as e:
-            logger.error("SSH Permission denied: %s", e)
-            logger.error("Please check username and password/key")
-            await self.disconnect()
-            return False
-        except asyncssh.ConnectionLost as e:
-            logger.error("SSH Connection lost: %s", e)
-            await self.disconnect()
-            return False
-        except asyncssh.Error as e:
-            logger.error("SSH Error: %s", e)
-            await self.disconnect()
-            return False
-        except OSError as e:
-            logger.error("Network/OS Error: %s", e)
+        except (asyncssh.Error, OSError) as e:
+            logger.error("SSH tunnel setup failed (%s): %s", type(e).__name__, e)
+            if isinstance(e, asyncssh.PermissionDenied):
+                logger.error("Please check username and password/key")
             await self.disconnect()
             return False
 
@@ -0,0 +1,63 @@
+"""
+自定义数据库列类型
+
+CompressedText：长文本压缩后以二进制存储，存储格式与 MySQL COMPRESS() 一致，
+可直接用 UNCOMPRESS() 查看，存量数据也可在 SQL 中用 COMPRESS() 迁移
+"""
+
+import struct
+import zlib
+from typing import Optional
+
+from sqlalchemy.dialects import mysql
+from sqlalchemy.types import LargeBinary, TypeDecorator
+
+__all__ = ["CompressedText"]
+
+# COMPRESS() 格式：4 字节小端未压缩长度 + zlib 数据
+_LENGTH_PREFIX = struct.Struct("<I")
+
+
+class CompressedText(TypeDecorator):
+    """以 zlib 压缩存储的文本列（MySQL 下为 MEDIUMBLOB）"""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "mysql":
+            return dialect.type_descriptor(mysql.MEDIUMBLOB())
+        return dialect.type_descriptor(LargeBinary())
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        if not value:
+            # 与 COMPRESS('') 一致
+            return b""
+        data = value.encode("utf-8")
+        return _LENGTH_PREFIX.pack(len(data)) + zlib.compress(data)
+
+    def process_result_value(self, value: Optional[bytes], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        if not value:
+            return ""
+        data = _uncompress(value)
+        if data is None:
+            # 迁移前写入、未经 COMPRESS() 转换的存量明文
+            return value.decode("utf-8") if isinstance(value, bytes) else value
+        return data.decode("utf-8")
+
+
+def _uncompress(value) -> Optional[bytes]:
+    """按 COMPRESS() 格式解压，不是该格式（长度前缀与解压结果不符或非 zlib 数据）时返回 None"""
+    if not isinstance(value, bytes) or len(value) <= _LENGTH_PREFIX.size:
+        return None
+    (length,) = _LENGTH_PREFIX.unpack_from(value)
+    try:
+        # zlib.decompress 忽略 COMPRESS() 在末尾追加的 '.'
+        data = zlib.decompress(value[_LENGTH_PREFIX.size:])
+    except zlib.error:
+        return None
+    return data if len(data) == length else None
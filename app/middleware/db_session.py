@@ -0,0 +1,31 @@
+"""
+请求级数据库会话中间件
+
+每个 HTTP 请求共享一个只读数据库会话（首次使用时才创建），
+同一请求内多次查询只占用一个连接池连接；写会话各自独立提交
+"""
+
+import asyncio
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.db.database import RequestSessionScope, ctx_session
+
+
+class DBSessionMiddleware:
+    """为请求设置只读会话作用域，请求结束后关闭会话"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        session_scope = RequestSessionScope(asyncio.current_task())
+        token = ctx_session.set(session_scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            ctx_session.reset(token)
+            if session_scope.session is not None:
+                await session_scope.session.close()
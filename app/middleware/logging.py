@@ -1,3 +1,4 @@
+import logging
 import time
 from fastapi import Request
 from app.core.logger import logger
@@ -5,18 +6,18 @@ from app.core.logger import logger
 
 async def logging_middleware(request: Request, call_next):
     """Log request and response information"""
-    start_time = time.time()
-    
-    # Log request
-    logger.info(f"Request: {request.method} {request.url}")
-    
+    if not logger.isEnabledFor(logging.INFO):
+        return await call_next(request)
+
+    start_time = time.perf_counter()
+
+    # Log request (path only: skips query-string formatting and keeps parameters out of logs)
+    logger.info("Request: %s %s", request.method, request.url.path)
+
     # Process request
     response = await call_next(request)
-    
-    # Calculate processing time
-    process_time = time.time() - start_time
-    
+
     # Log response
-    logger.info(f"Response: {response.status_code} - {process_time:.4f}s")
-    
+    logger.info("Response: %s - %.4fs", response.status_code, time.perf_counter() - start_time)
+
     return response
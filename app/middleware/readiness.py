@@ -0,0 +1,36 @@
+"""
+服务就绪检查中间件
+
+服务容器初始化成功前，除健康检查等路径外的请求直接返回 503，
+依赖注入函数因此无需在每次请求时检查容器状态
+"""
+
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.core import dependencies
+from app.schemas.base import ResponseBuilder
+
+# 服务未就绪时仍放行的路径
+READINESS_EXEMPT_PATHS = frozenset({"/", "/health", "/docs", "/redoc", "/openapi.json"})
+
+SERVICE_UNAVAILABLE = 503
+
+
+class ReadinessMiddleware:
+    """服务未就绪时在路由前拒绝请求（纯 ASGI 实现，就绪后只多一次布尔判断）"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            not dependencies.SERVICES_READY
+            and scope["type"] == "http"
+            and scope["path"] not in READINESS_EXEMPT_PATHS
+        ):
+            response_data = ResponseBuilder.error(message="Services not initialized", code=SERVICE_UNAVAILABLE)
+            response = ORJSONResponse(status_code=SERVICE_UNAVAILABLE, content=response_data.model_dump())
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
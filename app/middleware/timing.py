@@ -0,0 +1,52 @@
+"""
+请求耗时分段统计中间件
+
+记录每个请求内各阶段（数据库、校验等）的耗时，
+通过 Server-Timing 响应头返回并写入调试日志
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+from fastapi import Request
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 当前请求的分段耗时（毫秒），由中间件创建
+_request_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar("request_timings", default=None)
+
+
+@contextmanager
+def timing_span(name: str) -> Iterator[None]:
+    """统计代码块耗时并累加到当前请求的分段耗时中"""
+    timings = _request_timings.get()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if timings is not None:
+            timings[name] = timings.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+
+async def timing_middleware(request: Request, call_next):
+    """记录请求总耗时与各阶段耗时"""
+    timings: Dict[str, float] = {}
+    token = _request_timings.set(timings)
+    start = time.perf_counter()
+    try:
+        response = await call_next(request)
+    finally:
+        _request_timings.reset(token)
+
+    total_ms = (time.perf_counter() - start) * 1000
+    # 未单独统计的部分（依赖注入、序列化、中间件等）
+    timings["other"] = max(total_ms - sum(timings.values()), 0.0)
+
+    metrics = [f"{name};dur={value:.2f}" for name, value in timings.items()]
+    metrics.append(f"total;dur={total_ms:.2f}")
+    response.headers["Server-Timing"] = ", ".join(metrics)
+
+    logger.debug("Timing: %s %s %s", request.method, request.url.path, response.headers["Server-Timing"])
+    return response
@@ -5,11 +5,31 @@
 """
 
 from datetime import datetime, date
-from sqlalchemy import BigInteger, String, Date, SmallInteger, Index, UniqueConstraint, func
-from sqlalchemy.types import DECIMAL
+from typing import Any, Dict, List, Optional
+from sqlalchemy import BigInteger, Integer, String, Date, SmallInteger, Index, UniqueConstraint, func
+from sqlalchemy.dialects import mysql
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column
 from app.db.database import Base
 
+# 次数类字段（每日呼叫数、时长分段计数）取值远小于 INT 上限，MySQL 下使用 INT UNSIGNED
+COUNT_INTEGER = Integer().with_variant(mysql.INTEGER(unsigned=True), "mysql")
+
+# 批量 upsert 每条语句的最大行数，避免单条语句超过 max_allowed_packet
+UPSERT_BATCH_SIZE = 500
+
+# 以基点（1/100 个百分点，0-10000）存储的比率字段，对外仍以百分比访问
+RATE_FIELDS = ("connection_rate", "outbound_connection_rate", "inbound_connection_rate")
+
+
+def percent_to_bp(value: Optional[float]) -> int:
+    """百分比转换为基点（未提供比率时按 0 存储，与列默认值一致）"""
+    if value is None:
+        return 0
+    return round(value * 100)
+
 
 class AdvisorCallDurationStats(Base):
     """顾问通话时长统计表模型"""
@@ -24,53 +44,53 @@ class AdvisorCallDurationStats(Base):
     device_id: Mapped[str] = mapped_column(String(50), nullable=False, comment="设备ID")
 
     # 总体统计
-    total_calls: Mapped[int] = mapped_column(BigInteger, default=0, comment="总呼叫记录数")
-    total_connected: Mapped[int] = mapped_column(BigInteger, default=0, comment="总接通数目")
-    total_unconnected: Mapped[int] = mapped_column(BigInteger, default=0, comment="未接通总数")
+    total_calls: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="总呼叫记录数")
+    total_connected: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="总接通数目")
+    total_unconnected: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="未接通总数")
     total_duration: Mapped[int] = mapped_column(BigInteger, default=0, comment="总通话时长(秒)")
     total_duration_correction: Mapped[int] = mapped_column(BigInteger, default=0, comment="总通话时长修正值(秒)")
-    connection_rate: Mapped[float] = mapped_column(DECIMAL(5, 2), default=0.00, comment="接通率(%)")
+    connection_rate_bp: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=0, comment="接通率(基点, 1/100%)")
 
     # 呼出统计
-    outbound_calls: Mapped[int] = mapped_column(BigInteger, default=0, comment="总呼出记录")
-    outbound_connected: Mapped[int] = mapped_column(BigInteger, default=0, comment="呼出接通数目")
-    outbound_unconnected: Mapped[int] = mapped_column(BigInteger, default=0, comment="呼出未接通数")
+    outbound_calls: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="总呼出记录")
+    outbound_connected: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="呼出接通数目")
+    outbound_unconnected: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="呼出未接通数")
     outbound_duration: Mapped[int] = mapped_column(BigInteger, default=0, comment="呼出总通话时长(秒)")
-    outbound_connection_rate: Mapped[float] = mapped_column(DECIMAL(5, 2), default=0.00, comment="呼出接通率(%)")
+    outbound_connection_rate_bp: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=0, comment="呼出接通率(基点, 1/100%)")
 
     # 呼入统计
-    inbound_calls: Mapped[int] = mapped_column(BigInteger, default=0, comment="总呼入记录")
-    inbound_connected: Mapped[int] = mapped_column(BigInteger, default=0, comment="呼入接通数目")
-    inbound_unconnected: Mapped[int] = mapped_column(BigInteger, default=0, comment="呼入未接通数")
+    inbound_calls: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="总呼入记录")
+    inbound_connected: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="呼入接通数目")
+    inbound_unconnected: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="呼入未接通数")
     inbound_duration: Mapped[int] = mapped_column(BigInteger, default=0, comment="呼入总通话时长(秒)")
-    inbound_connection_rate: Mapped[float] = mapped_column(DECIMAL(5, 2), default=0.00, comment="呼入接通率(%)")
+    inbound_connection_rate_bp: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=0, comment="呼入接通率(基点, 1/100%)")
 
     # 通话时长分段统计(总体) - 修正字段名匹配API
-    duration_under_5s: Mapped[int] = mapped_column(BigInteger, default=0, comment="通话时长<5秒总数")
-    duration_5s_to_10s: Mapped[int] = mapped_column(BigInteger, default=0, comment="通话时长5-10秒总数")
-    duration_10s_to_20s: Mapped[int] = mapped_column(BigInteger, default=0, comment="通话时长10-20秒总数")
-    duration_20s_to_30s: Mapped[int] = mapped_column(BigInteger, default=0, comment="通话时长20-30秒总数")
-    duration_30s_to_45s: Mapped[int] = mapped_column(BigInteger, default=0, comment="通话时长30-45秒总数")
-    duration_45s_to_60s: Mapped[int] = mapped_column(BigInteger, default=0, comment="通话时长45-60秒总数")
-    duration_over_60s: Mapped[int] = mapped_column(BigInteger, default=0, comment="通话时长大于60秒总数")
+    duration_under_5s: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="通话时长<5秒总数")
+    duration_5s_to_10s: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="通话时长5-10秒总数")
+    duration_10s_to_20s: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="通话时长10-20秒总数")
+    duration_20s_to_30s: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="通话时长20-30秒总数")
+    duration_30s_to_45s: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="通话时长30-45秒总数")
+    duration_45s_to_60s: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="通话时长45-60秒总数")
+    duration_over_60s: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="通话时长大于60秒总数")
 
     # 呼出通话时长分段统计 - 修正字段名匹配API
-    outbound_duration_under_5s: Mapped[int] = mapped_column(BigInteger, default=0, comment="呼出通话时长<5秒")
-    outbound_duration_5s_to_10s: Mapped[int] = mapped_column(BigInteger, default=0, comment="呼出通话时长5-10秒")
-    outbound_duration_10s_to_20s: Mapped[int] = mapped_column(BigInteger, default=0, comment="呼出通话时长10-20秒")
-    outbound_duration_20s_to_30s: Mapped[int] = mapped_column(BigInteger, default=0, comment="呼出通话时长20-30秒")
-    outbound_duration_30s_to_45s: Mapped[int] = mapped_column(BigInteger, default=0, comment="呼出通话时长30-45秒")
-    outbound_duration_45s_to_60s: Mapped[int] = mapped_column(BigInteger, default=0, comment="呼出通话时长45-60秒")
-    outbound_duration_over_60s: Mapped[int] = mapped_column(BigInteger, default=0, comment="呼出通话时长大于60秒")
+    outbound_duration_under_5s: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="呼出通话时长<5秒")
+    outbound_duration_5s_to_10s: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="呼出通话时长5-10秒")
+    outbound_duration_10s_to_20s: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="呼出通话时长10-20秒")
+    outbound_duration_20s_to_30s: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="呼出通话时长20-30秒")
+    outbound_duration_30s_to_45s: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="呼出通话时长30-45秒")
+    outbound_duration_45s_to_60s: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="呼出通话时长45-60秒")
+    outbound_duration_over_60s: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="呼出通话时长大于60秒")
 
     # 呼入通话时长分段统计 - 修正字段名匹配API
-    inbound_duration_under_5s: Mapped[int] = mapped_column(BigInteger, default=0, comment="呼入通话时长<5秒")
-    inbound_duration_5s_to_10s: Mapped[int] = mapped_column(BigInteger, default=0, comment="呼入通话时长5-10秒")
-    inbound_duration_10s_to_20s: Mapped[int] = mapped_column(BigInteger, default=0, comment="呼入通话时长10-20秒")
-    inbound_duration_20s_to_30s: Mapped[int] = mapped_column(BigInteger, default=0, comment="呼入通话时长20-30秒")
-    inbound_duration_30s_to_45s: Mapped[int] = mapped_column(BigInteger, default=0, comment="呼入通话时长30-45秒")
-    inbound_duration_45s_to_60s: Mapped[int] = mapped_column(BigInteger, default=0, comment="呼入通话时长45-60秒")
-    inbound_duration_over_60s: Mapped[int] = mapped_column(BigInteger, default=0, comment="呼入通话时长大于60秒")
+    inbound_duration_under_5s: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="呼入通话时长<5秒")
+    inbound_duration_5s_to_10s: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="呼入通话时长5-10秒")
+    inbound_duration_10s_to_20s: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="呼入通话时长10-20秒")
+    inbound_duration_20s_to_30s: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="呼入通话时长20-30秒")
+    inbound_duration_30s_to_45s: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="呼入通话时长30-45秒")
+    inbound_duration_45s_to_60s: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="呼入通话时长45-60秒")
+    inbound_duration_over_60s: Mapped[int] = mapped_column(COUNT_INTEGER, default=0, comment="呼入通话时长大于60秒")
 
     # 指标相关字段
     goal: Mapped[int] = mapped_column(BigInteger, default=7200, comment="今日指标")
@@ -87,6 +107,63 @@ class AdvisorCallDurationStats(Base):
         Index("idx_stats_date", "stats_date"),
     )
 
+    # 比率按百分比读写，实际存储为基点
+    @hybrid_property
+    def connection_rate(self) -> float:
+        """接通率(%)"""
+        return self.connection_rate_bp / 100
+
+    @connection_rate.inplace.setter
+    def _connection_rate_setter(self, value: Optional[float]) -> None:
+        self.connection_rate_bp = percent_to_bp(value)
+
+    @hybrid_property
+    def outbound_connection_rate(self) -> float:
+        """呼出接通率(%)"""
+        return self.outbound_connection_rate_bp / 100
+
+    @outbound_connection_rate.inplace.setter
+    def _outbound_connection_rate_setter(self, value: Optional[float]) -> None:
+        self.outbound_connection_rate_bp = percent_to_bp(value)
+
+    @hybrid_property
+    def inbound_connection_rate(self) -> float:
+        """呼入接通率(%)"""
+        return self.inbound_connection_rate_bp / 100
+
+    @inbound_connection_rate.inplace.setter
+    def _inbound_connection_rate_setter(self, value: Optional[float]) -> None:
+        self.inbound_connection_rate_bp = percent_to_bp(value)
+
+    @classmethod
+    async def bulk_upsert(cls, session: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+        """
+        按唯一键 (advisor_id, stats_date) 批量插入或更新
+
+        使用多行 INSERT ... ON DUPLICATE KEY UPDATE，每 UPSERT_BATCH_SIZE 行一条语句，
+        逐条循环写入统计时应改用此方法。rows 的字段集合需一致，比率字段按百分比传入；
+        更新时已有的修正值叠加到 total_duration，不提交事务
+        """
+        rate_fields = [name for name in RATE_FIELDS if rows and name in rows[0]]
+        if rate_fields:
+            rows = [dict(row) for row in rows]
+            for row in rows:
+                for name in rate_fields:
+                    row[f"{name}_bp"] = percent_to_bp(row.pop(name))
+
+        for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+            batch = rows[start:start + UPSERT_BATCH_SIZE]
+            stmt = mysql_insert(cls).values(batch)
+            update_columns = {
+                name: stmt.inserted[name]
+                for name in batch[0]
+                if name not in ("advisor_id", "stats_date")
+            }
+            if "total_duration" in update_columns:
+                update_columns["total_duration"] = stmt.inserted.total_duration + cls.total_duration_correction
+            update_columns["updated_at"] = datetime.now()
+            await session.execute(stmt.on_duplicate_key_update(**update_columns))
+
 
 class AdvisorDeviceConfig(Base):
     """顾问设备配置表模型"""
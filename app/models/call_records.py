@@ -9,6 +9,7 @@ from typing import Optional
 from sqlalchemy import BigInteger, String, DateTime, SmallInteger, Integer, Boolean, Text, Index, func
 from sqlalchemy.orm import Mapped, mapped_column
 from app.db.database import Base
+from app.db.types import CompressedText
 
 
 class CallRecords(Base):
@@ -47,7 +48,7 @@ class CallRecords(Base):
     advisor_id: Mapped[Optional[int]] = mapped_column(SmallInteger, comment="通话顾问ID")
     advisor_group_id: Mapped[Optional[int]] = mapped_column(SmallInteger, comment="所属顾问组ID")
     advisor_group_sub_id: Mapped[Optional[int]] = mapped_column(SmallInteger, comment="所属顾问组子ID")
-    conversation_content: Mapped[Optional[str]] = mapped_column(Text, comment="对话记录：包含对话内容、关键信息提取、客户需求等")
+    conversation_content: Mapped[Optional[str]] = mapped_column(CompressedText, comment="对话记录（COMPRESS 格式压缩存储）：包含对话内容、关键信息提取、客户需求等")
     call_summary: Mapped[Optional[str]] = mapped_column(Text, comment="通话总结：顾问填写的通话要点和后续跟进计划")
     call_quality_score: Mapped[Optional[int]] = mapped_column(SmallInteger, comment="通话质量评分：1-100分，用于质检评估")
     quality_notes: Mapped[Optional[str]] = mapped_column(Text, comment="质检备注：质检人员的评价和建议")
@@ -21,6 +21,11 @@ class EventType(Enum):
     CALL_RECORDS_SAVE_AUTO_UPLOAD = "call_records.save_auto_upload"
     GENERATE_ADVISOR_ANALYSIS_REPORT_TASK = "generate.advisor.analysis.report.task"
 
+    def __init__(self, _value: str) -> None:
+        # 按定义顺序分配的稠密整数编号，事件总线据此按下标分发，避免枚举哈希查找；
+        # 字符串值保持不变，调度器仍可通过 EventType(task_name) 按值构造
+        self.index = len(type(self).__members__)
+
 class EventPriority(Enum):
     """事件优先级"""
     LOW = 0
@@ -43,7 +48,7 @@ class Event(BaseModel):
     """事件"""
     type: Annotated[EventType, Field(description="事件类型")]
     data: Annotated[Optional[Any], Field(default=None, description="事件数据")]
-    event_id: Annotated[Optional[str], Field(default_factory=lambda: str(uuid.uuid4()), description="事件ID")]
+    event_id: Annotated[Optional[str], Field(default_factory=lambda: uuid.uuid4().hex, description="事件ID")]
     created_at: Annotated[datetime, Field(default_factory=datetime.now, description="事件创建时间")]
     priority: Annotated[EventPriority, Field(default=EventPriority.NORMAL, description="事件优先级")]
     wait_for_result: Annotated[bool, Field(default=settings.default_wait_for_result, description="是否等待结果")]
@@ -60,6 +65,9 @@ class Event(BaseModel):
     error_message: Annotated[Optional[str], Field(default=None, description="错误信息")]
     processing_start_time: Annotated[Optional[datetime], Field(default=None, description="事件处理开始时间")]
     processing_end_time: Annotated[Optional[datetime], Field(default=None, description="事件处理结束时间")]
+    # 处理耗时按 time.monotonic 计算，仅供事件总线内部统计，不参与序列化
+    processing_monotonic_start: Annotated[Optional[float], Field(default=None, exclude=True, description="处理开始的单调时钟读数")]
+    processing_seconds: Annotated[Optional[float], Field(default=None, exclude=True, description="处理耗时（秒）")]
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -92,7 +100,8 @@ class EventListener(BaseModel):
     active_count: Annotated[int, Field(default=0, description="活跃计数")]
     total_processed: Annotated[int, Field(default=0, description="处理总数")]
     total_failed: Annotated[int, Field(default=0, description="失败总数")]
-    semaphore: Annotated[asyncio.Semaphore, Field(default=asyncio.Semaphore(settings.worker_count), exclude=True, description="信号量")]
+    is_coroutine: Annotated[bool, Field(default=False, exclude=True, description="处理函数是否为协程函数（注册时确定）")]
+    semaphore: Annotated[Optional[asyncio.Semaphore], Field(default=asyncio.Semaphore(settings.worker_count), exclude=True, description="信号量")]
     created_at: Annotated[datetime, Field(default_factory=datetime.now, description="创建时间")]
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -1,16 +1,18 @@
 # app/models/call_record.py
 """电话记录数据类"""
 import uuid
+from dataclasses import dataclass, field
 from typing import List, Annotated
 from datetime import datetime
 from pydantic import BaseModel, Field
 
 
-class DialogEntry(BaseModel):
-    """对话记录数据类"""
-    speaker: Annotated[str, Field(description="说话人标识")]
-    content: Annotated[str, Field(description="对话内容")]
-    timestamp: Annotated[datetime, Field(default_factory=datetime.now, description="对话时间戳")]
+@dataclass(slots=True, frozen=True)
+class DialogEntry:
+    """对话记录数据类（每通电话大量创建，使用 slots 数据类，作为字段时仍由 Pydantic 校验和序列化）"""
+    speaker: str  # 说话人标识
+    content: str  # 对话内容
+    timestamp: datetime = field(default_factory=datetime.now)  # 对话时间戳
 
 class DialogRecord(BaseModel):
     """对话记录数据类"""
@@ -19,7 +21,7 @@ class DialogRecord(BaseModel):
 
 class CallRecord(BaseModel):
     """电话记录数据类"""
-    call_id: Annotated[str, Field(default_factory=lambda: str(uuid.uuid4()), description="通话唯一标识")]
+    call_id: Annotated[str, Field(default_factory=lambda: uuid.uuid4().hex, description="通话唯一标识")]
     phone_number: Annotated[str | None, Field(default=None, description="电话号码")]
     tts_opening: Annotated[str | None, Field(default=None, description="TTS开场白")]
     custom_id: Annotated[str | None, Field(default=None, description="自定义标识")]
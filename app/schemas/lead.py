@@ -69,16 +69,20 @@ class LeadResponse(LeadBase):
 class LeadListResponse(BaseModel):
     """线索列表响应 Schema"""
     items: Annotated[List[LeadResponse], Field(..., description="线索列表")]
-    total: Annotated[int, Field(..., description="总数量")]
+    total: Annotated[Optional[int], Field(None, description="总数量（with_total=false 时不统计）")]
     page: Annotated[int, Field(..., description="当前页码")]
     size: Annotated[int, Field(..., description="每页数量")]
-    pages: Annotated[int, Field(..., description="总页数")]
+    pages: Annotated[Optional[int], Field(None, description="总页数（with_total=false 时不统计）")]
+    has_more: Annotated[bool, Field(False, description="是否还有下一页")]
+    next_cursor: Annotated[Optional[str], Field(None, description="下一页游标（按创建时间排序时返回）")]
 
 
 class LeadQueryParams(BaseModel):
     """线索查询参数 Schema"""
     page: Annotated[int, Field(1, ge=1, description="页码，从1开始")]
     size: Annotated[int, Field(10, ge=1, le=100, description="每页数量，最大100")]
+    cursor: Annotated[Optional[str], Field(None, description="分页游标（上一页返回的 next_cursor），传入时按创建时间键集分页并忽略 page 和排序字段")]
+    with_total: Annotated[bool, Field(True, description="是否统计总数，深分页时关闭可跳过 COUNT 查询")]
 
     # 基础分类信息
     category_id: Annotated[Optional[int], Field(None, description="线索类型ID")]
@@ -79,4 +79,5 @@ ScheduledTaskListResponse = ResponseData[List[ScheduledTaskResponse]]
 ScheduledTaskDetailResponse = ResponseData[ScheduledTaskResponse]
 TaskExecutionLogListResponse = ResponseData[List[TaskExecutionLogResponse]]
 TaskExecutionLogDetailResponse = ResponseData[TaskExecutionLogResponse]
-TaskExecutionLogCreateResponse = ResponseData[TaskExecutionLogResponse]
+# 执行日志批量写入，创建接口返回写入的日志数据（不含自增ID）
+TaskExecutionLogCreateResponse = ResponseData[TaskExecutionLogCreate]
@@ -5,7 +5,7 @@ AI顾问统计服务层
 """
 
 from datetime import date
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from sqlalchemy import select, and_, func
 from app.core.event_bus import ProductionEventBus
 from app.db.database import Database
@@ -34,7 +34,7 @@ class AiTeleStatusService(BaseService):
         await self._register_listener(EventType.SEND_AI_ADVISOR_STATS_WECHAT_REPORT_TASK, self.send_ai_advisor_stats_wechat_report_task)
 
     async def get_merged_ai_advisor_stats_by_date(
-        self, stats_date: date = date.today()
+        self, stats_date: Optional[date] = None
     ) -> Dict[str, Any]:
         """
         合并所有AI顾问（group_id=2）的统计数据，生成一条agent顾问今日数据
@@ -45,20 +45,11 @@ class AiTeleStatusService(BaseService):
         Returns:
             Dict[str, Any]: 合并后的统计数据
         """
-        async with self.database.get_session() as db_session:
+        # 默认值在调用时计算，避免导入时固定日期
+        stats_date = stats_date or date.today()
+        async with self.database.get_readonly_session() as db_session:
             try:
-                # 先获取group_id为2的所有顾问ID
-                advisor_ids_result = await db_session.execute(
-                    select(Advisors.id)
-                    .where(Advisors.group_id == 2)
-                )
-                advisor_ids = [row[0] for row in advisor_ids_result.fetchall()]
-                
-                if not advisor_ids:
-                    logger.warning("AI顾问组（group_id=2）中没有找到任何顾问")
-                    return self._create_empty_merged_stats(stats_date)
-                
-                # 聚合所有AI顾问的统计数据
+                # 关联顾问表，一次查询聚合所有AI顾问（group_id=2）的统计数据
                 result = await db_session.execute(
                     select(
                         func.sum(AdvisorCallDurationStats.total_calls).label('total_calls'),
@@ -68,10 +59,11 @@ class AiTeleStatusService(BaseService):
                         func.sum(AdvisorCallDurationStats.duration_20s_to_30s).label('duration_20s_to_30s'),
                         func.count(AdvisorCallDurationStats.advisor_id).label('advisor_count') # pylint: disable=not-callable
                     )
+                    .join(Advisors, Advisors.id == AdvisorCallDurationStats.advisor_id)
                     .where(
                         and_(
                             AdvisorCallDurationStats.stats_date == stats_date,
-                            AdvisorCallDurationStats.advisor_id.in_(advisor_ids)
+                            Advisors.group_id == 2
                         )
                     )
                 )
@@ -9,7 +9,7 @@ import asyncio
 from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
 from datetime import date, datetime
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, and_, func, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.events import Event, EventType
 from app.core.event_bus import ProductionEventBus
@@ -37,12 +37,12 @@ logger = get_logger(__name__)
 class Aiboxservice(BaseService):
     """aiox 服务类"""
 
-    def __init__(self, event_bus: ProductionEventBus, database: Database, call_records_service: Optional[CallRecordsService] = None):
+    def __init__(self, event_bus: ProductionEventBus, database: Database, call_records_service: Optional[CallRecordsService] = None, cloud_service: Optional[CloudService] = None):
         super().__init__(event_bus=event_bus, service_name="AiBoxService")
         self.database = database
         self.call_records_service = call_records_service
         self.event_bus = event_bus
-        self.cloud_service = CloudService()
+        self.cloud_service = cloud_service or CloudService()
         self._thread_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="advisor_analysis")
 
     async def initialize(self) -> bool:
@@ -137,11 +137,76 @@ class Aiboxservice(BaseService):
                 logger.error("更新或插入顾问通话时长统计失败: %s", e)
                 raise
 
+    async def batch_upsert_advisor_call_duration_stats(
+        self, stats_list: list[AdvisorCallDurationStatsUpdateRequestWithDeviceIdAndStatsDate]
+    ) -> list[AdvisorCallDurationStats]:
+        """
+        批量更新或插入顾问通话时长统计
+
+        使用 INSERT ... ON DUPLICATE KEY UPDATE 按 UNIQUE KEY (advisor_id, stats_date) 合并，
+        相同字段集合的记录合并为一条语句执行；更新时保留已有修正值并叠加到 total_duration
+        """
+        if not stats_list:
+            return []
+
+        async with self.database.get_session() as db_session:
+            try:
+                # 一次查询取出所有设备对应的顾问
+                device_ids = {stats.device_id for stats in stats_list}
+                result = await db_session.execute(
+                    select(
+                        AdvisorDeviceConfig.device_id,
+                        AdvisorDeviceConfig.advisor_id,
+                        AdvisorDeviceConfig.advisor_name,
+                        AdvisorDeviceConfig.goal,
+                    ).where(AdvisorDeviceConfig.device_id.in_(device_ids))
+                )
+                advisor_by_device = {row.device_id: row for row in result.all()}
+
+                # 按字段集合分组，保证每条多行 INSERT 的列一致
+                groups: Dict[frozenset, list[Dict[str, Any]]] = {}
+                keys: list[tuple[int, date]] = []
+                for stats in stats_list:
+                    advisor = advisor_by_device.get(stats.device_id)
+                    if not advisor:
+                        logger.warning("设备ID %s 对应的顾问不存在，跳过", stats.device_id)
+                        continue
+
+                    row = stats.model_dump(exclude_unset=True)
+                    row["advisor_id"] = advisor.advisor_id
+                    row["advisor_name"] = advisor.advisor_name
+                    row["goal"] = advisor.goal
+                    row.pop("total_duration_correction", None)
+                    groups.setdefault(frozenset(row), []).append(row)
+                    keys.append((advisor.advisor_id, stats.stats_date))
+
+                if not keys:
+                    return []
+
+                for rows in groups.values():
+                    await AdvisorCallDurationStats.bulk_upsert(db_session, rows)
+
+                await db_session.commit()
+
+                result = await db_session.execute(
+                    select(AdvisorCallDurationStats)
+                    .where(tuple_(AdvisorCallDurationStats.advisor_id, AdvisorCallDurationStats.stats_date).in_(keys))
+                    .order_by(AdvisorCallDurationStats.advisor_id.asc())
+                )
+                upserted = list(result.scalars().all())
+                logger.info("成功批量更新或插入顾问通话时长统计: 提交=%d, 写入=%d", len(stats_list), len(upserted))
+                return upserted
+
+            except Exception as e:
+                await db_session.rollback()
+                logger.error("批量更新或插入顾问通话时长统计失败: %s", e)
+                raise
+
     async def get_advisor_call_duration_stats(
         self, advisor_id: int, stats_date: date
     ) -> Optional[AdvisorCallDurationStats]:
         """根据顾问ID和统计日期获取通话时长统计"""
-        async with self.database.get_session() as db_session:
+        async with self.database.get_readonly_session() as db_session:
             try:
                 return await self._get_stats_by_advisor_and_date(
                     db_session, advisor_id, stats_date
@@ -154,7 +219,7 @@ class Aiboxservice(BaseService):
         self, advisor_id: int, start_date: date, end_date: date
     ) -> list[AdvisorCallDurationStats]:
         """根据顾问ID和日期范围获取通话时长统计列表"""
-        async with self.database.get_session() as db_session:
+        async with self.database.get_readonly_session() as db_session:
             try:
                 result = await db_session.execute(
                     select(AdvisorCallDurationStats)
@@ -176,29 +241,30 @@ class Aiboxservice(BaseService):
         self, stats_date: date = date.today(), advisor_group_id: int = 1
     ) -> list[AdvisorCallDurationStats]:
         """获取指定日期的所有顾问通话时长统计"""
-        async with self.database.get_session() as db_session:
+        return await self.get_all_advisor_stats_by_dates([stats_date], advisor_group_id)
+
+    async def get_all_advisor_stats_by_dates(
+        self, stats_dates: list[date], advisor_group_id: int = 1
+    ) -> list[AdvisorCallDurationStats]:
+        """获取多个日期的所有顾问通话时长统计（按顾问组关联过滤，单次查询）"""
+        if not stats_dates:
+            return []
+
+        async with self.database.get_readonly_session() as db_session:
             try:
-                # 先获取指定顾问组的所有顾问ID
-                advisor_ids_result = await db_session.execute(
-                    select(Advisors.id)
-                    .where(Advisors.group_id == advisor_group_id)
-                )
-                advisor_ids = [row[0] for row in advisor_ids_result.fetchall()]
-                
-                if not advisor_ids:
-                    logger.warning("顾问组 %d 中没有找到任何顾问", advisor_group_id)
-                    return []
-                
-                # 根据顾问ID列表获取统计数据
                 result = await db_session.execute(
                     select(AdvisorCallDurationStats)
+                    .join(Advisors, Advisors.id == AdvisorCallDurationStats.advisor_id)
                     .where(
                         and_(
-                            AdvisorCallDurationStats.stats_date == stats_date,
-                            AdvisorCallDurationStats.advisor_id.in_(advisor_ids)
+                            Advisors.group_id == advisor_group_id,
+                            AdvisorCallDurationStats.stats_date.in_(stats_dates)
                         )
                     )
-                    .order_by(AdvisorCallDurationStats.advisor_id.asc())
+                    .order_by(
+                        AdvisorCallDurationStats.stats_date.asc(),
+                        AdvisorCallDurationStats.advisor_id.asc()
+                    )
                 )
                 return list(result.scalars().all())
             except Exception as e:  # pylint: disable=broad-except
@@ -407,19 +473,21 @@ class Aiboxservice(BaseService):
 
     async def generate_advisor_analysis_report_threaded(
         self, 
-        _: Event | None = None,
+        event: Event | None = None,
         target_date: Optional[date] = None
     ) -> Dict[int, str]:
         """
         使用线程池执行顾问分析报告生成任务
         
         Args:
-            event: 事件对象
+            event: 事件对象，data 中可携带 target_date
             target_date: 目标日期，默认为今天
             
         Returns:
             Dict[int, str]: 顾问ID到报告文件路径的映射
         """
+        if target_date is None and event is not None and isinstance(event.data, dict):
+            target_date = event.data.get("target_date")
         if target_date is None:
             target_date = date.today()
             
@@ -806,7 +874,7 @@ class Aiboxservice(BaseService):
 
     async def _get_existing_report(self, advisor_id: int, report_date: date) -> Optional[AdvisorAnalysisReport]:
         """获取现有的报告记录"""
-        async with self.database.get_session() as db_session:
+        async with self.database.get_readonly_session() as db_session:
             try:
                 result = await db_session.execute(
                     select(AdvisorAnalysisReport).where(
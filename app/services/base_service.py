@@ -60,8 +60,9 @@ class BaseService(ABC):
             return None
 
         try:
-            # 构造 Event 实例后发送，匹配事件总线的签名要求
-            event = Event(
+            # 构造 Event 实例后发送，匹配事件总线的签名要求；
+            # 参数均由服务代码给出，使用 model_construct 跳过校验，默认值照常填充
+            event = Event.model_construct(
                 type=event_type,
                 data=data,
                 priority=priority,
@@ -8,6 +8,7 @@ import json
 import time
 import uuid
 import asyncio
+from types import MappingProxyType
 from typing import Optional, Sequence, Dict, List
 from datetime import datetime, date
 from sqlalchemy import select, and_, func
@@ -29,7 +30,7 @@ from app.schemas.call_record import (
     CallRecordResponse,
     CallTypeEnum,
 )
-from app.schemas.file_record import CallRecordsRequest
+from app.schemas.file_record import CallRecordsRequest, CallType
 from app.models.events import EventType, EventPriority
 from app.core.logger import get_logger
 from app.utils.ai_judge_is_need2 import ai_analyze_call_quality
@@ -37,6 +38,9 @@ from app.utils.xunfei import transcribe_audio_xunfei
 
 logger = get_logger(__name__)
 
+# 上传接口通话类型到通话记录通话类型的映射，转换时一次字典查找
+_CALL_TYPE_TO_ENUM = MappingProxyType({call_type: CallTypeEnum(call_type.value) for call_type in CallType})
+
 
 class CallRecordsService(BaseService):
     """通话记录服务类"""
@@ -64,7 +68,7 @@ class CallRecordsService(BaseService):
 
     async def get_call_record_by_id(self, record_id: int) -> Optional[CallRecords]:
         """根据ID获取通话记录"""
-        async with self.database.get_session() as db_session:
+        async with self.database.get_readonly_session() as db_session:
             try:
                 result = await db_session.execute(
                     select(CallRecords).where(CallRecords.id == record_id)
@@ -76,7 +80,7 @@ class CallRecordsService(BaseService):
 
     async def get_call_record_by_uuid(self, record_uuid: str) -> Optional[CallRecords]:
         """根据UUID获取通话记录"""
-        async with self.database.get_session() as db_session:
+        async with self.database.get_readonly_session() as db_session:
             try:
                 result = await db_session.execute(
                     select(CallRecords).where(CallRecords.record_uuid == record_uuid)
@@ -139,7 +143,7 @@ class CallRecordsService(BaseService):
         self, query_params: CallRecordQueryParams
     ) -> CallRecordListResponse:
         """分页获取通话记录列表"""
-        async with self.database.get_session() as db_session:
+        async with self.database.get_readonly_session() as db_session:
             try:
                 # 构建查询条件
                 conditions = []
@@ -310,7 +314,7 @@ class CallRecordsService(BaseService):
         self, dev_id: str, limit: int = 10
     ) -> Sequence[CallRecords]:
         """根据设备ID获取通话记录列表"""
-        async with self.database.get_session() as db_session:
+        async with self.database.get_readonly_session() as db_session:
             try:
                 result = await db_session.execute(
                     select(CallRecords)
@@ -327,7 +331,7 @@ class CallRecordsService(BaseService):
         self, advisor_id: int, limit: int = 10
     ) -> Sequence[CallRecords]:
         """根据顾问ID获取通话记录列表"""
-        async with self.database.get_session() as db_session:
+        async with self.database.get_readonly_session() as db_session:
             try:
                 result = await db_session.execute(
                     select(CallRecords)
@@ -384,7 +388,7 @@ class CallRecordsService(BaseService):
 
     async def get_advisor_info_by_device_id(self, dev_id: str) -> Optional[dict]:
         """根据设备ID获取顾问信息"""
-        async with self.database.get_session() as db_session:
+        async with self.database.get_readonly_session() as db_session:
             try:
                 # 查询 advisor_device_config 表获取 advisor_id
                 config_result = await db_session.execute(
@@ -508,7 +512,7 @@ class CallRecordsService(BaseService):
         call_no = (
             upload_request.record.uuid
             if upload_request.record.uuid and upload_request.record.uuid.strip()
-            else f"CALL{int(time.time())}{str(uuid.uuid4())[:8]}"
+            else f"CALL{int(time.time())}{uuid.uuid4().hex[:8]}"
         )
 
         # 根据文件处理逻辑设置本地路径
@@ -577,7 +581,7 @@ class CallRecordsService(BaseService):
             begin_time=record.BeginTime,
             end_time=record.EndTime,
             time_len=record.TimeLen,
-            call_type=CallTypeEnum(record.Type.value),
+            call_type=_CALL_TYPE_TO_ENUM[record.Type],
             phone=record.Phone,
             dtmf_keys=record.DtmfKeys,
             ring_count=record.RingCount,
@@ -586,7 +590,7 @@ class CallRecordsService(BaseService):
             custom_id=record.CustomId,
             record_uuid=record.uuid
             if record.uuid and record.uuid.strip()
-            else str(uuid.uuid4()),
+            else uuid.uuid4().hex,
             upload_state=record.UploadState,
             # 存储信息
             local_path=local_path,
@@ -3,13 +3,20 @@
 """
 
 import os
+import asyncio
 import logging
+from typing import BinaryIO
 from qcloud_cos import CosConfig, CosS3Client  # type: ignore
 from app.core.config import settings
 from app.schemas.cloud_response import CloudUploadResponse, CloudDeleteResponse
 
 logger = logging.getLogger(__name__)
 
+# 流式上传的分块大小（MB），内存中仅驻留有限个分块
+STREAM_PART_SIZE_MB = 5
+# 流式上传的最大缓冲（MB）
+STREAM_MAX_BUFFER_MB = 10
+
 
 class CloudService:
     """腾讯云COS云存储服务"""
@@ -39,19 +46,21 @@ class CloudService:
 
     async def upload_file(
         self,
-        file_content: bytes,
+        file_content: bytes | BinaryIO,
         filename: str,
         path: str | None = None,
         content_type: str | None = None,
+        precomputed_sha256: str | None = None,
     ) -> CloudUploadResponse:
         """
         统一文件上传接口
 
         Args:
-            file_content: 文件内容（字节）
+            file_content: 文件内容（字节），或可读的文件对象（按分块流式上传）
             filename: 文件名
             path: 云存储路径，如果为None则使用文件名
             content_type: 内容类型
+            precomputed_sha256: 调用方已计算的 SHA-256，写入对象元数据
 
         Returns:
             上传响应信息
@@ -64,14 +73,33 @@ class CloudService:
                 object_key = filename
 
             content_type = self._get_content_type(filename)
-
-            response = self.client.put_object(
-                Bucket=self.bucket,
-                Body=file_content,
-                Key=object_key,
-                ContentType=content_type,
-                ContentDisposition="inline"
-            )
+            extra_args = {}
+            if precomputed_sha256:
+                extra_args["Metadata"] = {"x-cos-meta-sha256": precomputed_sha256}
+
+            if isinstance(file_content, bytes):
+                response = await asyncio.to_thread(
+                    self.client.put_object,
+                    Bucket=self.bucket,
+                    Body=file_content,
+                    Key=object_key,
+                    ContentType=content_type,
+                    ContentDisposition="inline",
+                    **extra_args
+                )
+            else:
+                # 文件对象按分块上传，避免整个文件读入内存
+                response = await asyncio.to_thread(
+                    self.client.upload_file_from_buffer,
+                    Bucket=self.bucket,
+                    Key=object_key,
+                    Body=file_content,
+                    MaxBufferSize=STREAM_MAX_BUFFER_MB,
+                    PartSize=STREAM_PART_SIZE_MB,
+                    ContentType=content_type,
+                    ContentDisposition="inline",
+                    **extra_args
+                )
 
             logger.info("文件上传成功: %s, ETag: %s", object_key, response.get("ETag"))
             return CloudUploadResponse(
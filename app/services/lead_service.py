@@ -3,10 +3,16 @@
 
 提供线索相关的业务逻辑处理
 """
+import base64
 import json
-from typing import Optional, Sequence
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
 
-from sqlalchemy import select, and_, or_, text, func
+from pydantic import TypeAdapter
+
+from sqlalchemy import select, and_, or_, text, func, literal, tuple_
+from sqlalchemy.dialects.mysql import match
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.event_bus import ProductionEventBus
@@ -24,6 +30,26 @@ from app.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# MySQL ngram 全文解析器的分词长度（ngram_token_size 默认值）
+SEARCH_NGRAM_TOKEN_SIZE = 2
+
+# 线索列表校验器，整页交给 pydantic-core 一次完成
+_LEAD_LIST_ADAPTER = TypeAdapter(List[LeadResponse])
+
+
+def _encode_cursor(created_at: datetime, lead_id: int) -> str:
+    """将 (created_at, id) 编码为分页游标"""
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{lead_id}".encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """解析分页游标，格式错误时抛出 ValueError"""
+    try:
+        created_at, lead_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(lead_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"无效的分页游标: {cursor}") from e
+
 
 class LeadService(BaseService):
     """线索服务类"""
@@ -35,9 +61,18 @@ class LeadService(BaseService):
     async def initialize(self) -> bool:
         return True
 
-    async def get_lead_by_id(self, lead_id: int) -> Optional[Lead]:
+    @asynccontextmanager
+    async def _use_session(self, db_session: Optional[AsyncSession]) -> AsyncIterator[AsyncSession]:
+        """优先使用调用方传入的请求级会话，未传入时自行创建"""
+        if db_session is not None:
+            yield db_session
+            return
+        async with self.database.get_session() as session:
+            yield session
+
+    async def get_lead_by_id(self, lead_id: int, db_session: Optional[AsyncSession] = None) -> Optional[Lead]:
         """根据ID获取线索"""
-        async with self.database.get_session() as db_session:
+        async with self._use_session(db_session) as db_session:
             try:
                 result = await db_session.execute(
                     select(Lead).where(Lead.id == lead_id)
@@ -48,10 +83,10 @@ class LeadService(BaseService):
                 return None
 
     async def get_leads_with_pagination(
-        self, query_params: LeadQueryParams
+        self, query_params: LeadQueryParams, db_session: Optional[AsyncSession] = None
     ) -> LeadListResponse:
         """分页获取线索列表"""
-        async with self.database.get_session() as db_session:
+        async with self._use_session(db_session) as db_session:
             try:
                 # 构建查询条件
                 conditions = []
@@ -150,64 +185,99 @@ class LeadService(BaseService):
 
                 # 搜索关键词
                 if query_params.search:
-                    search_conditions = or_(
-                        Lead.customer_name.like(f"%{query_params.search}%"),
-                        Lead.customer_phone.like(f"%{query_params.search}%"),
-                        Lead.customer_wechat_name.like(f"%{query_params.search}%"),
-                        Lead.customer_wechat_number.like(f"%{query_params.search}%"),
-                    )
+                    keyword = query_params.search.replace('"', "").strip()
+                    if len(keyword) >= SEARCH_NGRAM_TOKEN_SIZE:
+                        # 走 ft_leads_customer_search 全文索引（ngram 分词），短语匹配等价于子串搜索
+                        search_conditions = match(
+                            Lead.customer_name,
+                            Lead.customer_phone,
+                            Lead.customer_wechat_name,
+                            Lead.customer_wechat_number,
+                            against=f'"{keyword}"',
+                        ).in_boolean_mode()
+                    else:
+                        # 短于 ngram 分词长度的关键词无法命中全文索引，退回 LIKE
+                        search_conditions = or_(
+                            Lead.customer_name.like(f"%{query_params.search}%"),
+                            Lead.customer_phone.like(f"%{query_params.search}%"),
+                            Lead.customer_wechat_name.like(f"%{query_params.search}%"),
+                            Lead.customer_wechat_number.like(f"%{query_params.search}%"),
+                        )
                     conditions.append(search_conditions)
 
+                # 获取总数（键集分页可通过 with_total=false 跳过 COUNT）
+                total: Optional[int] = None
+                pages: Optional[int] = None
+                if query_params.with_total:
+                    count_query = select(func.count()).select_from(Lead) # pylint: disable=not-callable
+                    if conditions:
+                        count_query = count_query.where(and_(*conditions))
+
+                    total_result = await db_session.execute(count_query)
+                    scalar_value = total_result.scalar()
+                    total = scalar_value if scalar_value is not None else 0
+                    # 计算总页数
+                    pages = (total + query_params.size - 1) // query_params.size
+
+                descending = query_params.sort_order != "asc"
+                if query_params.cursor:
+                    # 键集分页：从游标位置继续，按 (created_at, id) 排序，无需扫描跳过的行
+                    cursor_created_at, cursor_id = _decode_cursor(query_params.cursor)
+                    cursor_key = tuple_(Lead.created_at, Lead.id)
+                    cursor_value = tuple_(literal(cursor_created_at), literal(cursor_id))
+                    conditions.append(cursor_key < cursor_value if descending else cursor_key > cursor_value)
+                    sort_field = Lead.created_at
+                else:
+                    # 动态排序
+                    try:
+                        sort_field = getattr(Lead, query_params.sort_field)
+                    except AttributeError:
+                        sort_field = Lead.created_at
+
                 # 构建查询
                 query = select(Lead)
                 if conditions:
                     query = query.where(and_(*conditions))
 
-                # 获取总数
-                count_query = select(func.count()).select_from(Lead) # pylint: disable=not-callable
-                if conditions:
-                    count_query = count_query.where(and_(*conditions))
-
-                total_result = await db_session.execute(count_query)
-                scalar_value = total_result.scalar()
-                total: int = scalar_value if scalar_value is not None else 0
-
-                # 分页查询
-                offset = (query_params.page - 1) * query_params.size
-                query = query.offset(offset).limit(query_params.size)
-
-                # 动态排序
-                try:
-                    sort_field = getattr(Lead, query_params.sort_field)
-                except AttributeError:
-                    sort_field = Lead.created_at
-
-                if query_params.sort_order == "asc":
-                    query = query.order_by(sort_field.asc())
+                # 以 id 作为次级排序，保证分页顺序稳定
+                if descending:
+                    query = query.order_by(sort_field.desc(), Lead.id.desc())
                 else:
-                    query = query.order_by(sort_field.desc())
+                    query = query.order_by(sort_field.asc(), Lead.id.asc())
+
+                # 多取一条用于判断是否还有下一页
+                if not query_params.cursor:
+                    query = query.offset((query_params.page - 1) * query_params.size)
+                query = query.limit(query_params.size + 1)
 
                 result = await db_session.execute(query)
                 leads: Sequence[Lead] = result.scalars().all()
 
-                # 计算总页数
-                pages = (total + query_params.size - 1) // query_params.size
+                has_more = len(leads) > query_params.size
+                leads = leads[:query_params.size]
+
+                # 仅按创建时间排序时游标才有意义
+                next_cursor = None
+                if has_more and sort_field is Lead.created_at:
+                    next_cursor = _encode_cursor(leads[-1].created_at, leads[-1].id)
 
                 return LeadListResponse(
-                    items=[LeadResponse.model_validate(lead) for lead in leads],
+                    items=_LEAD_LIST_ADAPTER.validate_python(leads, from_attributes=True),
                     total=total,
                     page=query_params.page,
                     size=query_params.size,
                     pages=pages,
+                    has_more=has_more,
+                    next_cursor=next_cursor,
                 )
 
             except Exception as e:  # pylint: disable=broad-except
                 logger.error("分页获取线索列表失败: %s", e)
                 raise
 
-    async def create_lead(self, lead_data: LeadCreate) -> Lead:
+    async def create_lead(self, lead_data: LeadCreate, db_session: Optional[AsyncSession] = None) -> Lead:
         """创建线索"""
-        async with self.database.get_session() as db_session:
+        async with self._use_session(db_session) as db_session:
             try:
                 lead = Lead(**lead_data.model_dump())
                 db_session.add(lead)
@@ -221,9 +291,9 @@ class LeadService(BaseService):
                 logger.error("创建线索失败: %s", e)
                 raise
 
-    async def update_lead(self, lead_id: int, lead_data: LeadUpdate) -> Optional[Lead]:
+    async def update_lead(self, lead_id: int, lead_data: LeadUpdate, db_session: Optional[AsyncSession] = None) -> Optional[Lead]:
         """更新线索"""
-        async with self.database.get_session() as db_session:
+        async with self._use_session(db_session) as db_session:
             try:
                 lead = await self._get_lead_by_id_with_session(db_session, lead_id)
                 if not lead:
@@ -244,9 +314,9 @@ class LeadService(BaseService):
                 logger.error("更新线索失败: %s", e)
                 raise
 
-    async def delete_lead(self, lead_id: int) -> bool:
+    async def delete_lead(self, lead_id: int, db_session: Optional[AsyncSession] = None) -> bool:
         """删除线索"""
-        async with self.database.get_session() as db_session:
+        async with self._use_session(db_session) as db_session:
             try:
                 lead = await self._get_lead_by_id_with_session(db_session, lead_id)
                 if not lead:
@@ -263,10 +333,10 @@ class LeadService(BaseService):
                 raise
 
     async def get_leads_by_advisor(
-        self, advisor_id: int, limit: int = 10
+        self, advisor_id: int, limit: int = 10, db_session: Optional[AsyncSession] = None
     ) -> Sequence[Lead]:
         """根据顾问ID获取线索列表"""
-        async with self.database.get_session() as db_session:
+        async with self._use_session(db_session) as db_session:
             try:
                 result = await db_session.execute(
                     select(Lead)
@@ -280,10 +350,10 @@ class LeadService(BaseService):
                 return []
 
     async def get_leads_by_category(
-        self, category_id: int, limit: int = 10
+        self, category_id: int, limit: int = 10, db_session: Optional[AsyncSession] = None
     ) -> Sequence[Lead]:
         """根据分类ID获取线索列表"""
-        async with self.database.get_session() as db_session:
+        async with self._use_session(db_session) as db_session:
             try:
                 result = await db_session.execute(
                     select(Lead)
@@ -305,7 +375,7 @@ class LeadService(BaseService):
 
     async def get_status_mapping(self) -> list:
         """获取状态映射配置"""
-        async with self.database.get_session() as db_session:
+        async with self.database.get_readonly_session() as db_session:
             try:
                 # 先检查视图是否存在，如果不存在则返回空列表
                 check_view_query = text("""
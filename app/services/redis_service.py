@@ -21,6 +21,7 @@ class RedisService(BaseService):
     DEVICE_INFO_KEY = "device_info"
     CALL_RECORD_PREFIX = "call_record:"
     LOCK_PREFIX = "lock:"
+    CACHE_PREFIX = "cache:"
     CONFIG_INPUT_AUDIO_KEY = "config_input_audio"
 
     def __init__(self, event_bus: ProductionEventBus):
@@ -250,6 +251,38 @@ class RedisService(BaseService):
                 except Exception as e:  # pylint: disable=broad-except
                     logger.error("❌ Unexpected error releasing multi-lock: %s", e)
 
+    # ==================== 查询结果缓存 ====================
+
+    async def get_cache(self, key: str) -> Optional[str]:
+        """读取查询结果缓存，Redis 不可用时视为未命中"""
+        if not self._initialized or not self.redis_client:
+            return None
+        try:
+            return await self.redis_client.get(f"{self.CACHE_PREFIX}{key}")
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning("Failed to read cache %s: %s", key, e)
+            return None
+
+    async def set_cache(self, key: str, value: str | bytes, ttl: int) -> None:
+        """写入查询结果缓存（SETEX），Redis 不可用时忽略"""
+        if not self._initialized or not self.redis_client:
+            return
+        try:
+            await self.redis_client.setex(f"{self.CACHE_PREFIX}{key}", ttl, value)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning("Failed to write cache %s: %s", key, e)
+
+    async def delete_cache_pattern(self, pattern: str) -> None:
+        """按通配符删除查询结果缓存（SCAN + UNLINK），Redis 不可用时忽略"""
+        if not self._initialized or not self.redis_client:
+            return
+        try:
+            keys = [key async for key in self.redis_client.scan_iter(match=f"{self.CACHE_PREFIX}{pattern}", count=500)]
+            if keys:
+                await self.redis_client.unlink(*keys)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning("Failed to delete cache %s: %s", pattern, e)
+
     async def get_call_record(
         self, call_id: str, lock: bool = True
     ) -> Optional[CallRecord]:
@@ -4,8 +4,9 @@
 提供定时任务和任务执行日志相关的业务逻辑处理
 """
 
-from typing import Optional, List
-from sqlalchemy import select
+import asyncio
+from typing import Any, Dict, Optional, List, Tuple
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.event_bus import ProductionEventBus
@@ -21,6 +22,15 @@ from app.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 执行日志批量写入：攒满条数或等待超时后合并为一条多行 INSERT
+TASK_LOG_BATCH_SIZE = 500
+TASK_LOG_FLUSH_INTERVAL = 0.1
+# 队列上限，写入跟不上时调用方在入队处等待
+TASK_LOG_QUEUE_MAXSIZE = TASK_LOG_BATCH_SIZE * 4
+
+# 待写入的执行日志及其等待方（直接写入时为 None）
+PendingTaskLog = Tuple[Dict[str, Any], Optional["asyncio.Future[None]"]]
+
 
 class ScheduledTasksService(BaseService):
     """定时任务服务类"""
@@ -28,13 +38,37 @@ class ScheduledTasksService(BaseService):
     def __init__(self, event_bus: ProductionEventBus, database: Database):
         super().__init__(event_bus=event_bus, service_name="ScheduledTasksService")
         self.database = database
+        # 队列中的 None 为停止哨兵
+        self._log_queue: "asyncio.Queue[Optional[PendingTaskLog]]" = asyncio.Queue(maxsize=TASK_LOG_QUEUE_MAXSIZE)
+        self._log_flusher: Optional[asyncio.Task] = None
 
     async def initialize(self) -> bool:
+        self._log_flusher = asyncio.create_task(self._flush_task_execution_logs())
         return True
 
+    async def shutdown(self):
+        """停止批量写入任务，并写入队列中剩余的执行日志"""
+        if self._log_flusher:
+            # 哨兵排在已入队的日志之后，批量写入任务写完之前的批次（含正在写入的一批）后自行退出；
+            # 队列满时批量写入任务仍在消费，put 会等到有空位
+            flusher, self._log_flusher = self._log_flusher, None
+            await self._log_queue.put(None)
+            await flusher
+
+        # 哨兵之后入队的日志（写入期间可能还有等待入队的调用方，直到队列取空）
+        while not self._log_queue.empty():
+            remaining = []
+            while not self._log_queue.empty():
+                item = self._log_queue.get_nowait()
+                if item is not None:
+                    remaining.append(item)
+            if remaining:
+                await self._write_task_execution_logs(remaining)
+        await super().shutdown()
+
     async def get_all_scheduled_tasks(self) -> List[ScheduledTaskResponse]:
         """获取所有定时任务配置"""
-        async with self.database.get_session() as db_session:
+        async with self.database.get_readonly_session() as db_session:
             try:
                 result = await db_session.execute(select(ScheduledTasks))
                 tasks = result.scalars().all()
@@ -54,7 +88,7 @@ class ScheduledTasksService(BaseService):
         self, task_id: int
     ) -> Optional[ScheduledTaskResponse]:
         """根据ID获取定时任务"""
-        async with self.database.get_session() as db_session:
+        async with self.database.get_readonly_session() as db_session:
             try:
                 result = await db_session.execute(
                     select(ScheduledTasks).where(ScheduledTasks.id == task_id)
@@ -69,52 +103,102 @@ class ScheduledTasksService(BaseService):
                 logger.error("获取定时任务失败: %s", str(e))
                 raise
 
-    async def create_task_execution_log(
-        self, log_data: TaskExecutionLogCreate
-    ) -> TaskExecutionLogResponse:
-        """创建任务执行日志"""
-        async with self.database.get_session() as db_session:
-            try:
-                # 验证任务是否存在
-                task = await self._get_task_by_id_with_session(
-                    db_session, log_data.task_id
-                )
-                if not task:
-                    raise ValueError(f"任务ID {log_data.task_id} 不存在")
-
-                # 创建执行日志
-                execution_log = TaskExecutionLogs(
-                    task_id=log_data.task_id,
-                    advisor_id=log_data.advisor_id,
-                    execution_time=log_data.execution_time,
-                    status=log_data.status,
-                    error_message=log_data.error_message,
-                    execution_duration=log_data.execution_duration,
-                )
-
-                db_session.add(execution_log)
-                await db_session.commit()
-                await db_session.refresh(execution_log)
-
-                log_response = TaskExecutionLogResponse.model_validate(execution_log)
+    async def create_task_execution_log(self, log_data: TaskExecutionLogCreate) -> None:
+        """
+        创建任务执行日志
+
+        日志进入批量写入队列，与同一时间窗口内的其他日志合并为一条多行 INSERT，
+        等待所在批次提交后返回。队列已满时在入队处等待，对调用方形成背压。
+
+        Raises:
+            ValueError: 任务不存在
+        """
+        if self._log_flusher is None:
+            # 批量写入任务未运行（未初始化或已关闭），直接单独写入
+            await self._write_task_execution_logs([(log_data.model_dump(), None)])
+            return
+
+        written = asyncio.get_running_loop().create_future()
+        await self._log_queue.put((log_data.model_dump(), written))
+        await written
+        logger.info(
+            "成功创建任务执行日志: task_id=%s, status=%s",
+            log_data.task_id,
+            log_data.status,
+        )
 
-                logger.info(
-                    "成功创建任务执行日志: task_id=%s, status=%s",
-                    log_data.task_id,
-                    log_data.status,
+    async def _flush_task_execution_logs(self):
+        """后台任务：从队列中攒批并写入执行日志，取到停止哨兵时写完当前批次后退出"""
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._log_queue.get()
+            if item is None:
+                return
+            batch = [item]
+            stopping = False
+            deadline = loop.time() + TASK_LOG_FLUSH_INTERVAL
+            while len(batch) < TASK_LOG_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._log_queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            await self._write_task_execution_logs(batch)
+            if stopping:
+                return
+
+    async def _write_task_execution_logs(self, batch: List[PendingTaskLog]):
+        """
+        一次多行 INSERT 写入一批执行日志，并把结果通知各条日志的等待方
+
+        任务不存在的日志不写入，其等待方收到 ValueError；写入失败时整批收到该异常。
+        """
+        failures: Dict[int, BaseException] = {}
+        try:
+            async with self.database.get_session() as db_session:
+                task_ids = {row["task_id"] for row, _ in batch}
+                result = await db_session.execute(
+                    select(ScheduledTasks.id).where(ScheduledTasks.id.in_(task_ids))
                 )
-                return log_response
-
-            except Exception as e:
-                await db_session.rollback()
-                logger.error("创建任务执行日志失败: %s", str(e))
-                raise
+                existing_ids = set(result.scalars().all())
+
+                rows = []
+                for index, (row, _) in enumerate(batch):
+                    if row["task_id"] in existing_ids:
+                        rows.append(row)
+                    else:
+                        failures[index] = ValueError(f"任务ID {row['task_id']} 不存在")
+                if rows:
+                    await db_session.execute(insert(TaskExecutionLogs), rows)
+                    await db_session.commit()
+                    logger.debug("批量写入任务执行日志 %s 条", len(rows))
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error("批量写入任务执行日志失败: %s 条, 错误: %s", len(batch), e)
+            failures = dict.fromkeys(range(len(batch)), e)
+
+        # 没有等待方的日志（直接写入路径）由调用方自行处理异常
+        for index, (_, written) in enumerate(batch):
+            error = failures.get(index)
+            if written is None:
+                if error is not None:
+                    raise error
+            elif not written.done():
+                if error is None:
+                    written.set_result(None)
+                else:
+                    written.set_exception(error)
 
     async def get_task_execution_logs_by_task_id(
         self, task_id: int, limit: int = 50
     ) -> List[TaskExecutionLogResponse]:
         """根据任务ID获取执行日志列表"""
-        async with self.database.get_session() as db_session:
+        async with self.database.get_readonly_session() as db_session:
             try:
                 result = await db_session.execute(
                     select(TaskExecutionLogs)
@@ -143,7 +227,7 @@ class ScheduledTasksService(BaseService):
         self, advisor_id: int, limit: int = 50
     ) -> List[TaskExecutionLogResponse]:
         """根据顾问ID获取执行日志列表"""
-        async with self.database.get_session() as db_session:
+        async with self.database.get_readonly_session() as db_session:
             try:
                 result = await db_session.execute(
                     select(TaskExecutionLogs)
@@ -172,7 +256,7 @@ class ScheduledTasksService(BaseService):
         self, limit: int = 100
     ) -> List[TaskExecutionLogResponse]:
         """获取所有任务执行日志"""
-        async with self.database.get_session() as db_session:
+        async with self.database.get_readonly_session() as db_session:
             try:
                 result = await db_session.execute(
                     select(TaskExecutionLogs)
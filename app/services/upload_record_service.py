@@ -1,7 +1,11 @@
 """
 文件服务类 - 处理实际的文件上传逻辑
 """
+import asyncio
+import os
+import shutil
 from pathlib import Path
+from typing import BinaryIO
 from app.core.config import settings
 from app.core.logger import get_logger
 from app.schemas.base import BaseResponse
@@ -13,6 +17,28 @@ from app.models.events import EventType, Event
 logger = get_logger(__name__)
 
 
+def _save_to_path(src: BinaryIO, file_path: Path) -> None:
+    """将上传的临时文件保存到本地路径，优先使用 os.sendfile 在内核态完成拷贝"""
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    src.seek(0)
+    with open(file_path, "wb") as dst:
+        try:
+            src_fd = src.fileno()
+            offset = 0
+            size = os.fstat(src_fd).st_size
+            while offset < size:
+                sent = os.sendfile(dst.fileno(), src_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except (AttributeError, OSError):
+            # 不支持 sendfile 的平台或文件对象，退回用户态分块拷贝
+            src.seek(0)
+            dst.seek(0)
+            dst.truncate()
+            shutil.copyfileobj(src, dst)
+
+
 class FileService(BaseService):
     """文件服务类 - 处理实际的文件上传逻辑"""
 
@@ -35,18 +61,12 @@ class FileService(BaseService):
                 raise TypeError("event.data 不是 FileUploadRequest 类型")
             request_data: FileUploadRequest = event.data
 
-            # 确保上传目录存在
-            upload_dir = Path(settings.upload_dir)
-            upload_dir.mkdir(parents=True, exist_ok=True)  # 使用 pathlib 的 mkdir 方法
-
             # 生成文件名
             filename = f"{request_data.file_uuid}.mp3"
 
-            # 构建文件路径并写入文件
-            file_path = upload_dir / filename
-            file_content = await request_data.file.read()
-            with open(file_path, "wb") as buffer:
-                buffer.write(file_content)
+            # 构建文件路径并写入文件（目录创建与拷贝均在线程中执行，不阻塞事件循环）
+            file_path = Path(settings.upload_dir) / filename
+            await asyncio.to_thread(_save_to_path, request_data.file.file, file_path)
 
             # 返回响应
             file_url = f"/uploads/{filename}"
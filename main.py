@@ -5,17 +5,25 @@
 这是一个基于 FastAPI 的文件上传系统，支持文件上传和下载功能。
 提供了完整的生命周期管理、健康检查和静态文件服务。
 """
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 import uvicorn
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from app.core.config import settings
 from app.api.v1.api import api_router
+from app.api.v1.endpoints.ai_advisor_stats import refresh_today_merged_stats
 from app.core.dependencies import service_container, check_services_health
+from app.core.logger import get_logger
+from app.middleware.db_session import DBSessionMiddleware
 from app.middleware.logging import logging_middleware
+from app.middleware.readiness import ReadinessMiddleware
+from app.middleware.timing import timing_middleware
 from app.schemas.base import ResponseBuilder
 
+logger = get_logger(__name__)
+
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
     """应用生命周期管理"""
@@ -26,6 +34,9 @@ async def lifespan(_app: FastAPI):
         await service_container.initialize()
         print("✅ All services initialized")
 
+        # 启动当日统计预计算任务
+        today_stats_task = asyncio.create_task(refresh_today_merged_stats())
+
     except Exception as e:
         print(f"❌ Startup failed: {e}")
         await service_container.shutdown()
@@ -35,6 +46,9 @@ async def lifespan(_app: FastAPI):
 
     # 关闭阶段
     print("🛑 Shutting down application")
+    today_stats_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await today_stats_task
     await service_container.shutdown()
     print("👋 Application shutdown completed")
 
@@ -45,8 +59,18 @@ app = FastAPI(
     description="文件上传系统，支持文件上传和下载",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+# 注册请求级数据库会话中间件（最内层，同一请求复用一个只读会话）
+app.add_middleware(DBSessionMiddleware)
+
+# 注册服务就绪检查中间件（未就绪时在路由前返回 503）
+app.add_middleware(ReadinessMiddleware)
+
+# 注册分段耗时统计中间件
+app.middleware("http")(timing_middleware)
+
 # 注册请求/响应日志中间件
 app.middleware("http")(logging_middleware)
 
@@ -73,17 +97,18 @@ async def http_exception_handler(_request: Request, exc: HTTPException):
         message=exc.detail,
         code=exc.status_code
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=response_data.model_dump()
     )
 
 
 @app.exception_handler(Exception)
-async def general_exception_handler(_request: Request, exc: Exception):
+async def general_exception_handler(request: Request, exc: Exception):
     """通用异常处理器 - 统一使用ResponseBuilder格式"""
+    logger.error("请求处理失败: %s %s", request.method, request.url.path, exc_info=exc)
     response_data = ResponseBuilder.internal_error(f"服务器内部错误: {str(exc)}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content=response_data.model_dump()
     )
@@ -0,0 +1,32 @@
+-- 顾问通话时长统计：每日次数与时长分段计数由 BIGINT 改为 INT UNSIGNED（时长类字段仍为 BIGINT）
+ALTER TABLE advisor_call_duration_stats
+    MODIFY COLUMN total_calls INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '总呼叫记录数',
+    MODIFY COLUMN total_connected INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '总接通数目',
+    MODIFY COLUMN total_unconnected INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '未接通总数',
+    MODIFY COLUMN outbound_calls INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '总呼出记录',
+    MODIFY COLUMN outbound_connected INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼出接通数目',
+    MODIFY COLUMN outbound_unconnected INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼出未接通数',
+    MODIFY COLUMN inbound_calls INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '总呼入记录',
+    MODIFY COLUMN inbound_connected INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼入接通数目',
+    MODIFY COLUMN inbound_unconnected INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼入未接通数',
+    MODIFY COLUMN duration_under_5s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '通话时长<5秒总数',
+    MODIFY COLUMN duration_5s_to_10s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '通话时长5-10秒总数',
+    MODIFY COLUMN duration_10s_to_20s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '通话时长10-20秒总数',
+    MODIFY COLUMN duration_20s_to_30s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '通话时长20-30秒总数',
+    MODIFY COLUMN duration_30s_to_45s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '通话时长30-45秒总数',
+    MODIFY COLUMN duration_45s_to_60s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '通话时长45-60秒总数',
+    MODIFY COLUMN duration_over_60s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '通话时长大于60秒总数',
+    MODIFY COLUMN outbound_duration_under_5s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼出通话时长<5秒',
+    MODIFY COLUMN outbound_duration_5s_to_10s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼出通话时长5-10秒',
+    MODIFY COLUMN outbound_duration_10s_to_20s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼出通话时长10-20秒',
+    MODIFY COLUMN outbound_duration_20s_to_30s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼出通话时长20-30秒',
+    MODIFY COLUMN outbound_duration_30s_to_45s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼出通话时长30-45秒',
+    MODIFY COLUMN outbound_duration_45s_to_60s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼出通话时长45-60秒',
+    MODIFY COLUMN outbound_duration_over_60s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼出通话时长大于60秒',
+    MODIFY COLUMN inbound_duration_under_5s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼入通话时长<5秒',
+    MODIFY COLUMN inbound_duration_5s_to_10s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼入通话时长5-10秒',
+    MODIFY COLUMN inbound_duration_10s_to_20s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼入通话时长10-20秒',
+    MODIFY COLUMN inbound_duration_20s_to_30s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼入通话时长20-30秒',
+    MODIFY COLUMN inbound_duration_30s_to_45s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼入通话时长30-45秒',
+    MODIFY COLUMN inbound_duration_45s_to_60s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼入通话时长45-60秒',
+    MODIFY COLUMN inbound_duration_over_60s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼入通话时长大于60秒';
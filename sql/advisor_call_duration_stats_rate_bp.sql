@@ -0,0 +1,15 @@
+-- 顾问通话时长统计：接通率由 DECIMAL(5,2) 百分比改为 SMALLINT 基点（1/100 个百分点，0-10000）
+ALTER TABLE advisor_call_duration_stats
+    ADD COLUMN connection_rate_bp SMALLINT NOT NULL DEFAULT 0 COMMENT '接通率(基点, 1/100%)' AFTER connection_rate,
+    ADD COLUMN outbound_connection_rate_bp SMALLINT NOT NULL DEFAULT 0 COMMENT '呼出接通率(基点, 1/100%)' AFTER outbound_connection_rate,
+    ADD COLUMN inbound_connection_rate_bp SMALLINT NOT NULL DEFAULT 0 COMMENT '呼入接通率(基点, 1/100%)' AFTER inbound_connection_rate;
+
+UPDATE advisor_call_duration_stats
+SET connection_rate_bp = ROUND(connection_rate * 100),
+    outbound_connection_rate_bp = ROUND(outbound_connection_rate * 100),
+    inbound_connection_rate_bp = ROUND(inbound_connection_rate * 100);
+
+ALTER TABLE advisor_call_duration_stats
+    DROP COLUMN connection_rate,
+    DROP COLUMN outbound_connection_rate,
+    DROP COLUMN inbound_connection_rate;
@@ -0,0 +1,8 @@
+-- 通话记录：对话内容由 TEXT 改为 MEDIUMBLOB，按 MySQL COMPRESS() 格式压缩存储
+-- 应用侧 CompressedText 读写同一格式，可用 UNCOMPRESS(conversation_content) 直接查看
+ALTER TABLE call_records
+    MODIFY COLUMN conversation_content MEDIUMBLOB COMMENT '对话记录（COMPRESS 格式压缩存储）：包含对话内容、关键信息提取、客户需求等';
+
+UPDATE call_records
+SET conversation_content = COMPRESS(conversation_content)
+WHERE conversation_content IS NOT NULL;
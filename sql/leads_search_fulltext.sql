@@ -0,0 +1,8 @@
+-- =====================================================
+-- 线索搜索全文索引（已有库升级用）
+-- 线索列表的关键词搜索改为 MATCH ... AGAINST，依赖此索引；
+-- 新建库已包含在 sql_lead.sql 中，无需重复执行
+-- =====================================================
+
+ALTER TABLE leads
+    ADD FULLTEXT INDEX ft_leads_customer_search (customer_name, customer_phone, customer_wechat_name, customer_wechat_number) WITH PARSER ngram;
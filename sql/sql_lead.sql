@@ -271,6 +271,8 @@ CREATE TABLE leads (
     INDEX idx_phone (customer_phone),
     INDEX idx_created_category (created_at, category_id),
     INDEX idx_status_combination (call_status_id, wechat_status_id, schedule_status_id),
+    -- 线索搜索全文索引（ngram 分词支持中文与号码子串）
+    FULLTEXT INDEX ft_leads_customer_search (customer_name, customer_phone, customer_wechat_name, customer_wechat_number) WITH PARSER ngram,
 
     -- 外键约束
     FOREIGN KEY (category_id) REFERENCES lead_categories(id) ON DELETE SET NULL,
@@ -336,7 +338,7 @@ CREATE TABLE call_records (
     advisor_id SMALLINT COMMENT '通话顾问ID',
     advisor_group_id TINYINT COMMENT '所属顾问组ID',
     advisor_group_sub_id TINYINT COMMENT '所属顾问组子ID',
-    conversation_content TEXT COMMENT '对话记录：包含对话内容、关键信息提取、客户需求等',
+    conversation_content MEDIUMBLOB COMMENT '对话记录（COMPRESS 格式压缩存储）：包含对话内容、关键信息提取、客户需求等',
     call_summary LONGTEXT COMMENT '通话总结：顾问填写的通话要点和后续跟进计划',
     call_quality_score TINYINT COMMENT '通话质量评分：1-100分，用于质检评估',
     quality_notes TEXT COMMENT '质检备注：质检人员的评价和建议',
@@ -586,53 +588,53 @@ CREATE TABLE advisor_call_duration_stats (
     device_id VARCHAR(50) NOT NULL COMMENT '设备ID',
     
     -- 总体统计
-    total_calls BIGINT NOT NULL DEFAULT 0 COMMENT '总呼叫记录数',
-    total_connected BIGINT NOT NULL DEFAULT 0 COMMENT '总接通数目',
-    total_unconnected BIGINT NOT NULL DEFAULT 0 COMMENT '未接通总数',
+    total_calls INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '总呼叫记录数',
+    total_connected INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '总接通数目',
+    total_unconnected INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '未接通总数',
     total_duration BIGINT NOT NULL DEFAULT 0 COMMENT '总通话时长(秒)',
     total_duration_correction BIGINT NOT NULL DEFAULT 0 COMMENT '总通话时长修正值(秒)',
-    connection_rate DECIMAL(5,2) NOT NULL DEFAULT 0.00 COMMENT '接通率(%)',
+    connection_rate_bp SMALLINT NOT NULL DEFAULT 0 COMMENT '接通率(基点, 1/100%)',
     
     -- 呼出统计
-    outbound_calls BIGINT NOT NULL DEFAULT 0 COMMENT '总呼出记录',
-    outbound_connected BIGINT NOT NULL DEFAULT 0 COMMENT '呼出接通数目',
-    outbound_unconnected BIGINT NOT NULL DEFAULT 0 COMMENT '呼出未接通数',
+    outbound_calls INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '总呼出记录',
+    outbound_connected INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼出接通数目',
+    outbound_unconnected INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼出未接通数',
     outbound_duration BIGINT NOT NULL DEFAULT 0 COMMENT '呼出总通话时长(秒)',
-    outbound_connection_rate DECIMAL(5,2) NOT NULL DEFAULT 0.00 COMMENT '呼出接通率(%)',
+    outbound_connection_rate_bp SMALLINT NOT NULL DEFAULT 0 COMMENT '呼出接通率(基点, 1/100%)',
     
     -- 呼入统计
-    inbound_calls BIGINT NOT NULL DEFAULT 0 COMMENT '总呼入记录',
-    inbound_connected BIGINT NOT NULL DEFAULT 0 COMMENT '呼入接通数目',
-    inbound_unconnected BIGINT NOT NULL DEFAULT 0 COMMENT '呼入未接通数',
+    inbound_calls INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '总呼入记录',
+    inbound_connected INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼入接通数目',
+    inbound_unconnected INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼入未接通数',
     inbound_duration BIGINT NOT NULL DEFAULT 0 COMMENT '呼入总通话时长(秒)',
-    inbound_connection_rate DECIMAL(5,2) NOT NULL DEFAULT 0.00 COMMENT '呼入接通率(%)',
+    inbound_connection_rate_bp SMALLINT NOT NULL DEFAULT 0 COMMENT '呼入接通率(基点, 1/100%)',
     
     -- 通话时长分段统计(总体) - 修正字段名匹配API
-    duration_under_5s BIGINT NOT NULL DEFAULT 0 COMMENT '通话时长<5秒总数',
-    duration_5s_to_10s BIGINT NOT NULL DEFAULT 0 COMMENT '通话时长5-10秒总数',
-    duration_10s_to_20s BIGINT NOT NULL DEFAULT 0 COMMENT '通话时长10-20秒总数',
-    duration_20s_to_30s BIGINT NOT NULL DEFAULT 0 COMMENT '通话时长20-30秒总数',
-    duration_30s_to_45s BIGINT NOT NULL DEFAULT 0 COMMENT '通话时长30-45秒总数',
-    duration_45s_to_60s BIGINT NOT NULL DEFAULT 0 COMMENT '通话时长45-60秒总数',
-    duration_over_60s BIGINT NOT NULL DEFAULT 0 COMMENT '通话时长大于60秒总数',
+    duration_under_5s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '通话时长<5秒总数',
+    duration_5s_to_10s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '通话时长5-10秒总数',
+    duration_10s_to_20s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '通话时长10-20秒总数',
+    duration_20s_to_30s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '通话时长20-30秒总数',
+    duration_30s_to_45s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '通话时长30-45秒总数',
+    duration_45s_to_60s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '通话时长45-60秒总数',
+    duration_over_60s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '通话时长大于60秒总数',
     
     -- 呼出通话时长分段统计 - 修正字段名匹配API
-    outbound_duration_under_5s BIGINT NOT NULL DEFAULT 0 COMMENT '呼出通话时长<5秒',
-    outbound_duration_5s_to_10s BIGINT NOT NULL DEFAULT 0 COMMENT '呼出通话时长5-10秒',
-    outbound_duration_10s_to_20s BIGINT NOT NULL DEFAULT 0 COMMENT '呼出通话时长10-20秒',
-    outbound_duration_20s_to_30s BIGINT NOT NULL DEFAULT 0 COMMENT '呼出通话时长20-30秒',
-    outbound_duration_30s_to_45s BIGINT NOT NULL DEFAULT 0 COMMENT '呼出通话时长30-45秒',
-    outbound_duration_45s_to_60s BIGINT NOT NULL DEFAULT 0 COMMENT '呼出通话时长45-60秒',
-    outbound_duration_over_60s BIGINT NOT NULL DEFAULT 0 COMMENT '呼出通话时长大于60秒',
+    outbound_duration_under_5s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼出通话时长<5秒',
+    outbound_duration_5s_to_10s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼出通话时长5-10秒',
+    outbound_duration_10s_to_20s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼出通话时长10-20秒',
+    outbound_duration_20s_to_30s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼出通话时长20-30秒',
+    outbound_duration_30s_to_45s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼出通话时长30-45秒',
+    outbound_duration_45s_to_60s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼出通话时长45-60秒',
+    outbound_duration_over_60s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼出通话时长大于60秒',
     
     -- 呼入通话时长分段统计 - 修正字段名匹配API
-    inbound_duration_under_5s BIGINT NOT NULL DEFAULT 0 COMMENT '呼入通话时长<5秒',
-    inbound_duration_5s_to_10s BIGINT NOT NULL DEFAULT 0 COMMENT '呼入通话时长5-10秒',
-    inbound_duration_10s_to_20s BIGINT NOT NULL DEFAULT 0 COMMENT '呼入通话时长10-20秒',
-    inbound_duration_20s_to_30s BIGINT NOT NULL DEFAULT 0 COMMENT '呼入通话时长20-30秒',
-    inbound_duration_30s_to_45s BIGINT NOT NULL DEFAULT 0 COMMENT '呼入通话时长30-45秒',
-    inbound_duration_45s_to_60s BIGINT NOT NULL DEFAULT 0 COMMENT '呼入通话时长45-60秒',
-    inbound_duration_over_60s BIGINT NOT NULL DEFAULT 0 COMMENT '呼入通话时长大于60秒',
+    inbound_duration_under_5s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼入通话时长<5秒',
+    inbound_duration_5s_to_10s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼入通话时长5-10秒',
+    inbound_duration_10s_to_20s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼入通话时长10-20秒',
+    inbound_duration_20s_to_30s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼入通话时长20-30秒',
+    inbound_duration_30s_to_45s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼入通话时长30-45秒',
+    inbound_duration_45s_to_60s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼入通话时长45-60秒',
+    inbound_duration_over_60s INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '呼入通话时长大于60秒',
     
     -- 指标相关字段
     goal BIGINT NOT NULL DEFAULT 7200 COMMENT '今日指标',
@@ -650,9 +652,9 @@ CREATE TABLE advisor_call_duration_stats (
 -- 插入顾问通话时长统计数据
 INSERT INTO advisor_call_duration_stats (
     advisor_id, advisor_name, stats_date, device_id,
-    total_calls, total_connected, total_unconnected, total_duration, total_duration_correction, connection_rate,
-    outbound_calls, outbound_connected, outbound_unconnected, outbound_duration, outbound_connection_rate,
-    inbound_calls, inbound_connected, inbound_unconnected, inbound_duration, inbound_connection_rate,
+    total_calls, total_connected, total_unconnected, total_duration, total_duration_correction, connection_rate_bp,
+    outbound_calls, outbound_connected, outbound_unconnected, outbound_duration, outbound_connection_rate_bp,
+    inbound_calls, inbound_connected, inbound_unconnected, inbound_duration, inbound_connection_rate_bp,
     duration_under_5s, duration_5s_to_10s, duration_10s_to_20s, duration_20s_to_30s, 
     duration_30s_to_45s, duration_45s_to_60s, duration_over_60s,
     outbound_duration_under_5s, outbound_duration_5s_to_10s, outbound_duration_10s_to_20s, 
@@ -664,11 +666,11 @@ INSERT INTO advisor_call_duration_stats (
 (
     1001, '张小明', '2025-09-25', 'ebt-5b343ab5',
     -- 总体统计
-    150, 120, 30, 7200, 0, 80.00,
+    150, 120, 30, 7200, 0, 8000,
     -- 呼出统计  
-    90, 75, 15, 4500, 83.33,
+    90, 75, 15, 4500, 8333,
     -- 呼入统计
-    60, 45, 15, 2700, 75.00,
+    60, 45, 15, 2700, 7500,
     -- 总体时长分段
     10, 15, 25, 20, 30, 15, 5,
     -- 呼出时长分段
@@ -680,11 +682,11 @@ INSERT INTO advisor_call_duration_stats (
 (
     1002, '李小红', '2025-09-25', '8002',
     -- 总体统计
-    200, 180, 20, 10800, 0, 90.00,
+    200, 180, 20, 10800, 0, 9000,
     -- 呼出统计
-    120, 110, 10, 6600, 91.67,
+    120, 110, 10, 6600, 9167,
     -- 呼入统计
-    80, 70, 10, 4200, 87.50,
+    80, 70, 10, 4200, 8750,
     -- 总体时长分段
     8, 12, 30, 35, 45, 35, 15,
     -- 呼出时长分段
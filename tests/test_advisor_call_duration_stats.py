@@ -0,0 +1,174 @@
+"""顾问通话时长统计模型：比率字段按基点存储"""
+
+from datetime import date
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import Session
+
+from app.models.advisor_call_duration_stats import (
+    RATE_FIELDS,
+    UPSERT_BATCH_SIZE,
+    AdvisorCallDurationStats,
+    percent_to_bp,
+)
+from app.schemas.advisor_call_duration_stats import (
+    AdvisorCallDurationStatsResponse,
+    AdvisorCallDurationStatsUpdateRequestWithDeviceIdAndStatsDate,
+)
+
+
+def _session() -> Session:
+    engine = create_engine("sqlite://")
+    AdvisorCallDurationStats.__table__.create(engine)
+    return Session(engine)
+
+
+def _stats(**kwargs) -> AdvisorCallDurationStats:
+    # SQLite 下 BIGINT 主键不会自增，显式指定
+    return AdvisorCallDurationStats(id=1, advisor_id=1, advisor_name="顾问", stats_date=date(2025, 1, 1), device_id="dev-1", **kwargs)
+
+
+def test_percent_to_bp():
+    assert percent_to_bp(None) == 0
+    assert percent_to_bp(0) == 0
+    assert percent_to_bp(12.34) == 1234
+    assert percent_to_bp(100) == 10000
+
+
+def test_insert_without_rates():
+    with _session() as session:
+        session.add(_stats(total_calls=3))
+        session.commit()
+
+        stats = session.scalars(select(AdvisorCallDurationStats)).one()
+        assert stats.connection_rate_bp == 0
+        assert stats.connection_rate == 0
+        assert stats.outbound_connection_rate == 0
+        assert stats.inbound_connection_rate == 0
+
+
+def test_upsert_without_rates_reads_back():
+    """与 AiboxService 的插入/更新路径一致：请求未带比率时，读回的记录仍能通过响应 Schema 校验"""
+    request = AdvisorCallDurationStatsUpdateRequestWithDeviceIdAndStatsDate(
+        stats_date=date(2025, 1, 1),
+        device_id="dev-1",
+        total_calls=3,
+        total_connected=1,
+        total_unconnected=2,
+        total_duration=60,
+        outbound_calls=3,
+        outbound_connected=1,
+        outbound_unconnected=2,
+        outbound_duration=60,
+        inbound_calls=0,
+        inbound_connected=0,
+        inbound_unconnected=0,
+        inbound_duration=0,
+    )
+    stats_dict = request.model_dump(exclude_unset=True)
+    # 请求未带比率时，model_dump() 中的比率为 None
+    stats_dict.update(dict.fromkeys(RATE_FIELDS), id=1, advisor_id=1, advisor_name="顾问", total_duration_correction=0)
+
+    with _session() as session:
+        session.add(AdvisorCallDurationStats(**stats_dict))
+        session.commit()
+
+        stats = session.scalars(select(AdvisorCallDurationStats)).one()
+        response = AdvisorCallDurationStatsResponse.model_validate(stats)
+        assert response.connection_rate == 0
+        assert response.outbound_connection_rate == 0
+        assert response.inbound_connection_rate == 0
+
+        # 更新路径：未设置的比率不出现在 exclude_unset 结果中，显式传 None 时按 0 存储
+        update = AdvisorCallDurationStatsUpdateRequestWithDeviceIdAndStatsDate(
+            stats_date=date(2025, 1, 1), device_id="dev-1", connection_rate=None, total_connected=2
+        )
+        for field, value in update.model_dump(exclude_unset=True).items():
+            setattr(stats, field, value)
+        session.commit()
+
+        response = AdvisorCallDurationStatsResponse.model_validate(session.get(AdvisorCallDurationStats, 1))
+        assert response.connection_rate == 0
+        assert response.total_connected == 2
+
+
+def test_rates_round_trip_as_percent():
+    with _session() as session:
+        session.add(_stats(connection_rate=66.67, outbound_connection_rate=50.0, inbound_connection_rate=100.0))
+        session.commit()
+
+        stats = session.scalars(select(AdvisorCallDurationStats)).one()
+        assert stats.connection_rate_bp == 6667
+        assert stats.connection_rate == 66.67
+        assert stats.outbound_connection_rate == 50.0
+        assert stats.inbound_connection_rate == 100.0
+
+
+class RecordingSession:
+    """只记录语句的假异步会话"""
+
+    def __init__(self) -> None:
+        self.statements: list = []
+
+    async def execute(self, statement) -> None:
+        self.statements.append(statement.compile(dialect=mysql.dialect()))
+
+
+def _upsert_row(advisor_id: int = 1) -> dict:
+    return {
+        "advisor_id": advisor_id,
+        "advisor_name": "顾问",
+        "device_id": "dev-1",
+        "stats_date": date(2025, 1, 1),
+        "total_calls": 3,
+        "total_duration": 60,
+        "connection_rate": 12.34,
+        "outbound_connection_rate": None,
+    }
+
+
+async def test_bulk_upsert_update_columns_and_rates():
+    session = RecordingSession()
+    rows = [_upsert_row()]
+    await AdvisorCallDurationStats.bulk_upsert(session, rows)
+
+    (statement,) = session.statements
+    sql = str(statement)
+    updates = sql.split("ON DUPLICATE KEY UPDATE", 1)[1]
+    assignments = {part.split(" = ", 1)[0].strip(): part.split(" = ", 1)[1].strip() for part in updates.split(", ")}
+
+    # 唯一键不更新，更新时叠加已有的修正值，并刷新 updated_at
+    assert set(assignments) == {
+        "advisor_name",
+        "device_id",
+        "total_calls",
+        "total_duration",
+        "connection_rate_bp",
+        "outbound_connection_rate_bp",
+        "updated_at",
+    }
+    assert assignments["total_duration"] == (
+        "(VALUES(total_duration) + advisor_call_duration_stats.total_duration_correction)"
+    )
+    assert assignments["connection_rate_bp"] == "VALUES(connection_rate_bp)"
+
+    # 比率按基点写入，None 记为 0，不修改调用方的行
+    assert statement.params["connection_rate_bp_m0"] == 1234
+    assert statement.params["outbound_connection_rate_bp_m0"] == 0
+    assert "connection_rate" in rows[0]
+
+
+async def test_bulk_upsert_batches_rows():
+    session = RecordingSession()
+    await AdvisorCallDurationStats.bulk_upsert(session, [_upsert_row(i) for i in range(UPSERT_BATCH_SIZE + 1)])
+
+    assert len(session.statements) == 2
+    assert str(session.statements[1]).count("ON DUPLICATE KEY UPDATE") == 1
+    assert session.statements[1].params["advisor_id_m0"] == UPSERT_BATCH_SIZE
+
+
+async def test_bulk_upsert_empty_rows():
+    session = RecordingSession()
+    await AdvisorCallDurationStats.bulk_upsert(session, [])
+    assert not session.statements
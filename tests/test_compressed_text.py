@@ -0,0 +1,70 @@
+"""CompressedText：COMPRESS() 格式压缩存储，兼容迁移前的明文存量数据"""
+
+import zlib
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, select, text
+
+from app.db.types import CompressedText
+
+metadata = MetaData()
+records = Table(
+    "records",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("content", CompressedText),
+)
+
+TRANSCRIPT = "\n".join(f"顾问: 您好，请问是张先生吗？第 {i} 轮\n客户: 是的，我想了解一下课程安排。" for i in range(30))
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    return engine
+
+
+def _read(engine, record_id: int):
+    with engine.connect() as conn:
+        return conn.execute(select(records.c.content).where(records.c.id == record_id)).scalar_one()
+
+
+@pytest.mark.parametrize("value", [TRANSCRIPT, "短文本", "", None])
+def test_round_trip(engine, value):
+    with engine.begin() as conn:
+        conn.execute(records.insert(), {"id": 1, "content": value})
+
+    assert _read(engine, 1) == value
+
+
+def test_stored_in_compress_format(engine):
+    with engine.begin() as conn:
+        conn.execute(records.insert(), {"id": 1, "content": TRANSCRIPT})
+        stored = conn.execute(text("SELECT content FROM records WHERE id = 1")).scalar_one()
+
+    data = TRANSCRIPT.encode("utf-8")
+    assert int.from_bytes(stored[:4], "little") == len(data)
+    assert zlib.decompress(stored[4:]) == data
+    assert len(stored) < len(data)
+
+
+def test_reads_mysql_compress_trailing_dot(engine):
+    # MySQL COMPRESS() 在压缩数据以空格结尾时追加 '.'
+    data = TRANSCRIPT.encode("utf-8")
+    stored = len(data).to_bytes(4, "little") + zlib.compress(data) + b"."
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO records (id, content) VALUES (1, :content)"), {"content": stored})
+
+    assert _read(engine, 1) == TRANSCRIPT
+
+
+@pytest.mark.parametrize("legacy", [TRANSCRIPT, "ok", "顾问: 好的"])
+def test_reads_legacy_uncompressed_rows(engine, legacy):
+    with engine.begin() as conn:
+        # 迁移前以明文写入的存量数据，分别以二进制和文本形式存放
+        conn.execute(text("INSERT INTO records (id, content) VALUES (1, :content)"), {"content": legacy.encode("utf-8")})
+        conn.execute(text("INSERT INTO records (id, content) VALUES (2, :content)"), {"content": legacy})
+
+    assert _read(engine, 1) == legacy
+    assert _read(engine, 2) == legacy
@@ -0,0 +1,144 @@
+"""Database 会话管理：写会话相互独立，请求内只读会话共享"""
+
+import asyncio
+from contextlib import contextmanager
+
+import pytest
+
+from app.db.database import Database, RequestSessionScope, ctx_session
+
+
+class FakeSession:
+    """按会话记录未提交写入的假会话：commit 落库，rollback 丢弃"""
+
+    def __init__(self, store: list) -> None:
+        self.store = store
+        self.pending: list = []
+        self.active = False
+        self.closed = False
+        self.rollbacks = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def add(self, row) -> None:
+        self.active = True
+        self.pending.append(row)
+
+    def query(self) -> list:
+        self.active = True
+        return list(self.store)
+
+    def in_transaction(self) -> bool:
+        return self.active
+
+    async def commit(self) -> None:
+        self.store.extend(self.pending)
+        self.pending.clear()
+        self.active = False
+
+    async def rollback(self) -> None:
+        self.pending.clear()
+        self.active = False
+        self.rollbacks += 1
+
+    async def close(self) -> None:
+        await self.rollback()
+        self.closed = True
+
+
+@pytest.fixture
+def store() -> list:
+    return []
+
+
+@pytest.fixture
+def database(store: list) -> Database:
+    db = Database()
+    db.async_session_factory = lambda: FakeSession(store)
+    return db
+
+
+@contextmanager
+def request_scope():
+    """在当前任务内模拟 DBSessionMiddleware 设置的请求作用域"""
+    token = ctx_session.set(RequestSessionScope(asyncio.current_task()))
+    try:
+        yield
+    finally:
+        ctx_session.reset(token)
+
+
+async def test_nested_commit_then_rollback_keeps_earlier_write(database: Database, store: list):
+    with request_scope():
+        async with database.get_session() as outer:
+            outer.add("outer-committed")
+            await outer.commit()
+            outer.add("outer-pending")
+
+            with pytest.raises(ValueError):
+                async with database.get_session() as inner:
+                    assert inner is not outer
+                    inner.add("inner")
+                    await inner.commit()
+                    inner.add("inner-discarded")
+                    await inner.rollback()
+                    raise ValueError("inner failed")
+
+            # 内层的 rollback 不影响外层尚未提交的写入
+            assert outer.pending == ["outer-pending"]
+
+        assert store == ["outer-committed", "inner", "outer-pending"]
+
+
+async def test_failed_write_session_only_rolls_back_itself(database: Database, store: list):
+    with request_scope():
+        async with database.get_session() as first:
+            first.add("first")
+
+        with pytest.raises(RuntimeError):
+            async with database.get_session() as second:
+                second.add("second")
+                raise RuntimeError("second failed")
+
+        assert store == ["first"]
+
+
+async def test_readonly_sessions_shared_within_request(database: Database, store: list):
+    with request_scope():
+        async with database.get_readonly_session() as first:
+            assert first.query() == []
+        async with database.get_readonly_session() as second:
+            assert second is first
+
+        async with database.get_session() as writer:
+            assert writer is not first
+            writer.add("row")
+
+        # 写会话提交后结束共享只读事务，之后的查询可见新写入
+        assert not first.in_transaction()
+        async with database.get_readonly_session() as third:
+            assert third is first
+            assert third.query() == ["row"]
+
+
+async def test_readonly_sessions_not_shared_outside_request(database: Database):
+    async with database.get_readonly_session() as first:
+        pass
+    async with database.get_readonly_session() as second:
+        assert second is not first
+
+
+async def test_readonly_sessions_not_shared_with_child_tasks(database: Database):
+    with request_scope():
+        async with database.get_readonly_session() as parent:
+            pass
+
+        async def child():
+            async with database.get_readonly_session() as session:
+                return session
+
+        assert await asyncio.create_task(child()) is not parent
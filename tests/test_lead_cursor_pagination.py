@@ -0,0 +1,79 @@
+"""线索分页查询：按 (created_at, id) 的键集游标翻页"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.db.database import Database
+from app.models.lead import Lead
+from app.schemas.lead import LeadQueryParams
+from app.services.lead_service import LeadService, _decode_cursor, _encode_cursor
+
+BASE_TIME = datetime(2025, 1, 1, 9, 0, 0)
+
+
+@pytest.fixture
+async def lead_service(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'leads.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Lead.__table__.create)
+        # 每两条线索创建时间相同，检验 id 作为次级排序键
+        await conn.execute(
+            Lead.__table__.insert(),
+            [
+                {"id": i, "category_id": 1, "created_at": BASE_TIME + timedelta(minutes=i // 2), "updated_at": BASE_TIME}
+                for i in range(1, 12)
+            ],
+        )
+
+    database = Database()
+    database.async_session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    yield LeadService(None, database)
+    await engine.dispose()
+
+
+async def _walk(lead_service: LeadService, **params) -> list:
+    """沿 next_cursor 翻完所有页，返回各页的 id 列表"""
+    pages = []
+    cursor = None
+    while True:
+        result = await lead_service.get_leads_with_pagination(
+            LeadQueryParams(size=3, with_total=False, cursor=cursor, **params)
+        )
+        pages.append([lead.id for lead in result.items])
+        assert result.total is None
+        if not result.has_more:
+            assert result.next_cursor is None
+            return pages
+        cursor = result.next_cursor
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2025, 1, 1, 9, 30, 15, 123456)
+    assert _decode_cursor(_encode_cursor(created_at, 42)) == (created_at, 42)
+
+    with pytest.raises(ValueError):
+        _decode_cursor("not-a-cursor")
+
+
+async def test_cursor_pages_descending(lead_service: LeadService):
+    pages = await _walk(lead_service)
+
+    assert pages == [[11, 10, 9], [8, 7, 6], [5, 4, 3], [2, 1]]
+
+
+async def test_cursor_pages_ascending(lead_service: LeadService):
+    pages = await _walk(lead_service, sort_order="asc")
+
+    assert pages == [[1, 2, 3], [4, 5, 6], [7, 8, 9], [10, 11]]
+
+
+async def test_first_page_counts_total(lead_service: LeadService):
+    result = await lead_service.get_leads_with_pagination(LeadQueryParams(size=3))
+
+    assert [lead.id for lead in result.items] == [11, 10, 9]
+    assert result.total == 11
+    assert result.pages == 4
+    assert result.has_more
+    assert _decode_cursor(result.next_cursor) == (BASE_TIME + timedelta(minutes=4), 9)
@@ -0,0 +1,122 @@
+"""优先级环形队列：出队顺序、容量、等待唤醒与关闭，以及按权重选择与提权"""
+
+import asyncio
+import random
+from collections import Counter
+
+import pytest
+
+from app.core import ring_queue
+from app.core.event_bus import EVENT_PRIORITY_WEIGHTS
+from app.core.ring_queue import PriorityRingQueue
+
+
+def _drain(queue: PriorityRingQueue) -> list:
+    items = []
+    while queue.qsize():
+        items.append(queue._pop(queue._select_level()))  # pylint: disable=protected-access
+    return items
+
+
+async def test_higher_level_first_and_fifo_within_level():
+    queue = PriorityRingQueue(levels=3, capacity=4)
+    queue.put_nowait("low-1", 0)
+    queue.put_nowait("high-1", 2)
+    queue.put_nowait("normal-1", 1)
+    queue.put_nowait("low-2", 0)
+    queue.put_nowait("high-2", 2)
+
+    assert queue.qsize() == 5
+    assert [await queue.get() for _ in range(5)] == ["high-1", "high-2", "normal-1", "low-1", "low-2"]
+    assert queue.qsize() == 0
+
+
+async def test_capacity_is_per_level_and_wraps_around():
+    # 容量 3 向上取整为长度 4 的缓冲区，反复入队出队后下标回绕
+    queue = PriorityRingQueue(levels=2, capacity=3)
+    assert queue.maxsize == 6
+
+    for round_ in range(5):
+        for i in range(3):
+            queue.put_nowait((round_, i), 0)
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait("overflow", 0)
+        # 其他优先级不受影响
+        queue.put_nowait("other", 1)
+        assert _drain(queue) == ["other", (round_, 0), (round_, 1), (round_, 2)]
+
+
+async def test_get_waits_for_put():
+    queue = PriorityRingQueue(levels=2, capacity=2)
+    getter = asyncio.create_task(queue.get())
+    await asyncio.sleep(0)
+    assert not getter.done()
+
+    queue.put_nowait("item", 0)
+    assert await asyncio.wait_for(getter, 1) == "item"
+
+
+async def test_put_waits_for_free_slot():
+    queue = PriorityRingQueue(levels=2, capacity=1)
+    queue.put_nowait("first", 1)
+    putter = asyncio.create_task(queue.put("second", 1))
+    await asyncio.sleep(0)
+    assert not putter.done()
+
+    assert await queue.get() == "first"
+    await asyncio.wait_for(putter, 1)
+    assert await queue.get() == "second"
+
+
+async def test_close_wakes_getters_and_open_resumes():
+    queue = PriorityRingQueue(levels=2, capacity=2)
+    getters = [asyncio.create_task(queue.get()) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    queue.close()
+    assert await asyncio.wait_for(asyncio.gather(*getters), 1) == [None, None]
+
+    queue.open()
+    queue.put_nowait("item", 0)
+    assert await queue.get() == "item"
+
+
+def test_weighted_selection_follows_weights(monkeypatch):
+    monkeypatch.setattr(ring_queue, "random", random.Random(0))
+    levels = len(EVENT_PRIORITY_WEIGHTS)
+    queue = PriorityRingQueue(levels=levels, capacity=1, weights=EVENT_PRIORITY_WEIGHTS)
+    for level in range(levels):
+        queue.put_nowait(level, level)
+
+    # 各优先级都非空时按权重选择，低优先级在持续高负载下也能出队
+    picks = Counter(queue._select_level() for _ in range(10000))  # pylint: disable=protected-access
+    for level, weight in enumerate(EVENT_PRIORITY_WEIGHTS):
+        assert picks[level] / 10000 == pytest.approx(weight, abs=0.02)
+
+
+def test_weighted_selection_falls_back_to_highest_non_empty(monkeypatch):
+    # 固定落在权重最大的最高优先级上，该优先级为空
+    monkeypatch.setattr(ring_queue.random, "random", lambda: 0.99)
+    queue = PriorityRingQueue(levels=4, capacity=4, weights=EVENT_PRIORITY_WEIGHTS)
+    queue.put_nowait("low", 0)
+    queue.put_nowait("normal", 1)
+
+    assert _drain(queue) == ["normal", "low"]
+
+
+def test_aged_low_priority_item_is_promoted(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(ring_queue.time, "monotonic", lambda: now[0])
+    queue = PriorityRingQueue(levels=3, capacity=4, aging_threshold=5.0)
+
+    queue.put_nowait("low", 0)
+    now[0] += 1
+    queue.put_nowait("high-1", 2)
+    queue.put_nowait("high-2", 2)
+
+    # 未超时时严格按优先级
+    assert queue._pop(queue._select_level()) == "high-1"  # pylint: disable=protected-access
+
+    # 低优先级队首等待超过阈值后先于高优先级出队
+    now[0] += 5
+    assert _drain(queue) == ["low", "high-2"]
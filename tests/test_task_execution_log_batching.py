@@ -0,0 +1,98 @@
+"""任务执行日志批量写入：并发创建合并为一条 INSERT，批次提交后返回"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.db.database import Database
+from app.models.scheduled_tasks import ScheduledTasks, TaskExecutionLogs
+from app.schemas.scheduled_tasks import TaskExecutionLogCreate
+from app.services.scheduled_tasks_service import ScheduledTasksService
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'tasks.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(ScheduledTasks.__table__.create)
+        await conn.run_sync(TaskExecutionLogs.__table__.create)
+        await conn.execute(ScheduledTasks.__table__.insert(), [{"id": 1, "task_name": "task", "task_type": "sync", "cron_expression": "* * * * *"}])
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def inserts(engine) -> list:
+    statements = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):  # pylint: disable=unused-argument
+        if statement.startswith("INSERT INTO task_execution_logs"):
+            statements.append(statement)
+
+    return statements
+
+
+@pytest.fixture
+async def service(engine):
+    database = Database()
+    database.async_session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    service = ScheduledTasksService(None, database)
+    await service.initialize()
+    yield service
+    await service.shutdown()
+
+
+async def _count_logs(service: ScheduledTasksService) -> int:
+    async with service.database.get_readonly_session() as session:
+        return await session.scalar(select(func.count()).select_from(TaskExecutionLogs))
+
+
+def _log(task_id: int = 1) -> TaskExecutionLogCreate:
+    return TaskExecutionLogCreate(task_id=task_id, status="success")
+
+
+async def test_concurrent_logs_written_in_one_batch(service: ScheduledTasksService, inserts: list):
+    await asyncio.gather(*(service.create_task_execution_log(_log()) for _ in range(20)))
+
+    # 返回时所在批次已经提交
+    assert await _count_logs(service) == 20
+    assert len(inserts) == 1
+
+
+async def test_missing_task_only_fails_its_own_log(service: ScheduledTasksService):
+    results = await asyncio.gather(
+        service.create_task_execution_log(_log()),
+        service.create_task_execution_log(_log(task_id=99)),
+        return_exceptions=True,
+    )
+
+    assert results[0] is None
+    assert isinstance(results[1], ValueError)
+    assert await _count_logs(service) == 1
+
+
+async def test_full_queue_applies_backpressure(service: ScheduledTasksService):
+    # 暂停批量写入任务，队列填满后新的调用在入队处等待
+    service._log_flusher.cancel()  # pylint: disable=protected-access
+    service._log_queue = asyncio.Queue(maxsize=2)  # pylint: disable=protected-access
+
+    waiting = [asyncio.create_task(service.create_task_execution_log(_log())) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert service._log_queue.full()  # pylint: disable=protected-access
+
+    # 重新启动批量写入任务后，所有调用方都完成写入
+    service._log_flusher = asyncio.create_task(service._flush_task_execution_logs())  # pylint: disable=protected-access
+    await asyncio.gather(*waiting)
+    assert await _count_logs(service) == 3
+
+
+async def test_shutdown_writes_directly(service: ScheduledTasksService):
+    await service.shutdown()
+
+    await service.create_task_execution_log(_log())
+    with pytest.raises(ValueError):
+        await service.create_task_execution_log(_log(task_id=99))
+    assert await _count_logs(service) == 1